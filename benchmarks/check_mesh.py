@@ -0,0 +1,195 @@
+"""Check `foamio.foam.check_mesh` against a face-by-face transcription of
+OpenFOAM's `primitiveMeshTools::faceSkewness`/`boundaryFaceSkewness` and, in a
+sourced OpenFOAM environment, against `checkMesh` output on a generated
+hex-mesh with perturbed points.
+
+    python benchmarks/check_mesh.py --ncells 20 --perturbation 0.2
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from foamio.foam import check_mesh, read_mesh
+
+ROOT_VSMALL = 1e-150
+
+
+def _header(name: str, cls: str, note: str = "") -> str:
+    note = f'    note "{note}";\n' if note else ""
+    return (
+        "FoamFile\n{\n    format ascii;\n"
+        f"    class {cls};\n{note}    location \"constant/polyMesh\";\n"
+        f"    object {name};\n}}\n\n"
+    )
+
+
+def _generate(root: Path, n: int, perturbation: float) -> None:
+    """Unit box of n^3 hex cells, internal points moved randomly by up to
+    `perturbation` of the cell size, faces in upper-triangular order.
+    """
+
+    def point(i: int, j: int, k: int) -> int:
+        return i + (n + 1) * (j + (n + 1) * k)
+
+    def cell(i: int, j: int, k: int) -> int:
+        return i + n * (j + n * k)
+
+    def face(axis: int, i: int, j: int, k: int) -> list[int]:
+        """Face on the plane `axis` at (i, j, k), normal in +axis."""
+
+        quad = {
+            0: ((0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)),
+            1: ((0, 0, 0), (0, 0, 1), (1, 0, 1), (1, 0, 0)),
+            2: ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)),
+        }[axis]
+        return [point(i + a, j + b, k + c) for a, b, c in quad]
+
+    grid = np.stack(
+        np.meshgrid(*[np.linspace(0, 1, n + 1)] * 3, indexing="ij"), axis=-1
+    ).transpose(2, 1, 0, 3)
+    inner = (slice(1, -1),) * 3
+    rng = np.random.default_rng(0)
+    grid[inner] += perturbation / n * rng.uniform(-1, 1, grid[inner].shape)
+    points = grid.reshape(-1, 3)
+
+    faces, owner, neighbour = [], [], []
+    for k in range(n):
+        for j in range(n):
+            for i in range(n):
+                for axis, (a, b, c) in enumerate(((1, 0, 0), (0, 1, 0), (0, 0, 1))):
+                    if (i + a, j + b, k + c)[axis] < n:
+                        faces.append(face(axis, i + a, j + b, k + c))
+                        owner.append(cell(i, j, k))
+                        neighbour.append(cell(i + a, j + b, k + c))
+    for axis in range(3):
+        for side in (0, n):
+            for u in range(n):
+                for v in range(n):
+                    ijk = [u, v]
+                    ijk.insert(axis, side)
+                    f = face(axis, *ijk)
+                    faces.append(f if side else f[::-1])
+                    ijk[axis] = min(side, n - 1)
+                    owner.append(cell(*ijk))
+
+    mesh = root / "constant" / "polyMesh"
+    mesh.mkdir(parents=True)
+    note = f"nPoints:{len(points)} nCells:{n**3} nFaces:{len(faces)}"
+    with open(mesh / "points", "w", encoding="utf-8") as f:
+        f.write(_header("points", "vectorField") + f"{len(points)}\n(\n")
+        f.writelines(f"({x:.17g} {y:.17g} {z:.17g})\n" for x, y, z in points)
+        f.write(")\n")
+    with open(mesh / "faces", "w", encoding="utf-8") as f:
+        f.write(_header("faces", "faceList") + f"{len(faces)}\n(\n")
+        f.writelines(f"4({' '.join(map(str, labels))})\n" for labels in faces)
+        f.write(")\n")
+    for name, values in (("owner", owner), ("neighbour", neighbour)):
+        with open(mesh / name, "w", encoding="utf-8") as f:
+            f.write(_header(name, "labelList", note) + f"{len(values)}\n(\n")
+            f.write("\n".join(map(str, values)) + "\n)\n")
+    with open(mesh / "boundary", "w", encoding="utf-8") as f:
+        f.write(_header("boundary", "polyBoundaryMesh"))
+        f.write(
+            "1\n(\n    walls\n    {\n        type wall;\n"
+            "        inGroups List<word> 1(wall);\n"
+            f"        nFaces {len(faces) - len(neighbour)};\n"
+            f"        startFace {len(neighbour)};\n    }}\n)\n"
+        )
+
+    (root / "system").mkdir()
+    with open(root / "system" / "controlDict", "w", encoding="utf-8") as f:
+        header = _header("controlDict", "dictionary")
+        f.write(header.replace("constant/polyMesh", "system"))
+        f.write(
+            "application none;\nstartFrom startTime;\nstartTime 0;\n"
+            "stopAt endTime;\nendTime 1;\ndeltaT 1;\n"
+            "writeControl timeStep;\nwriteInterval 1;\n"
+        )
+
+
+def _reference_skewness(root: Path, quality) -> np.ndarray:
+    """Skewness of faces transcribed loop-by-loop from OpenFOAM."""
+
+    mesh = read_mesh(root)
+    ninternal = len(mesh.neighbour)
+    skewness = np.empty(len(mesh.owner))
+    for facei, own in enumerate(mesh.owner):
+        fctr, farea = quality.face_centres[facei], quality.face_areas[facei]
+        own_cc = quality.cell_centres[own]
+        if facei < ninternal:
+            nei_cc = quality.cell_centres[mesh.neighbour[facei]]
+            cpf = fctr - own_cc
+            d = nei_cc - own_cc
+            factor = 0.2
+        else:
+            cpf = fctr - own_cc
+            normal = farea / (np.linalg.norm(farea) + ROOT_VSMALL)
+            d = normal * (normal @ cpf)
+            factor = 0.4
+        sv = cpf - ((farea @ cpf) / ((farea @ d) + ROOT_VSMALL)) * d
+        sv_hat = sv / (np.linalg.norm(sv) + ROOT_VSMALL)
+        fd = factor * np.linalg.norm(d) + ROOT_VSMALL
+        labels = mesh.face_labels[
+            mesh.face_offsets[facei] : mesh.face_offsets[facei + 1]
+        ]
+        for p in mesh.points[labels]:
+            fd = max(fd, abs(sv_hat @ (p - fctr)))
+        skewness[facei] = np.linalg.norm(sv) / fd
+    return skewness
+
+
+def _check_mesh_output(root: Path) -> dict[str, float]:
+    output = subprocess.run(
+        ["checkMesh", "-case", str(root)], capture_output=True, text=True, check=True
+    ).stdout
+    patterns = dict(
+        max_non_orthogonality=r"Mesh non-orthogonality Max:\s*(\S+)",
+        mean_non_orthogonality=(
+            r"Mesh non-orthogonality Max:\s*\S+\s*average:\s*(\S+)"
+        ),
+        max_skewness=r"Max skewness\s*=\s*(\S+)",
+    )
+    return {
+        key: float(match[1])
+        for key, pattern in patterns.items()
+        if (match := re.search(pattern, output))
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ncells", type=int, default=20)
+    parser.add_argument("--perturbation", type=float, default=0.2)
+    parser.add_argument("--rtol", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _generate(root, args.ncells, args.perturbation)
+
+        start = time.perf_counter()
+        quality = check_mesh(root)
+        print(f"check_mesh: {time.perf_counter() - start:.3f} s")
+        summary = quality.summary()
+
+        reference = _reference_skewness(root, quality)
+        np.testing.assert_allclose(quality.face_skewness, reference, rtol=1e-12)
+        print(f"max skewness {summary['max_skewness']:.6g} matches the reference")
+
+        if "WM_PROJECT_DIR" not in os.environ:
+            print("WM_PROJECT_DIR is not set, checkMesh comparison is skipped")
+            return
+        for key, expected in _check_mesh_output(root).items():
+            print(f"{key:>24}: {summary[key]:.6g} (checkMesh {expected:.6g})")
+            np.testing.assert_allclose(summary[key], expected, rtol=args.rtol)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare `foamio.dat.read` with the former `pd.read_csv` + `__unnest_columns`
+path on a generated forces-like .dat-file with vector columns.
+
+    python benchmarks/dat_read.py --nrows 1000000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from foamio.dat import read
+
+
+def _generate(fname: Path, nrows: int, nvectors: int = 2) -> None:
+    rng = np.random.default_rng(0)
+    names = "\t".join(f"F{i}" for i in range(nvectors))
+    with open(fname, "w", encoding="utf-8") as f:
+        f.write(f"# Forces\n# CofR : (0 0 0)\n#\n# Time\tp\t{names}\n")
+        for chunk in np.array_split(np.arange(nrows), max(nrows // 100_000, 1)):
+            values = rng.random((len(chunk), 1 + 3 * nvectors))
+            lines = (
+                pd.Series(chunk * 1e-3).astype(str) + "\t" + values[:, 0].astype(str)
+            )
+            for i in range(nvectors):
+                comps = values[:, 1 + 3 * i : 4 + 3 * i].astype(str)
+                lines += (
+                    "\t(" + comps[:, 0] + " " + comps[:, 1] + " " + comps[:, 2] + ")"
+                )
+            f.write("\n".join(lines) + "\n")
+
+
+def _legacy_read(filepath: Path) -> pd.DataFrame:
+    """`foamio.dat.read` as of v0.7.3 (string columns are checked with
+    `is_string_dtype` to unnest them with pandas>=3 as well)."""
+
+    with open(filepath, encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if not line.startswith("#"):
+                header_pos = index - 1
+                break
+
+    dat = pd.read_csv(filepath, sep="\t", header=header_pos, index_col=0)
+    dat.index.name = dat.index.name.replace("#", "").strip()
+    dat.columns = dat.columns.str.strip()
+
+    colnames: list[str] = list(dat)
+    nested_colnames = []
+    unnested: list[pd.DataFrame] = [dat]
+    for i, name in enumerate(dat.columns):
+        if not (
+            pd.api.types.is_string_dtype(dat[name].dtype)
+            and (col := dat[name].astype(str))
+            .str.contains(r"^\(|\)$", regex=True)
+            .any()
+        ):
+            continue
+
+        col = col.replace(r"^\(|\)$", "", regex=True).apply(lambda s: s.split())
+        ncomp = col.map(len).max()
+        colnames[i + 1 : i + 1] = [f"{name}.{i}" for i in range(ncomp)]
+        unnested.append(
+            pd.DataFrame(
+                col.to_list(), index=col.index, columns=colnames[i + 1 : i + 1 + ncomp]
+            )
+        )
+        nested_colnames.append(name)
+    dat = pd.concat(unnested, axis=1)[colnames].drop(columns=nested_colnames)
+
+    return (
+        dat.replace("N/A", pd.NA)
+        .apply(func=lambda col: pd.to_numeric(col, errors="coerce"))
+        .sort_index()
+    )
+
+
+def _measure(func, *args) -> tuple[pd.DataFrame, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nrows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = Path(tmp, "forces.dat")
+        _generate(fname, args.nrows)
+        print(f"{fname.stat().st_size / 2**20:.1f} MiB, {args.nrows} rows")
+
+        results = {}
+        for label, func in (("legacy", _legacy_read), ("foamio", read)):
+            runs = [_measure(func, fname) for _ in range(args.repeat)]
+            results[label] = runs[0][0]
+            print(
+                f"{label:>8}: {min(r[1] for r in runs):.3f} s,"
+                f" peak {max(r[2] for r in runs):.1f} MiB"
+            )
+
+        # The legacy path misplaces components of the second and following
+        # non-scalar columns, hence the column order is not compared
+        pd.testing.assert_frame_equal(
+            results["legacy"], results["foamio"], check_like=True
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare process count and latency of `foamio.foam.read` modes on generated
+dictionaries of growing size. The "expand" and "keywords" modes call
+`foamDictionary`, so they are measured in a sourced OpenFOAM environment only.
+
+    python benchmarks/foam_read.py --nentries 10 100 1000
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from foamio.foam import read
+
+
+def _generate(fname: Path, nentries: int, nsubentries: int = 10) -> None:
+    with open(fname, "w", encoding="utf-8") as f:
+        f.write("FoamFile\n{\n    format ascii;\n    class dictionary;\n}\n")
+        for i in range(nentries // nsubentries):
+            f.write(f"dict{i}\n{{\n")
+            for j in range(nsubentries):
+                f.write(f"    scheme{j} Gauss linear;\n    value{j} {i * j};\n")
+            f.write("}\n")
+
+
+def _measure(root: Path, fname: Path, mode: str) -> tuple[float, int]:
+    nprocesses = 0
+    run = subprocess.run
+
+    def _run(*args, **kwargs):
+        nonlocal nprocesses
+        nprocesses += 1
+        return run(*args, **kwargs)
+
+    subprocess.run = _run
+    try:
+        start = time.perf_counter()
+        read(root, fname, mode=mode)
+        return time.perf_counter() - start, nprocesses
+    finally:
+        subprocess.run = run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nentries", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    modes = ["parse"]
+    if "WM_PROJECT_DIR" in os.environ:
+        modes += ["expand", "keywords"]
+    else:
+        print("WM_PROJECT_DIR is not set, foamDictionary modes are skipped")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "system").mkdir()
+        for nentries in args.nentries:
+            fname = root / "system" / f"dict{nentries}"
+            _generate(fname, nentries)
+            for mode in modes:
+                elapsed, nprocesses = _measure(root, fname, mode)
+                print(
+                    f"{nentries:>6} entries, {mode:>8}: {elapsed:.3f} s,"
+                    f" {nprocesses} processes"
+                )
+
+
+if __name__ == "__main__":
+    main()
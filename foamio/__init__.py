@@ -1,4 +1,4 @@
-from foamio import _cli, dat, foam
+from foamio import _cli, dat, foam, log
 from foamio.__about__ import __version__
 
 __all__ = [
@@ -6,6 +6,7 @@ __all__ = [
     "_cli",
     "dat",
     "foam",
+    "log",
 ]
 
 try:
@@ -0,0 +1,104 @@
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from foamio.foam import check_mesh
+from foamio.foam._quality import CHUNK_SIZE, METRICS
+
+#: Limits of `--max` as `checkMesh` warns about them
+THRESHOLDS = dict(non_orthogonality=70.0, skewness=4.0, aspect_ratio=1000.0)
+
+
+def add_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "case",
+        metavar="DIR",
+        type=Path,
+        help="case (or constant/polyMesh directory) to check",
+    )
+    parser.add_argument(
+        "--region",
+        "-r",
+        type=str,
+        default=None,
+        help="mesh region",
+    )
+    parser.add_argument(
+        "--bins",
+        "-b",
+        type=int,
+        default=10,
+        help="number of histogram bins of each metric",
+    )
+    parser.add_argument(
+        "--worst",
+        "-w",
+        type=int,
+        default=5,
+        help="number of the worst cells to print for each metric",
+    )
+    parser.add_argument(
+        "--max",
+        metavar="METRIC=VALUE",
+        type=str,
+        nargs="*",
+        default=None,
+        help=f"""fail (exit code 1) if a metric exceeds its limit, e.g.
+                'non_orthogonality=65'; without values {THRESHOLDS} are used""",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help="number of face labels processed at once",
+    )
+
+
+def __validate(args: argparse.Namespace) -> None:
+    args.case = args.case.resolve()
+    if args.max is None:
+        return
+
+    limits = dict(THRESHOLDS) if not args.max else {}
+    for item in args.max:
+        metric, _, value = item.partition("=")
+        if metric not in THRESHOLDS or not value:
+            logging.fatal("%r is not METRIC=VALUE of %s - exiting…", item, THRESHOLDS)
+            raise SystemExit(1)
+        limits[metric] = float(value)
+    args.max = limits
+
+
+def check(args: argparse.Namespace) -> None:
+    __validate(args)
+
+    logging.info("checking mesh of %s", args.case)
+    quality = check_mesh(args.case, region=args.region, chunk_size=args.chunk_size)
+
+    summary = quality.summary()
+    for key, value in summary.items():
+        print(f"{key:<24}{value:g}")
+
+    for metric in METRICS:
+        counts, edges = quality.histogram(metric, args.bins)
+        print(f"\n{metric}")
+        for count, lhs, rhs in zip(counts, edges[:-1], edges[1:]):
+            print(f"  [{lhs:11.5g}, {rhs:11.5g}) {count}")
+        cells, values = quality.worst(metric, args.worst)
+        print(
+            "  worst cells: "
+            + ", ".join(f"{c} ({v:.5g})" for c, v in zip(cells, values))
+        )
+
+    failed = {
+        metric: limit
+        for metric, limit in (args.max or {}).items()
+        if np.any(getattr(quality, metric) > limit)
+    }
+    if summary["negative_volumes"]:
+        failed["volume"] = 0.0
+    if failed:
+        logging.error("mesh of %s exceeds limits %s", args.case, failed)
+        raise SystemExit(1)
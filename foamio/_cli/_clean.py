@@ -1,6 +1,7 @@
 import argparse
 import concurrent.futures
 import logging
+import os
 import re
 from pathlib import Path
 
@@ -48,6 +49,13 @@ def add_args(parser: argparse.ArgumentParser) -> None:
         help="""keep time-step folders based on START STOP INTERVAL range
                 (args to numpy.arange)""",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="number of threads searching top-level subdirectories",
+    )
 
 
 def __validate(args: argparse.Namespace) -> None:
@@ -64,16 +72,58 @@ def __validate(args: argparse.Namespace) -> None:
     # logging.debug("excluding list: %s", sorted(set(args.keep)))
 
 
+def __scan(path: str) -> tuple[list[Path], list[str]]:
+    """Time-step directories and the other directories of the path. Symbolic
+    links are skipped and entry types are taken from `scandir` (`d_type`)
+    without `stat` calls.
+    """
+
+    timesteps, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if re.fullmatch(NUMBER_PATTERN, entry.name):
+                    timesteps.append(Path(entry.path))
+                else:
+                    subdirs.append(entry.path)
+    except OSError as exception:
+        logging.warning("search in %s raised an exception=%r", path, exception)
+    return timesteps, subdirs
+
+
+def __walk(path: str) -> list[Path]:
+    """Time-step directories of the tree, they are not descended into."""
+
+    timesteps, stack = [], [path]
+    while stack:
+        found, subdirs = __scan(stack.pop())
+        timesteps += found
+        stack += subdirs
+    return timesteps
+
+
+def _timesteps(indir: Path, max_workers: int | None = None) -> list[Path]:
+    """Time-step directories of the tree, top-level subdirectories are
+    searched in parallel threads.
+    """
+
+    timesteps, subdirs = __scan(indir)
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as e:
+        for found in e.map(__walk, subdirs):
+            timesteps += found
+    return timesteps
+
+
 def clean(args: argparse.Namespace) -> None:
     __validate(args)
 
     logging.debug("searching time-steps in %s…", args.indir)
     timesteps: list[Path] = [
         d
-        for d in args.indir.rglob("*")
-        if d.is_dir()
-        and re.match(NUMBER_PATTERN, d.name)
-        and args.interval.is_in(time := float(d.name))
+        for d in _timesteps(args.indir, args.jobs)
+        if args.interval.is_in(time := float(d.name))
         and not np.any(np.isclose(time, args.keep))
     ]
 
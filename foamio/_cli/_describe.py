@@ -2,6 +2,7 @@ import argparse
 import logging
 from pathlib import Path
 
+from foamio._helpers import column
 from foamio.dat import read
 
 
@@ -21,9 +22,9 @@ def add_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--usecols",
         "-uc",
-        type=int,
+        type=column,
         nargs="+",
-        help="column indices to describe (1-based indexing)",
+        help="column indices (1-based indexing) or names to describe",
     )
     parser.add_argument(
         "--usenth",
@@ -32,13 +33,36 @@ def add_args(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="read every n-th row in .dat-file",
     )
+    parser.add_argument(
+        "--usedt",
+        "-ud",
+        type=float,
+        default=None,
+        help="read the first row of every time interval in .dat-file",
+    )
+
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        type=Path,
+        nargs="?",
+        const=True,
+        default=False,
+        help="read through columnar cache alongside .dat-files (or in DIR)",
+    )
 
     parser.add_argument(
         "--filter",
         "-f",
         type=str,
         default=None,
-        help="filter columns by regex pattern after reading",
+        help="filter columns by regex pattern while reading",
+    )
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        default=None,
+        help="type of float columns (e.g. 'float32'), integer ones are downcast",
     )
 
     parser.add_argument(
@@ -72,12 +96,15 @@ def describe(args: argparse.Namespace) -> None:
     __validate(args)
 
     logging.info("reading %s", args.loc)
-    df = read(args.loc, usecols=args.usecols, usenth=args.usenth)
-    if args.filter is not None:
-        df = df.filter(
-            regex=args.filter,
-            axis="columns",
-        )
+    df = read(
+        args.loc,
+        usecols=args.usecols,
+        regex=args.filter,
+        dtype=args.dtype,
+        usenth=args.usenth,
+        usedt=args.usedt,
+        cache=args.cache,
+    )
 
     stat = df.describe()
     stat.loc["last"] = df.iloc[-1]
@@ -0,0 +1,164 @@
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from foamio.foam import read_mesh
+from foamio.log import LogReader
+
+
+def add_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "log",
+        type=Path,
+        help="solver log (e.g. log.foamRun)",
+    )
+    parser.add_argument(
+        "--cells",
+        "-c",
+        type=int,
+        default=None,
+        help="number of cells (read from the mesh of the log's case if not set)",
+    )
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="byte offset to start from (printed by the previous call)",
+    )
+    parser.add_argument(
+        "--window",
+        "-w",
+        type=int,
+        default=100,
+        help="number of the last time steps of windowed metrics",
+    )
+    parser.add_argument(
+        "--follow",
+        "-f",
+        action="store_true",
+        help="follow the growing log, printing metrics of new time steps",
+    )
+    parser.add_argument(
+        "--interval",
+        "-i",
+        type=float,
+        default=10,
+        help="seconds between reads of the followed log",
+    )
+    parser.add_argument(
+        "--save",
+        "-s",
+        action="store_true",
+        help="save parsed time steps as .csv-file alongside the log",
+    )
+
+
+def __cells(case: Path) -> int | None:
+    """Number of cells of the case mesh, summed over processors if the case is
+    decomposed without the global mesh (`constant/` usually remains). It is
+    taken from the `nCells` note of owner headers, so the lists are not read.
+    """
+
+    try:
+        try:
+            return read_mesh(case, lazy=True).n_cells
+        except FileNotFoundError:
+            if not (case / "processor0").is_dir():
+                raise
+        meshes = read_mesh(case, decomposed=True, lazy=True)
+        return sum(mesh.n_cells for mesh in meshes)
+    except (OSError, ValueError, IndexError) as exception:
+        logging.info("number of cells of %s is unknown: %r", case, exception)
+        return None
+
+
+def __validate(args: argparse.Namespace) -> None:
+    args.log = args.log.resolve()
+    if args.cells is None:
+        args.cells = __cells(args.log.parent)
+
+
+def __metrics(dat: pd.DataFrame, cells: int | None, window: int) -> dict:
+    """Throughput metrics of time steps."""
+
+    step_time = dat["StepTime"].to_numpy() if "StepTime" in dat else np.array([])
+    step_time = step_time[np.isfinite(step_time)]
+    execution = dat["ExecutionTime"].to_numpy()
+    times = dat.index.to_numpy()
+
+    metrics = dict(
+        steps=len(dat),
+        time=times[-1],
+        execution_time=execution[-1],
+        s_per_step=np.mean(step_time) if len(step_time) else np.nan,
+        s_per_step_median=np.median(step_time) if len(step_time) else np.nan,
+        s_per_step_window=(np.mean(step_time[-window:]) if len(step_time) else np.nan),
+        clock_to_execution=dat["ClockTime"].iloc[-1] / max(execution[-1], 1e-9),
+    )
+    if len(dat) > 1 and execution[-1] > execution[0]:
+        metrics["sim_time_per_hour"] = (
+            3600 * (times[-1] - times[0]) / (execution[-1] - execution[0])
+        )
+    if cells is not None:
+        metrics["cells"] = cells
+        metrics["cell_updates_per_s"] = cells / metrics["s_per_step"]
+        metrics["cell_updates_per_s_window"] = cells / metrics["s_per_step_window"]
+    for column in dat.columns:
+        if column.endswith(":max") and column.startswith(("Co", "InterfaceCo")):
+            metrics[column] = dat[column].max()
+        elif column.endswith(":iterations"):
+            metrics[f"{column}_per_step"] = dat[column].mean()
+    return metrics
+
+
+def __print(metrics: dict) -> None:
+    for key, value in metrics.items():
+        print(f"{key:<32}{value:g}")
+
+
+def log(args: argparse.Namespace) -> None:
+    __validate(args)
+
+    reader = LogReader(args.log, offset=args.offset)
+    start = time.perf_counter()
+    dat = reader.read()
+    elapsed = time.perf_counter() - start
+    logging.info(
+        "parsed %d time steps (%.1f MB) of %s in %.3f s (%.1f MB/s)",
+        len(dat),
+        reader.nbytes / 1e6,
+        args.log,
+        elapsed,
+        reader.nbytes / 1e6 / max(elapsed, 1e-9),
+    )
+
+    if not dat.empty:
+        __print(__metrics(dat, args.cells, args.window))
+    else:
+        logging.warning("no complete time steps in %s", args.log)
+
+    try:
+        while args.follow:
+            time.sleep(args.interval)
+            new = reader.read()
+            if reader.rewound:
+                dat = new
+            elif not new.empty:
+                dat = pd.concat([dat, new])
+            if new.empty:
+                continue
+            print()
+            __print(__metrics(dat, args.cells, args.window))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logging.info("continue with --offset %d", reader.offset)
+
+    if args.save and not dat.empty:
+        fname = args.log.with_name(args.log.name + ".csv")
+        dat.to_csv(fname)
+        logging.info("saved to %s", fname)
@@ -3,7 +3,7 @@ import logging
 from sys import version_info
 
 from foamio.__about__ import __version__
-from foamio._cli import _clean, _describe, _plot, _serialise
+from foamio._cli import _check, _clean, _describe, _log, _plot, _serialise
 from foamio._common import LOGGING_FORMAT
 
 
@@ -41,6 +41,11 @@ def main(argv=None) -> argparse.Namespace:
     help_case = "OpenFOAM case (including postProcessing/ directory)"
     help_dat = "OpenFOAM functionObject (or directory with .dat-files)"
 
+    check = dict(aliases=["c"], help="Check mesh quality of OpenFOAM case")
+    parser = subparsers.add_parser("check", **check)
+    _check.add_args(parser)
+    parser.set_defaults(func=_check.check)
+
     clean = dict(aliases=["rm"], help=f"Clean {help_case}")
     parser = subparsers.add_parser("clean", **clean)
     _clean.add_args(parser)
@@ -51,6 +56,11 @@ def main(argv=None) -> argparse.Namespace:
     _describe.add_args(parser)
     parser.set_defaults(func=_describe.describe)
 
+    log = dict(aliases=["l"], help="Report solver performance of OpenFOAM log")
+    parser = subparsers.add_parser("log", **log)
+    _log.add_args(parser)
+    parser.set_defaults(func=_log.log)
+
     plot = dict(aliases=["p"], help=f"Plot {help_dat}")
     parser = subparsers.add_parser("plot", **plot)
     _plot.add_args(parser)
@@ -7,8 +7,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
-from foamio._helpers import Interval
-from foamio.dat import read
+from foamio._helpers import Interval, column
+from foamio.dat import DatReader, read
+from foamio.dat._dat import _merge
 
 
 def add_args(parser: argparse.ArgumentParser) -> None:
@@ -53,9 +54,9 @@ def add_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--usecols",
         "-uc",
-        type=int,
+        type=column,
         nargs="+",
-        help="column indices to plot (1-based indexing)",
+        help="column indices (1-based indexing) or names to plot",
     )
     parser.add_argument(
         "--usenth",
@@ -64,13 +65,47 @@ def add_args(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="read every n-th row in .dat-file",
     )
+    parser.add_argument(
+        "--usedt",
+        "-ud",
+        type=float,
+        default=None,
+        help="read the first row of every time interval in .dat-file",
+    )
+
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        type=Path,
+        nargs="?",
+        const=True,
+        default=False,
+        help="read through columnar cache alongside .dat-files (or in DIR)"
+        " in background mode",
+    )
+    parser.add_argument(
+        "--time-index",
+        metavar="DIR",
+        type=Path,
+        nargs="?",
+        const=True,
+        default=False,
+        help="persist the sparse time index of --index windows alongside"
+        " .dat-files (or in DIR) in background mode",
+    )
 
     parser.add_argument(
         "--filter",
         "-f",
         type=str,
         default=None,
-        help="filter columns by regex pattern after reading",
+        help="filter columns by regex pattern while reading",
+    )
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        default=None,
+        help="type of float columns (e.g. 'float32'), integer ones are downcast",
     )
     parser.add_argument(
         "--index",
@@ -122,20 +157,51 @@ def __get_titles(loc: Path) -> tuple[str, str]:
 def plot(args: argparse.Namespace) -> None:
     __validate(args)
 
+    if args.background:
+        dat = read(
+            args.loc,
+            usecols=args.usecols,
+            regex=args.filter,
+            dtype=args.dtype,
+            usenth=args.usenth,
+            usedt=args.usedt,
+            cache=args.cache,
+            time=args.index,
+            time_index=args.time_index,
+        )
+    else:
+        reader = DatReader(
+            args.loc,
+            usecols=args.usecols,
+            regex=args.filter,
+            dtype=args.dtype,
+            usenth=args.usenth,
+            usedt=args.usedt,
+        )
+        dat = reader.read()
+
     def __plot(ax, args) -> pd.DataFrame:
-        df = read(args.loc, usecols=args.usecols, usenth=args.usenth)
-        if args.filter is not None:
-            df = df.filter(regex=args.filter, axis="columns")
-        if args.index is not None:
-            df = df[df.index.map(args.index.is_in)]
+        df = dat
+        if args.index is not None and not args.background:  # read windowed
+            df = df[args.index.mask(df.index.to_numpy())]
         if args.range is not None:
-            df = df[df.map(args.range.is_in).all(axis="columns")]
+            df = df[args.range.mask(df.to_numpy()).all(axis=1)]
         df.plot(ax=ax, title=args.subtitle, logy=args.logscale, grid=True)
         return df
 
     def animate(frame: int = 0) -> None:
+        nonlocal dat
+
+        # Only rows appended since the previous frame are parsed, they
+        # override former rows from their first time on as restarts do
+        new = reader.read()
+        if reader.rewound or dat.empty:
+            dat = new
+        elif not new.empty:
+            dat = _merge([dat, new])
+
         ax.clear()
-        logging.debug("animate frame=%d", frame)
+        logging.debug("animate frame=%d (%d new rows)", frame, len(new))
         __plot(ax, args)
 
     fig = plt.figure(figsize=(10, 6))
@@ -28,6 +28,9 @@ class Interval:
     def is_in(self, value: float) -> bool:
         return self.lhs_less(self.lhs, value) and self.rhs_less(value, self.rhs)
 
+    def mask(self, values: np.ndarray) -> np.ndarray:
+        return self.lhs_less(self.lhs, values) & self.rhs_less(values, self.rhs)
+
 
 def _count_columns(filepath: Path | str, sep: str, line_no: int = 1) -> int:
     """Count columns in a data-file by counting separators in a line."""
@@ -36,6 +39,12 @@ def _count_columns(filepath: Path | str, sep: str, line_no: int = 1) -> int:
     return line.count(sep) + line.count("\n")
 
 
+def column(value: str) -> int | str:
+    """Column index (1-based) if the value is a number, its name otherwise."""
+
+    return int(value) if value.isdigit() else value
+
+
 def remove(tree: Path) -> None:
     if tree.is_file():
         tree.unlink()
@@ -1,3 +1,6 @@
-from foamio.dat._dat import read, write
+from foamio.dat._dat import iter_chunks, read
+from foamio.dat._probes import Probes, read_probes
+from foamio.dat._reader import DatReader
+from foamio.dat._writer import write
 
-__all__ = ["read", "write"]
+__all__ = ["DatReader", "Probes", "iter_chunks", "read", "read_probes", "write"]
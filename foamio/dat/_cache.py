@@ -0,0 +1,210 @@
+import dataclasses
+import hashlib
+import io
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from foamio.dat._parser import Layout, _layout, _parse, _Stream, _widen
+
+CACHE_SUFFIX = ".foamio"
+
+
+def _cachedir(filepath: Path, cache: bool | Path | str) -> Path:
+    """Cache directory of a .dat-file, i.e. `<name>.dat.foamio/` alongside or
+    `<cache>/<path hash>/` if the cache directory is specified.
+    """
+
+    if cache is True:
+        return filepath.with_name(filepath.name + CACHE_SUFFIX)
+
+    key = hashlib.sha1(str(filepath.resolve()).encode("utf-8")).hexdigest()
+    return Path(cache) / f"{filepath.name}.{key[:16]}"
+
+
+def __append(fname: Path, values: np.ndarray) -> None:
+    """Append values to a 1-dimensional .npy-file in place, the file is
+    rewritten only if the values have to be promoted or the header does not fit
+    its former size.
+    """
+
+    with open(fname, "r+b") as f:
+        if np.lib.format.read_magic(f) == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            size = f.tell()
+
+            header = io.BytesIO()
+            np.lib.format.write_array_header_1_0(
+                header,
+                dict(
+                    descr=np.lib.format.dtype_to_descr(dtype),
+                    fortran_order=fortran_order,
+                    shape=(shape[0] + len(values),),
+                ),
+            )
+            if values.dtype == dtype and header.tell() == size:
+                f.seek(0)
+                f.write(header.getvalue())
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(values).tobytes())
+                return
+
+    values = np.concatenate([np.load(fname), values])
+    __replace(fname, lambda f: np.save(f, values))
+
+
+def __replace(fname: Path, content) -> None:
+    """Write the file by replacing it, so memory maps of the former one stay
+    valid and an interrupted write leaves no partial file behind.
+    """
+
+    tmp = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            content(f)
+        os.replace(tmp, fname)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def __save(cachedir: Path, dat: pd.DataFrame, meta: dict, append: bool) -> None:
+    """Write the index and each column to its own .npy-file, so they can be
+    memory-mapped separately. The meta is removed before the columns are
+    touched and written last, so the cache is not valid in between.
+    """
+
+    (cachedir / "meta.json").unlink(missing_ok=True)
+
+    arrays = {"index": dat.index.to_numpy()} | {
+        str(i): dat.iloc[:, i].to_numpy() for i in range(dat.shape[1])
+    }
+    for key, values in arrays.items():
+        fname = cachedir / f"{key}.npy"
+        if not append:
+            __replace(fname, lambda f: np.save(f, values))
+        elif len(values):
+            __append(fname, values)
+
+    __replace(
+        cachedir / "meta.json", lambda f: f.write(json.dumps(meta).encode("utf-8"))
+    )
+
+
+def __load(cachedir: Path, layout: Layout, nrows: int) -> pd.DataFrame | None:
+    """Memory-map cached columns, None if any of them is missing or not of
+    `nrows` rows, e.g. the cache was written concurrently.
+    """
+
+    try:
+        index = np.load(cachedir / "index.npy", mmap_mode="r")
+        columns = {
+            name: np.load(cachedir / f"{i}.npy", mmap_mode="r")
+            for i, name in enumerate(layout.columns)
+        }
+    except (OSError, ValueError):
+        return None
+    if any(len(values) != nrows for values in [index, *columns.values()]):
+        return None
+
+    return pd.DataFrame(columns, index=pd.Index(index, name=layout.index), copy=False)
+
+
+def _cached(
+    filepath: Path, cache: bool | Path | str = True
+) -> tuple[pd.DataFrame, Layout]:
+    """Read .dat-file through the columnar cache. The cache is validated by the
+    file size and modification time, rows appended since the cache has been
+    written are parsed and appended to it. Only complete rows are cached.
+
+    Args:
+        filepath (Path): path to .dat-file.
+        cache (bool | Path | str, optional): cache directory, the cache is stored
+        alongside the .dat-file if True. Defaults to True.
+
+    Returns:
+        tuple[pd.DataFrame, Layout]: memory-mapped frame and its layout.
+    """
+
+    cachedir = _cachedir(filepath, cache)
+    stat = os.stat(filepath)
+
+    meta = None
+    if (cachedir / "meta.json").is_file():
+        with open(cachedir / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+
+    if meta is not None:
+        layout = Layout(
+            **{
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in meta["layout"].items()
+            }
+        )
+        cached = __load(cachedir, layout, meta["nrows"])
+        if (
+            cached is not None
+            and meta["size"] == stat.st_size
+            and meta["mtime"] == stat.st_mtime_ns
+        ):
+            logging.debug("%s is read from %s", filepath, cachedir)
+            return cached, layout
+
+        with open(filepath, "rb") as f:
+            header = f.read(layout.offset)
+        if not (
+            cached is not None
+            and meta["nrows"]
+            and meta["inode"] == stat.st_ino
+            and meta["offset"] <= stat.st_size
+            and header.decode("latin-1") == meta["header"]
+        ):
+            meta = None  # truncated, rotated, inconsistent or no layout yet
+        elif (widened := _widen(filepath, layout, meta["offset"])) != layout:
+            if widened.ncomps != layout.ncomps:
+                meta = None  # columns of N/A only turned out to be non-scalar
+            else:
+                layout = widened
+                meta["layout"] = dataclasses.asdict(layout)
+
+    append = meta is not None
+    if not append:
+        layout = _layout(filepath)
+        with open(filepath, "rb") as f:
+            header = f.read(layout.offset)
+        cachedir.mkdir(parents=True, exist_ok=True)
+        meta = dict(
+            layout=dataclasses.asdict(layout),
+            header=header.decode("latin-1"),
+            inode=stat.st_ino,
+            offset=layout.offset,
+            nrows=0,
+        )
+
+    with open(filepath, "rb") as f:
+        stream = _Stream(f, layout, start=meta["offset"], partial=False)
+        dat = _parse(stream, layout)
+
+    logging.debug(
+        "%d rows of %s are %s %s",
+        len(dat),
+        filepath,
+        "appended to" if append else "cached in",
+        cachedir,
+    )
+    meta |= dict(
+        size=stat.st_size,
+        mtime=stat.st_mtime_ns,
+        offset=stream.tell_rows,
+        nrows=meta["nrows"] + len(dat),
+    )
+    __save(cachedir, dat, meta, append)
+    cached = __load(cachedir, layout, meta["nrows"])
+    if cached is None:  # written concurrently, so it is rebuilt next time
+        (cachedir / "meta.json").unlink(missing_ok=True)
+        with open(filepath, "rb") as f:
+            cached = _parse(_Stream(f, layout, partial=False), layout)
+    return cached, layout
@@ -1,63 +1,130 @@
-import gzip
+import concurrent.futures
 import re
-import sys
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
 import pandas as pd
 
+from foamio._common import NUMBER_PATTERN
+from foamio._helpers import Interval
+from foamio.dat._cache import _cached, _cachedir
+from foamio.dat._index import _time_index, _window
+from foamio.dat._parser import (
+    Layout,
+    _decimate,
+    _layout,
+    _numeric,
+    _parse,
+    _parse_chunks,
+    _Stream,
+)
+
+
+def _start_time(filepath: Path) -> tuple[float, str]:
+    """Sorting key of a .dat-file by its function object start time, i.e.
+    `postProcessing/<functionObject>/<startTime>/<name>.dat`.
+    """
+
+    name = filepath.parent.name
+    return (
+        float(name) if re.fullmatch(NUMBER_PATTERN, name) else -np.inf,
+        str(filepath),
+    )
 
-def __get_header_size(filepath: Path | str, comment: str = "#") -> int:
-    """Get header size."""
-
-    with open(filepath, encoding="utf-8") as f:
-        for index, line in enumerate(f):
-            if not line.startswith(comment):
-                return index - 1
-    return 0
-
-
-def __unnest_columns(dat: pd.DataFrame) -> pd.DataFrame:
-    """Unnest non-scalar field values to components."""
-
-    colnames: list[str] = list(dat)
-    nested_colnames = []
-    unnested: list[pd.DataFrame] = [dat]
-    for i, name in enumerate(dat.columns):
-        if not (
-            dat[name].dtype == "object"
-            and (col := dat[name].astype(str))
-            .str.contains(r"^\(|\)$", regex=True)
-            .any()
-        ):
-            continue
-
-        col = col.replace(r"^\(|\)$", "", regex=True).apply(lambda s: s.split())
-        ncomp = col.map(len).max()
-        colnames[i + 1 : i + 1] = [f"{name}.{i}" for i in range(ncomp)]
-
-        unnested.append(
-            pd.DataFrame(
-                col.to_list(),
-                index=col.index,
-                columns=colnames[i + 1 : i + 1 + ncomp],
-            )
-        )
-        nested_colnames.append(name)
-    return pd.concat(unnested, axis=1)[colnames].drop(columns=nested_colnames)
+
+def __first_time(filepath: Path, layout: Layout) -> float:
+    """Time of the first data row, infinity if there are no rows yet."""
+
+    with open(filepath, "rb") as f:
+        f.seek(layout.offset)
+        for line in f:
+            if line.strip() and not line.startswith(b"#"):
+                return float(line.split(None, 1)[0])
+    return np.inf
+
+
+def __within(dat: pd.DataFrame, interval: Interval) -> pd.DataFrame:
+    """Select rows within the time interval, sorted index is bisected."""
+
+    if not dat.index.is_monotonic_increasing:
+        return dat[interval.mask(dat.index.to_numpy())]
+
+    lhs = dat.index.searchsorted(
+        interval.lhs, side="left" if interval.lhs_less is np.less_equal else "right"
+    )
+    rhs = dat.index.searchsorted(
+        interval.rhs, side="right" if interval.rhs_less is np.less_equal else "left"
+    )
+    return dat.iloc[lhs:rhs]
+
+
+def _merge(dats: list[pd.DataFrame], firsts: list[float] | None = None) -> pd.DataFrame:
+    """Merge time-sorted frames ordered by start time. Rows of a frame from the
+    first time of any following (restarted) frame onwards are overridden, so
+    the result is sorted without a global sort or a duplicated index mask.
+
+    Args:
+        dats (list[pd.DataFrame]): frames with monotonic increasing index.
+        firsts (list[float], optional): first times of the frames' files if
+        the frames are a subset of the files' rows. Defaults to None.
+
+    Returns:
+        pd.DataFrame: merged frame.
+    """
+
+    cutoff = np.inf
+    merged = []
+    for i, dat in reversed(list(enumerate(dats))):
+        merged.append(dat.iloc[: dat.index.searchsorted(cutoff, side="left")])
+        if firsts is not None:
+            cutoff = min(cutoff, firsts[i])
+        elif not dat.empty:
+            cutoff = min(cutoff, dat.index[0])
+    return pd.concat(merged[::-1])
 
 
 def read(
-    filepath: Path | str, *, usecols: list | None = None, usenth: int | None = None
+    filepath: Path | str,
+    *,
+    usecols: list | None = None,
+    regex: str | None = None,
+    dtype: str | np.dtype | None = None,
+    usenth: int | None = None,
+    usedt: float | None = None,
+    cache: bool | Path | str = False,
+    time: Interval | None = None,
+    time_index: bool | Path | str = False,
 ) -> pd.DataFrame:
     """Read OpenFOAM post-processing .dat file as pandas DataFrame
 
     Args:
         filepath (Path | str): path to .dat-file of directory
         with .dat-files.
-        usecols (list[int], optional): columns to read (1-based indexing).
+        usecols (list[int | str], optional): columns to read, either 1-based
+        indices or names of columns or their components (e.g. `U` or `U.0`).
         Defaults to None.
+        regex (str, optional): read columns (or their components) whose names
+        match the regular expression. Defaults to None.
+        dtype (str | np.dtype, optional): type of float columns, e.g.
+        "float32", integer columns are downcast if set. Columns are converted
+        after parsing, so the result is smaller but the parsing peak memory is
+        not. Defaults to None.
         usenth (int, optional): read every n-th row. Defaults to None.
+        usedt (float, optional): read the first row of each `usedt`-long time
+        interval, e.g. for adaptive time steps. Defaults to None.
+        cache (bool | Path | str, optional): read through a columnar cache
+        of memory-mapped .npy-files stored alongside each .dat-file if True or
+        in the given directory. The cache is validated by the file size and
+        modification time and only rows appended since are parsed.
+        Defaults to False.
+        time (Interval, optional): read rows within the time interval only.
+        The byte range is looked up in a sparse index of the time column kept
+        in memory, cached frames are sliced instead. Defaults to None.
+        time_index (bool | Path | str, optional): persist the sparse time index
+        of uncached reads as `time.npz` in the cache directory, alongside each
+        .dat-file if True or in the given directory, so following processes
+        only extend it. Defaults to False.
 
     Raises:
         ValueError: raised when .dat-file path is invalid.
@@ -67,82 +134,139 @@ def read(
     """
 
     def _read(filepath: Path) -> pd.DataFrame:
-        header_pos = __get_header_size(filepath)
-
-        # Read .dat-file as pandas' DataFrame
-        dat = pd.read_csv(
-            filepath,
-            sep="\t",
-            header=header_pos,
-            index_col=0,
-            usecols=(usecols if usecols is None else ([0] + usecols)),
-            skiprows=(
-                lambda n: (
-                    n > header_pos and n % usenth
-                    if usenth is not None and usenth >= 2
-                    else None
-                )
-            ),  # type: ignore
-        )
+        if cache:
+            dat, layout = _cached(filepath, cache)
+            positions = layout.positions(usecols, regex)
+            if positions is not None:
+                dat = dat.iloc[:, [i - 1 for i in positions[1:]]]
+            if dtype is not None:
+                dat = _numeric(dat, dtype)
+            if time is not None:
+                dat = __within(dat, time)
+            if usenth is not None and usenth >= 2:
+                dat = dat.iloc[::usenth]
+            if usedt is not None:
+                dat = dat[_decimate(dat.index.to_numpy(), usedt)[0]]
+            return dat if dat.index.is_monotonic_increasing else dat.sort_index()
 
-        # Drop '#' and trails spaces from column names
-        dat.index.name = dat.index.name.replace("#", "").strip()
-        dat.columns = dat.columns.str.strip()
+        layout = _layout(filepath)
 
-        return (
-            __unnest_columns(dat)
-            .replace("N/A", pd.NA)
-            .apply(func=lambda col: pd.to_numeric(col, errors="coerce"))
-            .sort_index()
-        )
+        # Seek to the time window if the time column is monotonic
+        start = stop = None
+        if time is not None:
+            times, offsets = _time_index(
+                filepath,
+                layout,
+                _cachedir(filepath, time_index) if time_index else None,
+            )
+            if np.all(np.diff(times) >= 0):
+                start, stop = _window(times, offsets, time)
+
+        with open(filepath, "rb") as f:
+            stream = _Stream(
+                f, layout, start=start, stop=stop, usenth=usenth, usedt=usedt
+            )
+            dat = _parse(stream, layout, usecols=usecols, regex=regex, dtype=dtype)
+
+        if time is not None:
+            dat = __within(dat, time)
+        return dat if dat.index.is_monotonic_increasing else dat.sort_index()
 
     filepath = Path(filepath)
 
-    # Merge all .dat-files in the direcotry into one dataframe
+    # Read all .dat-files in the direcotry concurrently and merge them into
+    # one dataframe, the later restart wins
     if filepath.is_dir():
-        filepaths = list(filepath.rglob("*.dat"))
-        df = pd.concat([_read(dat_file) for dat_file in sorted(filepaths)])
-        return df[~df.index.duplicated(keep="last")]
+        filepaths = sorted(filepath.rglob("*.dat"), key=_start_time)
+        if not filepaths:
+            raise ValueError(f"no .dat-files found in {filepath}")
+
+        with concurrent.futures.ThreadPoolExecutor() as e:
+            dats = list(e.map(_read, filepaths))
+
+        # Windowed frames do not start at the restart times
+        firsts = (
+            None
+            if time is None
+            else [__first_time(path, _layout(path)) for path in filepaths]
+        )
+        return _merge(dats, firsts)
 
     return _read(filepath)
 
 
-def write(
-    fname: Path | str,
-    dat: np.ndarray,
+def iter_chunks(
+    filepath: Path | str,
     *,
-    compression: bool = False,
-    header: str | None = None,
-    dims: bool = False,
-    footer: str | None = None,
-) -> None:
-    """Write n-dimensional array to .dat-file.
+    chunksize: int = 100_000,
+    usecols: list | None = None,
+    regex: str | None = None,
+    dtype: str | np.dtype | None = None,
+    usenth: int | None = None,
+    usedt: float | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over OpenFOAM post-processing .dat file as pandas DataFrame
+    chunks, so it can be reduced in constant memory. The .dat-files in the
+    directory are merged as by `read`, i.e. rows are cut at the first time of
+    the following restart, but the rows of each file must be sorted already.
 
     Args:
-        fname (Path | str): path to .dat-file.
-        dat (np.ndarray): data to be saved to a .dat-file.
-        dims (bool, optional): prepend dimensions. Defaults to False.
-        compression (bool, optional): gzip file. Defaults to False.
+        filepath (Path | str): path to .dat-file of directory
+        with .dat-files.
+        chunksize (int, optional): number of rows per chunk.
+        Defaults to 100_000.
+        usecols (list[int | str], optional): columns to read (1-based indices
+        or names). Defaults to None.
+        regex (str, optional): read columns matching the regular expression.
+        Defaults to None.
+        dtype (str | np.dtype, optional): type of float columns, integer
+        columns are downcast if set. Defaults to None.
+        usenth (int, optional): read every n-th row. Defaults to None.
+        usedt (float, optional): read the first row of each `usedt`-long time
+        interval. Defaults to None.
+
+    Raises:
+        ValueError: raised when .dat-file path is invalid.
+
+    Yields:
+        pd.DataFrame: chunks with the same columns.
     """
 
-    np.set_printoptions(threshold=sys.maxsize)
+    filepath = Path(filepath)
+    if filepath.is_dir():
+        filepaths = sorted(filepath.rglob("*.dat"), key=_start_time)
+        if not filepaths:
+            raise ValueError(f"no .dat-files found in {filepath}")
+    else:
+        filepaths = [filepath]
 
-    sdat = " ".join(str(d) for d in dat.shape) if dims else ""
-    sdat += " "
-    sdat += (
-        np.array2string(dat, max_line_width=None, floatmode="maxprec")
-        .replace("\n", "")
-        .replace("[", "(")
-        .replace("]", ")")
-    )
-    sdat = (
-        (header if header is not None else "")
-        + re.sub(r"\s+", " ", sdat).strip()
-        + (footer if footer is not None else "")
+    layouts = [_layout(path) for path in filepaths]
+    columns = list(
+        dict.fromkeys(
+            name for layout in layouts for name in layout.selected(usecols, regex)
+        )
     )
-    if compression:
-        with gzip.open(fname, "wt") as f:
-            f.write(sdat)
-    else:
-        with open(fname, "w", encoding="utf-8") as f:
-            f.write(sdat)
+
+    cutoffs = [np.inf]
+    for path, layout in zip(filepaths[:0:-1], layouts[:0:-1]):
+        cutoffs.append(min(cutoffs[-1], __first_time(path, layout)))
+
+    for path, layout, cutoff in zip(filepaths, layouts, reversed(cutoffs)):
+        with open(path, "rb") as f:
+            for dat in _parse_chunks(
+                _Stream(f, layout, usenth=usenth, usedt=usedt),
+                layout,
+                chunksize=chunksize,
+                usecols=usecols,
+                regex=regex,
+                dtype=dtype,
+            ):
+                nrows = dat.index.searchsorted(cutoff, side="left")
+                if nrows:
+                    yield (
+                        dat.iloc[:nrows]
+                        if list(dat.columns) == columns
+                        else dat.iloc[:nrows].reindex(columns=columns)
+                    )
+                if nrows < len(dat):
+                    break
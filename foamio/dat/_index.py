@@ -0,0 +1,154 @@
+import logging
+import os
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from foamio._helpers import Interval
+from foamio.dat._parser import Layout
+
+#: Distance in bytes between sampled rows of the sparse time index
+INDEX_STRIDE = 1 << 20
+
+#: Maximum number of sparse time indices kept in memory
+INDICES_MAXSIZE = 128
+
+#: Recently used sparse time indices of .dat-files by their path
+_INDICES: OrderedDict[Path, dict[str, np.ndarray]] = OrderedDict()
+
+
+def __sample(
+    filepath: Path, layout: Layout, start: int, size: int
+) -> tuple[list[float], list[int]]:
+    """Sample time and byte offset of the first complete row following every
+    `INDEX_STRIDE` bytes from the `start` position.
+    """
+
+    times, offsets = [], []
+    with open(filepath, "rb") as f:
+        for pos in range(start, size, INDEX_STRIDE):
+            f.seek(pos)
+            if pos != layout.offset:
+                f.readline()  # skip the row the position is in
+
+            while (offset := f.tell()) < size:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip() and not line.startswith(b"#"):
+                    if not offsets or offsets[-1] != offset:
+                        times.append(float(line.split(None, 1)[0]))
+                        offsets.append(offset)
+                    break
+    return times, offsets
+
+
+def __load(fname: Path) -> dict[str, np.ndarray] | None:
+    try:
+        with np.load(fname) as index:
+            return dict(index)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _time_index(
+    filepath: Path, layout: Layout, cachedir: Path | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sparse index of the (monotonic) time column, i.e. times and byte offsets
+    of rows sampled every `INDEX_STRIDE` bytes. Sampling takes a couple of
+    seeks per stride, so the file is not read through. The last
+    `INDICES_MAXSIZE` indices are kept in memory, the index is persisted as
+    `time.npz` in the cache directory if it is set. It is extended when the
+    file only grew.
+
+    Args:
+        filepath (Path): path to .dat-file.
+        layout (Layout): column layout of the .dat-file.
+        cachedir (Path, optional): directory to persist the index in.
+        Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: sampled times and their byte offsets.
+    """
+
+    stat = os.stat(filepath)
+    with open(filepath, "rb") as f:
+        crc = zlib.crc32(f.read(layout.offset))
+    key = np.array([stat.st_ino, layout.offset, crc], dtype=np.int64)
+
+    times, offsets, start = np.array([]), np.array([], dtype=np.int64), layout.offset
+    filepath = filepath.resolve()
+    fname = None if cachedir is None else cachedir / "time.npz"
+    index = _INDICES.get(filepath)
+    if index is None and fname is not None and fname.is_file():
+        index = __load(fname)
+    if (
+        index is not None
+        and np.array_equal(index["key"], key)
+        and index["size"] <= stat.st_size
+    ):
+        if index["size"] == stat.st_size:
+            __remember(filepath, index)
+            if fname is not None and not fname.is_file():
+                __save(fname, index)
+            return index["times"], index["offsets"]
+
+        # Resample the last stride which might have been incomplete
+        start = layout.offset + INDEX_STRIDE * max(
+            (int(index["size"]) - layout.offset) // INDEX_STRIDE - 1, 0
+        )
+        is_kept = index["offsets"] < start
+        times, offsets = index["times"][is_kept], index["offsets"][is_kept]
+
+    sampled = __sample(filepath, layout, start, stat.st_size)
+    times = np.concatenate([times, sampled[0]])
+    offsets = np.concatenate([offsets, np.array(sampled[1], dtype=np.int64)])
+
+    index = dict(key=key, size=stat.st_size, times=times, offsets=offsets)
+    __remember(filepath, index)
+    if fname is not None:
+        __save(fname, index)
+    return times, offsets
+
+
+def __save(fname: Path, index: dict[str, np.ndarray]) -> None:
+    try:
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(fname, "wb") as f:
+            np.savez(f, **index)
+    except OSError as exception:
+        logging.debug("%s is not saved: %r", fname, exception)
+
+
+def __remember(filepath: Path, index: dict[str, np.ndarray]) -> None:
+    """Keep the index in memory, the least recently used ones are dropped."""
+
+    _INDICES[filepath] = index
+    _INDICES.move_to_end(filepath)
+    while len(_INDICES) > INDICES_MAXSIZE:
+        _INDICES.popitem(last=False)
+
+
+def _window(
+    times: np.ndarray, offsets: np.ndarray, interval: Interval
+) -> tuple[int | None, int | None]:
+    """Byte range of the rows within the time interval.
+
+    Args:
+        times (np.ndarray): sampled times.
+        offsets (np.ndarray): byte offsets of the sampled times.
+        interval (Interval): time interval.
+
+    Returns:
+        tuple[int | None, int | None]: start and stop byte offsets, None for the
+        first data row and the end of the file respectively.
+    """
+
+    lhs = np.searchsorted(times, interval.lhs, side="left") - 1
+    rhs = np.searchsorted(times, interval.rhs, side="right")
+    return (
+        int(offsets[lhs]) if lhs >= 0 else None,
+        int(offsets[rhs]) if rhs < len(offsets) else None,
+    )
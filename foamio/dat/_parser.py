@@ -0,0 +1,472 @@
+import dataclasses
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
+import pandas as pd
+
+#: Data lines are scanned to detect the number of components of nested columns
+LAYOUT_NROWS = 100
+
+BLOCKSIZE = 1 << 20
+
+UNNEST_TABLE = bytes.maketrans(b"()", b"  ")
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Column layout of a .dat-file.
+
+    Attributes:
+        index (str): index (time) column name.
+        names (tuple[str, ...]): column names besides the index one.
+        ncomps (tuple[int, ...]): number of components of each column, 0 for
+        scalar columns.
+        offset (int): byte offset of the first data row.
+        unresolved (tuple[int, ...]): columns of `N/A` values only so far, their
+        number of components is unknown yet.
+    """
+
+    index: str
+    names: tuple[str, ...]
+    ncomps: tuple[int, ...]
+    offset: int
+    unresolved: tuple[int, ...] = ()
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names with non-scalar columns unnested to components."""
+
+        columns = []
+        for name, ncomp in zip(self.names, self.ncomps):
+            columns += [f"{name}.{i}" for i in range(ncomp)] if ncomp else [name]
+        return columns
+
+    @property
+    def is_nested(self) -> bool:
+        return any(self.ncomps)
+
+    def selected(
+        self, usecols: list[int | str] | None = None, regex: str | None = None
+    ) -> list[str]:
+        """Unnested column names of the selected columns."""
+
+        positions = self.positions(usecols, regex)
+        if positions is None:
+            return self.columns
+        return [([self.index] + self.columns)[i] for i in positions[1:]]
+
+    def positions(
+        self, usecols: list[int | str] | None = None, regex: str | None = None
+    ) -> list[int] | None:
+        """Convert selected columns to positions of unnested columns.
+
+        Args:
+            usecols (list[int | str], optional): columns to read, either 1-based
+            indices or names of columns or their components (e.g. `U` or `U.0`).
+            Defaults to None.
+            regex (str, optional): read columns (or their components) whose
+            names match the regular expression. Defaults to None.
+
+        Raises:
+            ValueError: raised when a column is not found.
+
+        Returns:
+            list[int] | None: unnested column positions including the index.
+        """
+
+        if usecols is None and regex is None:
+            return None
+
+        columns = self.columns
+        starts = [1]
+        for ncomp in self.ncomps:
+            starts.append(starts[-1] + max(ncomp, 1))
+
+        positions = []
+        for col in range(1, len(self.names) + 1) if usecols is None else usecols:
+            if isinstance(col, str) and col in self.names:
+                col = self.names.index(col) + 1
+            if isinstance(col, str):
+                if col not in columns:
+                    raise ValueError(f"{col!r} is not found in {self.names}")
+                positions.append(columns.index(col) + 1)
+                continue
+            positions += range(starts[col - 1], starts[col])
+
+        if regex is not None:
+            positions = [i for i in positions if re.search(regex, columns[i - 1])]
+        return [0] + sorted(set(positions))
+
+
+def _layout(filepath: Path | str, comment: bytes = b"#") -> Layout:
+    """Get the layout of a .dat-file from its header and first data rows.
+
+    Args:
+        filepath (Path | str): path to .dat-file.
+        comment (bytes, optional): header line prefix. Defaults to b"#".
+
+    Raises:
+        ValueError: raised when the file has no header with column names.
+
+    Returns:
+        Layout: column layout of the .dat-file.
+    """
+
+    header, offset, rows = None, 0, []
+    with open(filepath, "rb") as f:
+        for line in iter(f.readline, b""):
+            if not line.endswith(b"\n"):
+                break  # partially written row
+            if line.startswith(comment) and not rows:
+                header = line
+                offset = end = f.tell()
+            elif line.strip() and not line.startswith(comment):
+                rows.append(line)
+                end = f.tell()
+                if len(rows) >= LAYOUT_NROWS:
+                    break
+
+    if header is None:
+        raise ValueError(f"{filepath} has no header")
+
+    index, *names = (
+        name.strip() for name in header.decode("utf-8").lstrip("#").split("\t")
+    )
+    names = [name for name in names if name]
+
+    ncomps, unresolved = [0] * len(names), set(range(len(names)))
+    for row in rows:
+        __scan(row, ncomps, unresolved)
+
+    layout = Layout(
+        index, tuple(names), tuple(ncomps), offset, tuple(sorted(unresolved))
+    )
+    return _widen(filepath, layout, end, comment)
+
+
+def __scan(row: bytes, ncomps: list[int], unresolved: set[int]) -> None:
+    """Update numbers of components of columns by a data row, a column is
+    resolved by its first value other than `N/A`.
+    """
+
+    for i, field in enumerate(row.rstrip().split(b"\t")[1 : len(ncomps) + 1]):
+        field = field.strip()
+        if field.startswith(b"("):
+            ncomps[i] = max(ncomps[i], len(field.translate(UNNEST_TABLE).split()))
+        if field != b"N/A":
+            unresolved.discard(i)
+
+
+def _widen(
+    filepath: Path | str, layout: Layout, start: int, comment: bytes = b"#"
+) -> Layout:
+    """Resolve columns of `N/A` values only by the complete rows following the
+    `start` position, e.g. a probe turning into `(1 2 3)` later on. Rows are
+    scanned until all columns are resolved, so nothing is read usually.
+
+    Args:
+        filepath (Path | str): path to .dat-file.
+        layout (Layout): column layout of the .dat-file.
+        start (int): byte offset of the rows to scan.
+        comment (bytes, optional): header line prefix. Defaults to b"#".
+
+    Returns:
+        Layout: layout with the numbers of components of resolved columns.
+    """
+
+    if not layout.unresolved:
+        return layout
+
+    ncomps, unresolved = list(layout.ncomps), set(layout.unresolved)
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if not unresolved or not line.endswith(b"\n"):
+                break
+            if line.strip() and not line.startswith(comment):
+                __scan(line, ncomps, unresolved)
+
+    return dataclasses.replace(
+        layout, ncomps=tuple(ncomps), unresolved=tuple(sorted(unresolved))
+    )
+
+
+def _decimate(
+    times: np.ndarray, usedt: float, last: float = np.nan
+) -> tuple[np.ndarray, float]:
+    """Mask of the first row of each `usedt`-long time interval.
+
+    Args:
+        times (np.ndarray): monotonic times, NaN rows are masked out.
+        usedt (float): time interval.
+        last (float, optional): interval number of the last row passed through
+        before. Defaults to NaN.
+
+    Returns:
+        tuple[np.ndarray, float]: mask and the last interval number.
+    """
+
+    bins = np.floor(times / usedt + 1e-6)
+    valid = np.flatnonzero(np.isfinite(bins))
+    bins = bins[valid]
+
+    mask = np.zeros(len(times), dtype=bool)
+    mask[valid[bins != np.concatenate([[last], bins[:-1]])]] = True
+    return mask, (bins[-1] if len(bins) else last)
+
+
+def _row_time(row: bytes) -> float:
+    try:
+        return float(row.split(None, 1)[0])
+    except (IndexError, ValueError):
+        return np.nan  # blank, comment or partially written row
+
+
+class _Stream(io.RawIOBase):
+    """Read-only binary stream over a .dat-file data rows which unnests
+    non-scalar columns on the fly, i.e. `(x y z)` is passed to the tokeniser as
+    `x y z` and `N/A` in a non-scalar column is repeated for each component.
+    Only complete rows are passed through if `partial` is False.
+
+    Rows are decimated before tokenising, i.e. every `usenth` row or the first
+    row of each `usedt`-long time interval is passed through. The row number
+    and the interval number of the last row passed through (`nrows` and
+    `last`) carry the decimation phase over to a stream continuing this one.
+    """
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        layout: Layout,
+        *,
+        start: int | None = None,
+        stop: int | None = None,
+        partial: bool = True,
+        usenth: int | None = None,
+        usedt: float | None = None,
+        nrows: int = 0,
+        last: float = np.nan,
+        blocksize: int = BLOCKSIZE,
+    ) -> None:
+        super().__init__()
+        self.__f = f
+        self.__layout = layout
+        self.__stop = stop
+        self.__partial = partial
+        self.__usenth = usenth if usenth is not None and usenth >= 2 else None
+        self.__usedt = usedt
+        self.__blocksize = blocksize
+
+        self.__f.seek(layout.offset if start is None else start)
+        self.__buffer = memoryview(b"")
+        self.__tail = b""
+
+        #: byte offset following the last row passed through
+        self.tell_rows = self.__f.tell()
+        #: number of rows read including the skipped ones
+        self.nrows = nrows
+        #: interval number of the last row passed through if `usedt` is set
+        self.last = last
+
+    def readable(self) -> bool:
+        return True
+
+    def __next_block(self) -> bytes | None:
+        size = self.__blocksize
+        if self.__stop is not None:
+            size = min(size, self.__stop - self.__f.tell())
+
+        raw = self.__f.read(size) if size > 0 else b""
+        if not raw:
+            block = self.__tail if self.__partial else b""
+            if not block:
+                return None
+            self.__tail = b""
+        else:
+            block = self.__tail + raw
+            end = block.rfind(b"\n") + 1
+            block, self.__tail = block[:end], block[end:]
+
+        self.tell_rows += len(block)
+        return self.__unnest(self.__decimate(block))
+
+    def __decimate(self, block: bytes) -> bytes:
+        if self.__usenth is None and self.__usedt is None:
+            self.nrows += block.count(b"\n") + (block[-1:] not in (b"", b"\n"))
+            return block
+
+        rows = block.split(b"\n")
+        if not rows[-1]:
+            rows.pop()
+
+        nrows, self.nrows = self.nrows, self.nrows + len(rows)
+        if self.__usenth is not None:
+            rows = rows[-nrows % self.__usenth :: self.__usenth]
+        if self.__usedt is not None:
+            mask, self.last = _decimate(
+                np.array([_row_time(row) for row in rows]), self.__usedt, self.last
+            )
+            rows = [row for row, is_kept in zip(rows, mask) if is_kept]
+
+        return b"\n".join(rows) + b"\n" if rows else b""
+
+    def __unnest(self, block: bytes) -> bytes:
+        layout = self.__layout
+        if not layout.is_nested:
+            return block
+
+        ncomps = set(layout.ncomps)
+        if b"N/A" in block and len(ncomps) == 1:
+            # Columns are of the same type (e.g. probes), so N/A is repeated
+            # without splitting rows into fields
+            block = block.replace(b"N/A", b" ".join([b"N/A"] * ncomps.pop()))
+        elif b"N/A" in block:
+            lines = block.split(b"\n")
+            for i, line in enumerate(lines):
+                if b"N/A" not in line:
+                    continue
+                fields = line.split(b"\t")
+                for j, ncomp in enumerate(layout.ncomps, start=1):
+                    if ncomp and j < len(fields) and fields[j].strip() == b"N/A":
+                        fields[j] = b" ".join([b"N/A"] * ncomp)
+                lines[i] = b"\t".join(fields)
+            block = b"\n".join(lines)
+
+        return block.translate(UNNEST_TABLE)
+
+    def readinto(self, b) -> int:
+        while not self.__buffer:
+            block = self.__next_block()
+            if block is None:
+                return 0
+            self.__buffer = memoryview(block)
+
+        n = min(len(b), len(self.__buffer))
+        b[:n] = self.__buffer[:n]
+        self.__buffer = self.__buffer[n:]
+        return n
+
+
+def __read_csv(
+    stream: io.RawIOBase,
+    layout: Layout,
+    usecols: list[int | str] | None,
+    regex: str | None,
+    **kwargs,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    # Types are inferred by the tokeniser and converted by `_numeric`, so
+    # non-numeric tokens further on are coerced to NaN whatever the `dtype`
+    return pd.read_csv(
+        io.BufferedReader(stream, BLOCKSIZE),
+        sep=r"\s+",
+        header=None,
+        names=[layout.index] + layout.columns,
+        index_col=0,
+        usecols=layout.positions(usecols, regex),
+        na_values=["N/A"],
+        comment="#",
+        **kwargs,
+    )
+
+
+def _numeric(dat: pd.DataFrame, dtype: str | np.dtype | None = None) -> pd.DataFrame:
+    """Coerce non-numeric columns to NaN, convert float columns to `dtype` and
+    downcast integer ones if `dtype` is set.
+    """
+
+    for name, col_dtype in dat.dtypes.items():
+        # Non-numeric columns (solver names, flags, etc.) are the only ones
+        # parsed as strings as the rest are numeric already
+        if not pd.api.types.is_numeric_dtype(col_dtype):
+            dat[name] = pd.to_numeric(dat[name], errors="coerce")
+            col_dtype = dat[name].dtype
+
+        if dtype is None or pd.api.types.is_bool_dtype(col_dtype):
+            continue
+        if pd.api.types.is_integer_dtype(col_dtype):
+            dat[name] = pd.to_numeric(dat[name], downcast="integer")
+        elif col_dtype != dtype:
+            dat[name] = dat[name].astype(dtype)
+    return dat
+
+
+def _parse(
+    stream: io.RawIOBase,
+    layout: Layout,
+    *,
+    usecols: list[int | str] | None = None,
+    regex: str | None = None,
+    dtype: str | np.dtype | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """Tokenise unnested data rows straight to numeric columns.
+
+    Args:
+        stream (io.RawIOBase): unnested data rows.
+        layout (Layout): column layout of the .dat-file.
+        usecols (list[int | str], optional): columns to read (1-based indices
+        or names). Defaults to None.
+        regex (str, optional): read columns matching the regular expression.
+        Defaults to None.
+        dtype (str | np.dtype, optional): float columns type, integer columns
+        are downcast if set. Columns are converted after parsing, so the
+        frame is smaller but the parsing peak memory is not. Defaults to None.
+
+    Returns:
+        pd.DataFrame: numeric DataFrame indexed by the first column.
+    """
+
+    try:
+        return _numeric(
+            __read_csv(stream, layout, usecols, regex, **kwargs), dtype
+        )
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(
+            columns=layout.selected(usecols, regex),
+            index=pd.Index([], name=layout.index, dtype=float),
+            dtype=float if dtype is None else dtype,
+        )
+
+
+def _parse_chunks(
+    stream: io.RawIOBase,
+    layout: Layout,
+    *,
+    chunksize: int,
+    usecols: list[int | str] | None = None,
+    regex: str | None = None,
+    dtype: str | np.dtype | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """Tokenise unnested data rows straight to numeric columns chunk by chunk.
+
+    Args:
+        stream (io.RawIOBase): unnested data rows.
+        layout (Layout): column layout of the .dat-file.
+        chunksize (int): number of rows per chunk.
+        usecols (list[int | str], optional): columns to read (1-based indices
+        or names). Defaults to None.
+        regex (str, optional): read columns matching the regular expression.
+        Defaults to None.
+        dtype (str | np.dtype, optional): float columns type, integer columns
+        are downcast if set. Columns are converted after parsing, so the
+        frame is smaller but the parsing peak memory is not. Defaults to None.
+
+    Yields:
+        pd.DataFrame: numeric DataFrame indexed by the first column.
+    """
+
+    try:
+        reader = __read_csv(
+            stream, layout, usecols, regex, chunksize=chunksize, **kwargs
+        )
+    except pd.errors.EmptyDataError:
+        return
+
+    with reader:
+        for dat in reader:
+            yield _numeric(dat, dtype)
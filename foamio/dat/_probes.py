@@ -0,0 +1,91 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from foamio.dat._parser import UNNEST_TABLE, Layout, _parse, _Stream
+
+PROBE_PATTERN = re.compile(rb"^#\s*Probe\s+(\d+)\s*\(([^)]*)\)")
+
+
+@dataclass
+class Probes:
+    """Probed field values.
+
+    Attributes:
+        time (np.ndarray): times of shape (ntimes,).
+        values (np.ndarray): values of shape (ntimes, nprobes, ncomponents).
+        locations (np.ndarray): probe locations of shape (nprobes, 3).
+        indices (np.ndarray): probe indices of shape (nprobes,).
+    """
+
+    time: np.ndarray
+    values: np.ndarray
+    locations: np.ndarray
+    indices: np.ndarray
+
+
+def read_probes(filepath: Path | str, *, dtype: str | np.dtype = np.float64) -> Probes:
+    """Read OpenFOAM `probes` function object output (e.g.
+    `postProcessing/probes/0/U`) as dense array. Probe locations are read from
+    the `# Probe <i> (<x> <y> <z>)` header comments and the values are
+    tokenised straight to the array, `N/A` values are NaN.
+
+    Args:
+        filepath (Path | str): path to probes output.
+        dtype (str | np.dtype, optional): values type. Defaults to np.float64.
+
+    Raises:
+        ValueError: raised when the number of values does not match the number
+        of probes.
+
+    Returns:
+        Probes: times, values, locations and indices of probes.
+    """
+
+    filepath = Path(filepath)
+
+    indices, locations, offset, row = [], [], 0, b""
+    with open(filepath, "rb") as f:
+        for line in iter(f.readline, b""):
+            if line.startswith(b"#"):
+                if match := PROBE_PATTERN.match(line):
+                    indices.append(int(match[1]))
+                    locations.append([float(x) for x in match[2].split()])
+                offset = f.tell()
+            elif line.strip():
+                row = line
+                break
+
+    # Number of components from the first value, e.g. `(a b c)` of a vector
+    ncomp = (
+        len(row[row.find(b"(") : row.find(b")")].translate(UNNEST_TABLE).split())
+        if b"(" in row
+        else 1
+    )
+    nvalues = len(row.translate(UNNEST_TABLE).split()) - 1
+    if not indices:
+        indices = list(range(max(nvalues, 0) // ncomp))
+    if row and b"N/A" not in row and nvalues != ncomp * len(indices):
+        raise ValueError(
+            f"{filepath} has {len(indices)} probes of {ncomp} component(s)"
+            f" but {nvalues} values per row"
+        )
+
+    names = tuple(str(i) for i in indices)
+    layout = Layout(
+        "Time",
+        names,
+        (ncomp if ncomp > 1 else 0,) * len(names),
+        offset,
+    )
+    with open(filepath, "rb") as f:
+        dat = _parse(_Stream(f, layout), layout, dtype=dtype)
+
+    return Probes(
+        time=dat.index.to_numpy(),
+        values=dat.to_numpy(dtype=dtype).reshape(len(dat), len(names), ncomp),
+        locations=np.array(locations, dtype=np.float64).reshape(-1, 3),
+        indices=np.array(indices),
+    )
@@ -0,0 +1,185 @@
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from foamio.dat._dat import _merge, _start_time
+from foamio.dat._parser import Layout, _layout, _parse, _Stream, _widen
+
+
+@dataclass
+class _State:
+    layout: Layout
+    header: bytes
+    inode: int
+    offset: int
+    nrows: int = 0
+    last: float = np.nan
+
+
+class DatReader:
+    """Incremental reader of growing OpenFOAM post-processing .dat-files, e.g.
+    ```
+    reader = DatReader('postProcessing/forces/0/forces.dat')
+    df = reader.read()  # all rows written so far
+    ...
+    df = pd.concat([df, reader.read()])  # rows written since the last call
+    ```
+    Byte offsets, headers and column layouts are kept per file, so only rows
+    appended since the last call are parsed. A partially written last row is
+    left for the next call. If any of the files is truncated or rotated, all
+    of them are read from the beginning and `rewound` is set, i.e. the rows
+    returned replace the former ones.
+    """
+
+    def __init__(
+        self,
+        filepath: Path | str,
+        *,
+        usecols: list | None = None,
+        regex: str | None = None,
+        dtype: str | np.dtype | None = None,
+        usenth: int | None = None,
+        usedt: float | None = None,
+    ) -> None:
+        """
+        Args:
+            filepath (Path | str): path to .dat-file of directory
+            with .dat-files.
+            usecols (list[int | str], optional): columns to read (1-based
+            indices or names). Defaults to None.
+            regex (str, optional): read columns matching the regular
+            expression. Defaults to None.
+            dtype (str | np.dtype, optional): type of float columns, integer
+            columns are downcast if set. Defaults to None.
+            usenth (int, optional): read every n-th row. Defaults to None.
+            usedt (float, optional): read the first row of each `usedt`-long
+            time interval. Defaults to None.
+        """
+
+        self.filepath = Path(filepath)
+        self.usecols = usecols
+        self.regex = regex
+        self.dtype = dtype
+        self.usenth = usenth
+        self.usedt = usedt
+
+        #: were any of the files truncated or rotated during the last call
+        self.rewound = False
+        self.__states: dict[Path, _State] = {}
+
+    @property
+    def offsets(self) -> dict[Path, int]:
+        """Byte offsets following the last complete row read from each file."""
+
+        return {path: state.offset for path, state in self.__states.items()}
+
+    def reset(self) -> None:
+        """Forget offsets, so the next call reads all rows."""
+
+        self.__states.clear()
+
+    def __state(self, filepath: Path) -> _State | None:
+        """Get the file state, start over if the file has been truncated,
+        rotated or no rows have been read yet.
+        """
+
+        stat = os.stat(filepath)
+        state = self.__states.get(filepath)
+        if state is not None:
+            with open(filepath, "rb") as f:
+                header = f.read(len(state.header))
+
+            if (
+                stat.st_ino == state.inode
+                and stat.st_size >= state.offset
+                and header == state.header
+            ):
+                # Columns of N/A only so far might turn out to be non-scalar
+                layout = _widen(filepath, state.layout, state.offset)
+                if layout.ncomps != state.layout.ncomps:
+                    logging.info("%s has new vector columns, reading over", filepath)
+                    self.rewound = True
+                elif state.nrows:
+                    state.layout = layout
+                    return state
+            else:
+                logging.info("%s is truncated or rotated, reading over", filepath)
+                self.rewound = True
+
+        try:
+            layout = _layout(filepath)
+        except ValueError:
+            return None  # header has not been written yet
+
+        with open(filepath, "rb") as f:
+            header = f.read(layout.offset)
+
+        self.__states[filepath] = _State(layout, header, stat.st_ino, layout.offset)
+        return self.__states[filepath]
+
+    def __read(self, filepath: Path) -> pd.DataFrame | None:
+        if (state := self.__state(filepath)) is None:
+            return None
+
+        if os.stat(filepath).st_size == state.offset:
+            return None
+
+        with open(filepath, "rb") as f:
+            stream = _Stream(
+                f,
+                state.layout,
+                start=state.offset,
+                partial=False,
+                usenth=self.usenth,
+                usedt=self.usedt,
+                nrows=state.nrows,
+                last=state.last,
+            )
+            dat = _parse(
+                stream,
+                state.layout,
+                usecols=self.usecols,
+                regex=self.regex,
+                dtype=self.dtype,
+            )
+
+        state.offset = stream.tell_rows
+        state.nrows = stream.nrows
+        state.last = stream.last
+        return dat
+
+    def read(self) -> pd.DataFrame:
+        """Read rows appended since the last call.
+
+        Returns:
+            pd.DataFrame: new rows, empty if nothing has been appended, or all
+            rows if `rewound`.
+        """
+
+        self.rewound = False
+        filepaths = (
+            sorted(self.filepath.rglob("*.dat"), key=_start_time)
+            if self.filepath.is_dir()
+            else [self.filepath]
+        )
+
+        # Restart cutoffs of all files apply to the rows read over
+        for filepath in filepaths:
+            if filepath in self.__states:
+                self.__state(filepath)
+        if self.rewound:
+            self.reset()
+
+        dats = [
+            dat
+            for filepath in filepaths
+            if (dat := self.__read(filepath)) is not None and not dat.empty
+        ]
+        if not dats:
+            return pd.DataFrame()
+
+        return _merge(dats)
@@ -0,0 +1,217 @@
+import concurrent.futures
+import gzip
+import io
+import math
+import os
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+import numpy as np
+
+#: Number of values formatted at once
+BLOCK_SIZE = 1 << 16
+
+#: Size of uncompressed data compressed by a thread to a separate gzip member
+GZIP_MEMBER_SIZE = 1 << 22
+
+
+class _ParallelGzipFile(io.RawIOBase):
+    """Writable gzip stream compressing blocks of data concurrently. Each block
+    is a separate gzip member and their concatenation is a valid gzip file
+    (RFC 1952), readable by `gunzip` or zlib's `gzread` used by OpenFOAM.
+    """
+
+    def __init__(
+        self, fname: Path | str, compresslevel: int = 9, threads: int | None = None
+    ) -> None:
+        super().__init__()
+        self.__f = open(fname, "wb")
+        self.__compresslevel = compresslevel
+        self.__threads = os.cpu_count() if threads is None else threads
+        self.__executor = concurrent.futures.ThreadPoolExecutor(self.__threads)
+        self.__pending: deque[concurrent.futures.Future] = deque()
+        self.__buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def __compress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(self.__compresslevel, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    def __submit(self, data: bytes) -> None:
+        self.__pending.append(self.__executor.submit(self.__compress, data))
+        while len(self.__pending) > 2 * self.__threads:
+            self.__f.write(self.__pending.popleft().result())
+
+    def write(self, b) -> int:
+        self.__buffer += b
+        while len(self.__buffer) >= GZIP_MEMBER_SIZE:
+            self.__submit(bytes(self.__buffer[:GZIP_MEMBER_SIZE]))
+            del self.__buffer[:GZIP_MEMBER_SIZE]
+        return len(b)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        try:
+            if self.__buffer or not self.__pending:
+                self.__submit(bytes(self.__buffer))
+            while self.__pending:
+                self.__f.write(self.__pending.popleft().result())
+        finally:
+            self.__executor.shutdown()
+            self.__f.close()
+            super().close()
+
+
+def __template(shape: tuple[int, ...], fmt: str) -> str:
+    """Format string of an array item as OpenFOAM list, e.g. `(%g %g %g)` of
+    an array of shape (3,).
+    """
+
+    if not shape:
+        return fmt
+    return "(" + " ".join([__template(shape[1:], fmt)] * shape[0]) + ")"
+
+
+def _write_list(f: TextIO, dat: np.ndarray, fmt: str = "%.9g", sep: str = " ") -> None:
+    """Stream n-dimensional array as OpenFOAM list row block by row block, so
+    only a block is formatted at once.
+
+    Args:
+        f (TextIO): file to write to.
+        dat (np.ndarray): n-dimensional array.
+        fmt (str, optional): value format. Defaults to "%.9g".
+        sep (str, optional): separator of the items of the first axis.
+        Defaults to " ".
+    """
+
+    if dat.ndim == 0:
+        f.write(fmt % dat)
+        return
+
+    item = __template(dat.shape[1:], fmt)
+    nitems = max(BLOCK_SIZE // max(math.prod(dat.shape[1:]), 1), 1)
+
+    f.write("(" + sep.strip(" "))
+    for start in range(0, len(dat), nitems):
+        block = dat[start : start + nitems]
+        if start:
+            f.write(sep)
+        f.write(sep.join([item] * len(block)) % tuple(block.ravel().tolist()))
+    f.write(sep.strip(" ") + ")")
+
+
+def _write_binary_list(
+    f: BinaryIO, dat: np.ndarray, dtype: str = "<f8", ncontiguous: int = 1
+) -> None:
+    """Stream n-dimensional array as OpenFOAM binary list, i.e. `N(<raw>)` of
+    the contiguous trailing axes, e.g. a list of scalars or vectors, and
+    nested lists of those otherwise.
+
+    Args:
+        f (BinaryIO): file to write to.
+        dat (np.ndarray): n-dimensional array.
+        dtype (str, optional): raw values type. Defaults to "<f8".
+        ncontiguous (int, optional): number of trailing axes written as one
+        raw list, e.g. 2 for a list of vectors of shape (N, 3). Defaults to 1.
+    """
+
+    f.write(f"\n{len(dat)}\n(".encode())
+    if dat.ndim <= ncontiguous:
+        nitems = max(BLOCK_SIZE // max(math.prod(dat.shape[1:]), 1), 1)
+        for start in range(0, len(dat), nitems):
+            f.write(np.ascontiguousarray(dat[start : start + nitems], dtype).data)
+    else:
+        for item in dat:
+            _write_binary_list(f, item, dtype, ncontiguous)
+    f.write(b")")
+
+
+def _open(
+    fname: Path | str,
+    mode: str,
+    compression: bool = False,
+    compresslevel: int = 9,
+    threads: int | None = 1,
+) -> BinaryIO | TextIO:
+    """Open file to write, optionally gzip compressed by several threads.
+
+    Args:
+        fname (Path | str): path to the file.
+        mode (str): "w" for text or "wb" for binary.
+        compression (bool, optional): gzip file. Defaults to False.
+        compresslevel (int, optional): gzip compression level. Defaults to 9.
+        threads (int, optional): compression threads, all CPUs if None.
+        Defaults to 1.
+    """
+
+    if not compression:
+        return open(fname, mode, **({} if "b" in mode else dict(encoding="utf-8")))
+
+    if threads == 1:
+        return gzip.open(
+            fname,
+            mode.replace("w", "wt") if "b" not in mode else mode,
+            compresslevel=compresslevel,
+            **({} if "b" in mode else dict(encoding="utf-8")),
+        )
+
+    f = io.BufferedWriter(_ParallelGzipFile(fname, compresslevel, threads))
+    return f if "b" in mode else io.TextIOWrapper(f, encoding="utf-8")
+
+
+def write(
+    fname: Path | str,
+    dat: np.ndarray,
+    *,
+    compression: bool = False,
+    compresslevel: int = 9,
+    threads: int | None = 1,
+    header: str | None = None,
+    dims: bool = False,
+    footer: str | None = None,
+    fmt: str = "%.9g",
+    format: str = "ascii",
+) -> None:
+    """Write n-dimensional array to .dat-file.
+
+    Args:
+        fname (Path | str): path to .dat-file.
+        dat (np.ndarray): data to be saved to a .dat-file.
+        dims (bool, optional): prepend dimensions. Defaults to False.
+        compression (bool, optional): gzip file. Defaults to False.
+        compresslevel (int, optional): gzip compression level. Defaults to 9.
+        threads (int, optional): gzip compression threads, each compressing a
+        block of the file to a separate gzip member. All CPUs are used if None.
+        Defaults to 1.
+        fmt (str, optional): value format of "ascii" format. Defaults to "%.9g".
+        format (str, optional): "ascii" or "binary", i.e. OpenFOAM binary lists
+        of little-endian doubles, to be read with `format binary;` streams.
+        Defaults to "ascii".
+
+    Raises:
+        ValueError: raised when the format is not supported.
+    """
+
+    if format not in ("ascii", "binary"):
+        raise ValueError(f"{format=} is not supported, use 'ascii' or 'binary'")
+
+    dat = np.asarray(dat)
+    binary = format == "binary"
+    with _open(
+        fname, "wb" if binary else "w", compression, compresslevel, threads
+    ) as f:
+        text = (lambda s: f.write(s.encode())) if binary else f.write
+        text(header if header is not None else "")
+        if dims:
+            text(" ".join(str(d) for d in dat.shape) + " ")
+        if binary:
+            _write_binary_list(f, dat)
+        else:
+            _write_list(f, dat, fmt)
+        text(footer if footer is not None else "")
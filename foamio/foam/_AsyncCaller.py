@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import os
+import subprocess
+import time
+from typing import Iterable
+
+from foamio.foam._Caller import Caller
+from foamio.foam._profiling import CallProfile
+
+
+class AsyncCaller(Caller):
+    """OpenFOAM wrapper which runs applications as asyncio subprocesses with a
+    concurrency limit, e.g.:
+    - `await AsyncCaller().blockMesh(case=case)`
+    - `await asyncio.gather(*(AsyncCaller().Dictionary(...) for ...))`
+    - `await AsyncCaller().map('Dictionary', [dict(case=case) for ...])`
+
+    Keyword arguments of `subprocess.run` supported are `stdin`, `stdout`,
+    `stderr`, `capture_output`, `input`, `cwd`, `env`, `check`, `timeout`,
+    `text`, `encoding` and `errors`. Call profiles have no CPU time and peak
+    memory since asyncio reaps the processes.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def __semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit of the running event loop, a semaphore is bound to
+        the loop it is first used in, e.g. of each `asyncio.run`. Semaphores of
+        closed loops are dropped.
+        """
+
+        loop = asyncio.get_running_loop()
+        if loop not in self.__semaphores:
+            self.__semaphores = {
+                key: value
+                for key, value in self.__semaphores.items()
+                if not key.is_closed()
+            }
+            self.__semaphores[loop] = asyncio.Semaphore(
+                self.max_workers or os.cpu_count()
+            )
+        return self.__semaphores[loop]
+
+    async def _call(self, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess:
+        str_args, run_kwargs = self._command(cmd, *args, **kwargs)
+
+        check = run_kwargs.pop("check", False)
+        timeout = run_kwargs.pop("timeout", None)
+        data = run_kwargs.pop("input", None)
+        if run_kwargs.pop("capture_output", False):
+            run_kwargs |= dict(stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if data is not None:
+            run_kwargs["stdin"] = subprocess.PIPE
+
+        encoding = run_kwargs.pop("encoding", None)
+        errors = run_kwargs.pop("errors", None)
+        if run_kwargs.pop("text", False) or run_kwargs.pop("universal_newlines", False):
+            encoding = encoding or "utf-8"
+        if encoding is not None and isinstance(data, str):
+            data = data.encode(encoding, errors or "strict")
+
+        async with self.__semaphore():
+            logging.debug(f"calling `asyncio.create_subprocess_exec({str_args})`")
+            start, counter = time.time(), time.perf_counter()
+            process = await asyncio.create_subprocess_exec(*str_args, **run_kwargs)
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(data), timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(str_args, timeout)
+            finally:
+                if self.sinks and process.returncode is not None:
+                    profile = CallProfile(
+                        cmd,
+                        str_args,
+                        process.returncode,
+                        start,
+                        time.perf_counter() - counter,
+                    )
+                    for sink in self.sinks:
+                        sink(profile)
+
+        if encoding is not None:
+            stdout, stderr = (
+                None if stream is None else stream.decode(encoding, errors or "strict")
+                for stream in (stdout, stderr)
+            )
+
+        completed = subprocess.CompletedProcess(
+            str_args, process.returncode, stdout, stderr
+        )
+        if check:
+            completed.check_returncode()
+        return completed
+
+    def submit(self, cmd: str, *args, **kwargs) -> asyncio.Task:
+        """Schedule OpenFOAM application call in the running event loop.
+
+        Args:
+            cmd (str): application, capitalised names are prefixed with `foam`.
+
+        Returns:
+            asyncio.Task: task of the completed process.
+        """
+
+        return asyncio.ensure_future(
+            self._call(self._application(cmd), *args, **kwargs)
+        )
+
+    async def map(
+        self, cmd: str, calls: Iterable, **kwargs
+    ) -> list[subprocess.CompletedProcess]:
+        """Call OpenFOAM application for each call arguments concurrently.
+
+        Args:
+            cmd (str): application, capitalised names are prefixed with `foam`.
+            calls (Iterable): a dict of keyword arguments, a tuple of positional
+            arguments or a single positional argument per call.
+
+        Returns:
+            list[subprocess.CompletedProcess]: completed processes in the order
+            of calls.
+        """
+
+        return await asyncio.gather(
+            *(
+                self._call(self._application(cmd), *call_args, **call_kwargs)
+                for call_args, call_kwargs in self._calls(calls, **kwargs)
+            )
+        )
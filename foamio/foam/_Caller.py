@@ -1,12 +1,97 @@
+import concurrent.futures
+import hashlib
+import json
 import logging
 import os
+import shutil
 import subprocess
+import threading
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from foamio.foam._profiling import Sink, _run
+
+#: Resolved OpenFOAM environments per project directory
+_ENVIRONMENTS: dict[str, dict[str, str]] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def _environment(
+    project_dir: Path | str, cachedir: Path | str | None = None
+) -> dict[str, str]:
+    """OpenFOAM environment (`PATH`, `LD_LIBRARY_PATH`, `FOAM_*`, etc.) set by
+    `foamExec`. It is captured once per project directory and optionally
+    stored in the cache directory, validated by modification times of
+    `foamExec` and `etc/bashrc`.
+
+    Args:
+        project_dir (Path | str): OpenFOAM project directory.
+        cachedir (Path | str, optional): directory to store the environment
+        in. Defaults to None.
+
+    Raises:
+        subprocess.CalledProcessError: raised when `foamExec` fails.
+
+    Returns:
+        dict[str, str]: environment variables.
+    """
+
+    project_dir = str(project_dir)
+    with _ENVIRONMENTS_LOCK:
+        if project_dir in _ENVIRONMENTS:
+            return _ENVIRONMENTS[project_dir]
+
+        key = [
+            [str(path), path.stat().st_mtime_ns if path.is_file() else None]
+            for path in (
+                Path(project_dir, "bin", "foamExec"),
+                Path(project_dir, "etc", "bashrc"),
+            )
+        ]
+        fname = None
+        if cachedir is not None:
+            digest = hashlib.sha1(project_dir.encode("utf-8")).hexdigest()
+            fname = Path(cachedir) / f"environment.{digest[:16]}.json"
+            try:
+                with open(fname, encoding="utf-8") as f:
+                    cached = json.load(f)
+                if cached["key"] == key:
+                    _ENVIRONMENTS[project_dir] = cached["environment"]
+                    return _ENVIRONMENTS[project_dir]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        logging.debug("capturing OpenFOAM environment of %s", project_dir)
+        stdout = subprocess.run(
+            [f"{project_dir}/bin/./foamExec", "env", "-0"],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout
+        environment = dict(
+            line.split("=", 1)
+            for line in stdout.decode("utf-8", "surrogateescape").split("\0")
+            if "=" in line
+        )
+
+        if fname is not None:
+            try:
+                fname.parent.mkdir(parents=True, exist_ok=True)
+                tmp = fname.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(dict(key=key, environment=environment), f)
+                os.replace(tmp, fname)
+            except OSError as exception:
+                logging.debug("%s is not saved: %r", fname, exception)
+
+        _ENVIRONMENTS[project_dir] = environment
+        return environment
 
 
 class Caller:
-    """Naive OpenFOAM wrapper which uses `foamExec` through Python's
-    `subprocess`, e.g.:
+    """Naive OpenFOAM wrapper which runs OpenFOAM applications through Python's
+    `subprocess` in the environment captured once from `foamExec` (or through
+    `foamExec` itself in the compatibility mode), e.g.:
     - `Caller().Run(solver='incompressibleFluid')` will call
     `$ foamExec foamRun -solver incompressibleFluid`
     - `Caller().blockMesh()` will call `$ foamExec blockMesh`
@@ -15,7 +100,14 @@ class Caller:
     """
 
     def __init__(
-        self, wm_project_dir: str | Path = None, invert_args: bool = True, **kwargs
+        self,
+        wm_project_dir: str | Path = None,
+        invert_args: bool = True,
+        foam_exec: bool = False,
+        env_cache: str | Path | None = None,
+        max_workers: int | None = None,
+        profile: Sink | Iterable[Sink] | None = None,
+        **kwargs,
     ) -> None:
         """
         Forwards each keyword argument to `subprocess.run` besides specified
@@ -31,27 +123,129 @@ class Caller:
             or `Caller(invert_args=False).Dictionary('constant/polyMesh/boundary', set='entry0/front/type=wedge')`
             is calling `$ foamDictionary constant/polyMesh/boundary -set "entry0/front/type=wedge"`.
             Defaults to True.
+            foam_exec (bool, optional): prefix each call with `foamExec`,
+            which sources the OpenFOAM environment every time, instead of
+            running the application in the captured environment.
+            Defaults to False.
+            env_cache (str | Path, optional): directory to store the captured
+            environment in, so it is shared between processes.
+            Defaults to None.
+            max_workers (int, optional): maximum number of concurrent calls
+            of `submit` and `map`. Defaults to the number of CPUs.
+            profile (Sink | Iterable[Sink], optional): sinks of call profiles,
+            i.e. wall time, CPU time and peak memory from `wait4` and exit code,
+            e.g. `ProfileStats`, `JSONLinesSink` or `LoggingSink`.
+            Defaults to None.
         """
 
         self.project_dir = (
             self.__find_project_dir() if wm_project_dir is None else wm_project_dir
         )
         self.invert_args = invert_args
+        self.foam_exec = foam_exec
+        self.env_cache = env_cache
+        self.max_workers = max_workers
+        self.sinks = (
+            [] if profile is None else [profile] if callable(profile) else list(profile)
+        )
         self.__kwargs = kwargs
+        self.__executor = None
+        self.__executor_lock = threading.Lock()
 
     def __getattr__(self, cmd: str):
+        if cmd.startswith("__"):
+            raise AttributeError(cmd)
 
         def wrapper(*args, **kwargs):
-            # Calls are prepended with 'foam' since OpenFOAM uses lower-camel
-            # capitalised case
-            return self._call(
-                f"foam{cmd}" if cmd.istitle() else cmd,
-                *args,
-                **kwargs,
-            )
+            return self._call(self._application(cmd), *args, **kwargs)
 
         return wrapper
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @staticmethod
+    def _application(cmd: str) -> str:
+        # Calls are prepended with 'foam' since OpenFOAM uses lower-camel
+        # capitalised case
+        return f"foam{cmd}" if cmd.istitle() else cmd
+
+    @staticmethod
+    def _calls(calls: Iterable, **kwargs) -> Iterator[tuple[tuple, dict]]:
+        """Positional and keyword arguments of each call, which is either a
+        dict of keyword arguments, a tuple of positional arguments or a single
+        positional argument. The keyword arguments are common to all calls.
+        """
+
+        for call in calls:
+            if isinstance(call, dict):
+                yield (), kwargs | call
+            elif isinstance(call, (tuple, list)):
+                yield tuple(call), kwargs
+            else:
+                yield (call,), kwargs
+
+    def submit(
+        self, cmd: str, *args, **kwargs
+    ) -> concurrent.futures.Future[subprocess.CompletedProcess]:
+        """Call OpenFOAM application in the bounded worker pool, e.g.
+        `Caller().submit('Dictionary', 'system/controlDict', expand=True)`.
+
+        Args:
+            cmd (str): application, capitalised names are prefixed with `foam`.
+
+        Returns:
+            concurrent.futures.Future[subprocess.CompletedProcess]: future of
+            the completed process.
+        """
+
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers or os.cpu_count()
+                )
+        return self.__executor.submit(
+            self._call, self._application(cmd), *args, **kwargs
+        )
+
+    def map(
+        self, cmd: str, calls: Iterable, **kwargs
+    ) -> list[concurrent.futures.Future[subprocess.CompletedProcess]]:
+        """Call OpenFOAM application for each call arguments concurrently, e.g.
+        ```
+        Caller().map(
+            'Dictionary',
+            [dict(case=case, set='startTime=0') for case in cases],
+            entry='startTime',
+        )
+        ```
+
+        Args:
+            cmd (str): application, capitalised names are prefixed with `foam`.
+            calls (Iterable): a dict of keyword arguments, a tuple of positional
+            arguments or a single positional argument per call.
+
+        Returns:
+            list[concurrent.futures.Future[subprocess.CompletedProcess]]:
+            futures of the completed processes in the order of calls.
+        """
+
+        return [
+            self.submit(cmd, *call_args, **call_kwargs)
+            for call_args, call_kwargs in self._calls(calls, **kwargs)
+        ]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the worker pool down, it is started again on the next call."""
+
+        with self.__executor_lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
     @staticmethod
     def __find_project_dir() -> Path:
         """Find an OpenFOAM project by using the `WM_PROJECT_DIR` environment
@@ -84,13 +278,36 @@ class Caller:
 
         return args
 
-    def _call(self, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess[int]:
-        str_args = [f"{self.project_dir}/bin/./foamExec", cmd]
+    @property
+    def environment(self) -> dict[str, str]:
+        """OpenFOAM environment of the project directory."""
+
+        return _environment(self.project_dir, self.env_cache)
+
+    def _command(self, cmd: str, *args, **kwargs) -> tuple[list[str], dict]:
+        """Arguments and keyword arguments of `subprocess.run` to call an
+        OpenFOAM application.
+        """
+
+        str_args = (
+            [f"{self.project_dir}/bin/./foamExec", cmd] if self.foam_exec else [cmd]
+        )
         if not self.invert_args:
             str_args += [str(arg) for arg in args] + self.__convert_kwargs(**kwargs)
         else:
             str_args += self.__convert_kwargs(**kwargs) + [str(arg) for arg in args]
 
-        # print(*str_args, sep=' ')
+        run_kwargs = dict(self.__kwargs)
+        if not self.foam_exec:
+            env = self.environment | (run_kwargs.get("env") or {})
+            str_args[0] = shutil.which(cmd, path=env.get("PATH")) or cmd
+            run_kwargs["env"] = env
+        return str_args, run_kwargs
+
+    def _call(self, cmd: str, *args, **kwargs) -> subprocess.CompletedProcess[int]:
+        str_args, run_kwargs = self._command(cmd, *args, **kwargs)
+
         logging.debug(f"calling `subprocess.run({str_args})`")
-        return subprocess.run(str_args, **self.__kwargs)
+        if self.sinks:
+            return _run(str_args, cmd, self.sinks, **run_kwargs)
+        return subprocess.run(str_args, **run_kwargs)
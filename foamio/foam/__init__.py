@@ -1,4 +1,32 @@
+from foamio.foam._AsyncCaller import AsyncCaller
 from foamio.foam._Caller import Caller
+from foamio.foam._edit import set_many, set_many_cases
+from foamio.foam._field import Field, read_field, write_field
 from foamio.foam._foam import read
+from foamio.foam._mesh import Mesh, read_mesh
+from foamio.foam._profiling import (
+    CallProfile,
+    JSONLinesSink,
+    LoggingSink,
+    ProfileStats,
+)
+from foamio.foam._quality import MeshQuality, check_mesh
 
-__all__ = ["Caller", "read"]
+__all__ = [
+    "AsyncCaller",
+    "CallProfile",
+    "Caller",
+    "Field",
+    "JSONLinesSink",
+    "LoggingSink",
+    "Mesh",
+    "MeshQuality",
+    "ProfileStats",
+    "check_mesh",
+    "read",
+    "read_field",
+    "read_mesh",
+    "set_many",
+    "set_many_cases",
+    "write_field",
+]
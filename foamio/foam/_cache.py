@@ -0,0 +1,124 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+#: Maximum number of dictionaries kept in memory
+CACHE_SIZE = 128
+
+
+def _signatures(dependencies: list[Path]) -> list[list]:
+    """Paths of the files with their modification time and size, None for the
+    files which are not present.
+    """
+
+    signatures = []
+    for path in dependencies:
+        try:
+            stat = os.stat(path)
+            signatures.append([str(path), stat.st_mtime_ns, stat.st_size])
+        except FileNotFoundError:
+            signatures.append([str(path), None, None])
+    return signatures
+
+
+def _is_valid(signatures: list[list]) -> bool:
+    return _signatures([Path(path) for path, *_ in signatures]) == signatures
+
+
+class _Cache:
+    """LRU cache of read dictionaries validated by modification times of the
+    dictionary files and their `#include`d dependencies, optionally backed by
+    JSON files shared between processes.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.__entries: OrderedDict[tuple, tuple[list, dict]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __get(self, key: tuple, cachedir: Path | None) -> dict | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+        if entry is None and cachedir is not None:
+            fname = cachedir / f"{self.__hash(key)}.json"
+            try:
+                with open(fname, encoding="utf-8") as f:
+                    entry = tuple(json.load(f))
+                logging.debug("%s is read from %s", key[0], fname)
+            except (OSError, ValueError):
+                entry = None
+
+        if entry is None or not _is_valid(entry[0]):
+            return None
+        self.__put(key, entry)
+        return entry[1]
+
+    def __put(self, key: tuple, entry: tuple[list, dict]) -> None:
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    @staticmethod
+    def __hash(key: tuple) -> str:
+        return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+    def __call__(
+        self,
+        key: tuple,
+        func: Callable[[], dict],
+        dependencies: Callable[[], list[Path]],
+        cache: bool | Path | str = True,
+    ) -> dict:
+        """Get the cached dictionary or read and cache it.
+
+        Args:
+            key (tuple): cache key starting with the resolved dictionary path.
+            func (Callable[[], dict]): reads the dictionary.
+            dependencies (Callable[[], list[Path]]): lists the dictionary file
+            and its dependencies.
+            cache (bool | Path | str, optional): directory of the on-disk tier,
+            memory only if True. Defaults to True.
+
+        Returns:
+            dict: copy of the dictionary.
+        """
+
+        cachedir = None if cache is True else Path(cache)
+        value = self.__get(key, cachedir)
+        if value is None:
+            # Signatures are taken before reading, so files modified meanwhile
+            # are read again next time
+            signatures = _signatures(dependencies())
+            value = func()
+            self.__put(key, (signatures, value))
+
+            if cachedir is not None:
+                fname = cachedir / f"{self.__hash(key)}.json"
+                try:
+                    cachedir.mkdir(parents=True, exist_ok=True)
+                    tmp = fname.with_suffix(f".{os.getpid()}.tmp")
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        json.dump([signatures, value], f)
+                    os.replace(tmp, fname)
+                except (OSError, TypeError) as exception:
+                    logging.debug("%s is not saved: %r", fname, exception)
+        return copy.deepcopy(value)
+
+
+#: Cache of `foam.read`
+_CACHE = _Cache()
@@ -0,0 +1,62 @@
+import concurrent.futures
+import re
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+from foamio.foam._foamfile import _read_foam_file
+
+#: Types of patches between processors, removed on reconstruction
+PROCESSOR_PATCHES = ("processor", "processorCyclic")
+
+
+def _case(path: Path | str) -> Path:
+    """Decomposed case of the path, the nearest directory with `processor0`.
+
+    Raises:
+        FileNotFoundError: raised when no directory has `processor0`.
+    """
+
+    path = Path(path).resolve()
+    for case in (path, *path.parents):
+        if (case / "processor0").is_dir():
+            return case
+        if any(case.glob("processors*")):
+            raise NotImplementedError(f"collated {case} is not supported")
+    raise FileNotFoundError(f"no decomposed case (processor0/) of {path}")
+
+
+def _processors(case: Path) -> list[Path]:
+    """`processorN` directories of the case in the order of N."""
+
+    processors = [
+        path
+        for path in case.iterdir()
+        if re.fullmatch(r"processor\d+", path.name) and path.is_dir()
+    ]
+    return sorted(processors, key=lambda path: int(path.name[9:]))
+
+
+def _map(function: Callable, calls: Iterable[tuple], max_workers: int | None) -> list:
+    """Results of the calls in processes, in-process if `max_workers` is 1 to
+    keep binary lists memory-mapped.
+    """
+
+    calls = list(calls)
+    if max_workers == 1 or len(calls) < 2:
+        return [function(*args) for args in calls]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(function, *zip(*calls)))
+
+
+def _addressing(mesh_dir: Path, name: str) -> np.ndarray:
+    """Processor-to-global addressing, e.g. `cellProcAddressing`."""
+
+    _, entries = _read_foam_file(Path(mesh_dir) / name, kind="label")
+    return entries[None][0]
+
+
+def _is_processor(patch: dict) -> bool:
+    return patch.get("type") in PROCESSOR_PATCHES
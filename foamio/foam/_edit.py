@@ -0,0 +1,280 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from foamio.foam._parser import Token, _tokenise
+
+#: Width of keywords of inserted entries as OpenFOAM writes them
+KEYWORD_WIDTH = 16
+
+
+@dataclass
+class _Span:
+    """Span of an entry value, the body between braces of a dictionary."""
+
+    key: Token
+    start: int
+    end: int
+    entries: dict | None = None
+
+
+def __scan(tokens: list[Token], pos: int = 0) -> tuple[dict[str, _Span], int]:
+    """Spans of the entries until the closing brace or the end of tokens,
+    directives and `$var` merges are skipped.
+    """
+
+    entries = {}
+    while pos < len(tokens) and tokens[pos].text != "}":
+        token = tokens[pos]
+        following = tokens[pos + 1].text if pos + 1 < len(tokens) else None
+        if token.kind == "directive" or (token.kind == "variable" and following == ";"):
+            pos += 2
+            if following == "(":
+                while pos < len(tokens) and tokens[pos - 1].text != ")":
+                    pos += 1
+            continue
+
+        if following == "{":
+            sub, end = __scan(tokens, pos + 2)
+            if end == len(tokens):
+                raise ValueError(f"'}}' expected to close {token.text}")
+            entries[token.text] = _Span(
+                token, tokens[pos + 1].end, tokens[end].start, sub
+            )
+            pos = end + 1
+            continue
+
+        end, depth = pos + 1, 0
+        while end < len(tokens) and (tokens[end].text != ";" or depth):
+            if tokens[end].kind == "punct":
+                depth += tokens[end].text in "([{"
+                depth -= tokens[end].text in ")]}"
+            end += 1
+        if end == len(tokens):
+            raise ValueError(f"';' expected after {token.text}")
+
+        entries[token.text] = _Span(
+            token,
+            tokens[pos + 1].start if end > pos + 1 else tokens[end].start,
+            tokens[end - 1].end if end > pos + 1 else tokens[end].start,
+        )
+        pos = end + 1
+    return entries, pos
+
+
+def _format(value) -> str:
+    """Format Python value as OpenFOAM entry value, e.g. `(0 0 1)` of a
+    sequence or `true` of a boolean.
+    """
+
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return "(" + " ".join(_format(item) for item in value) + ")"
+    return str(value)
+
+
+def __flatten(entries: dict, prefix: str = "") -> dict[str, object]:
+    """Flatten nested dictionaries to `a/b` keyword paths."""
+
+    flat = {}
+    for key, value in entries.items():
+        if isinstance(value, dict) and value:
+            flat |= __flatten(value, f"{prefix}{key}/")
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def __indent(text: str, pos: int) -> str:
+    """Indentation of the line at the position."""
+
+    start = text.rfind("\n", 0, pos) + 1
+    return text[start : start + len(text[start:pos]) - len(text[start:pos].lstrip())]
+
+
+def __block(entries: dict, indent: str) -> str:
+    """Lines of entries, nested dicts are written as enclosing dictionaries."""
+
+    lines = []
+    for key, value in entries.items():
+        if isinstance(value, dict):
+            lines.append(
+                f"{indent}{key}\n{indent}{{\n"
+                + __block(value, indent + "    ")
+                + f"{indent}}}\n"
+            )
+        else:
+            lines.append(f"{indent}{key.ljust(KEYWORD_WIDTH - 1)} {_format(value)};\n")
+    return "".join(lines)
+
+
+def __insert(tree: dict, keys: list[str], value) -> None:
+    """Add the value to the tree of missing entries by its keyword path."""
+
+    for i, key in enumerate(keys[:-1]):
+        tree = tree.setdefault(key, {})
+        if not isinstance(tree, dict):
+            raise ValueError(f"{'/'.join(keys[: i + 1])} is not a dictionary")
+    tree[keys[-1]] = value
+
+
+def __edits(
+    text: str, tokens: list[Token], entries: dict[str, object]
+) -> list[tuple[int, int, str]]:
+    """Replacements of the text spans by the entry values of one scan of the
+    tokens, missing entries are appended to their enclosing dictionaries.
+    """
+
+    spans, _ = __scan(tokens)
+
+    # Top-level entries are appended after the last entry
+    top = text.find("\n", tokens[-1].end) + 1 if tokens else len(text)
+
+    edits, inserts = [], {}
+    for path, value in entries.items():
+        keys = path.split("/")
+        scope, close, indent, nested = spans, top, "", False
+        for i, key in enumerate(keys):
+            span = scope.get(key, scope.get(f'"{key}"'))
+            if span is None:
+                __insert(
+                    inserts.setdefault(close, (indent, nested, {}))[2], keys[i:], value
+                )
+                break
+
+            if i == len(keys) - 1:
+                if span.entries is None:
+                    edits.append((span.start, span.end, _format(value)))
+                else:
+                    # Dictionary is replaced by the value
+                    edits.append(
+                        (
+                            span.key.end,
+                            span.end + 1,
+                            " " * max(KEYWORD_WIDTH - len(span.key.text), 1)
+                            + _format(value)
+                            + ";",
+                        )
+                    )
+                break
+
+            if span.entries is None:
+                raise ValueError(f"{'/'.join(keys[: i + 1])} is not a dictionary")
+
+            first = next(iter(span.entries.values()), None)
+            indent = (
+                __indent(text, first.key.start)
+                if first is not None
+                else __indent(text, span.key.start) + "    "
+            )
+            scope, close, nested = span.entries, span.end, True
+
+    for close, (indent, nested, tree) in inserts.items():
+        # Insert before the closing brace on its own line
+        head = text[text.rfind("\n", 0, close) + 1 : close]
+        if nested and head.strip():
+            block = "\n" + __block(tree, indent) + __indent(text, close)
+        else:
+            close -= len(head) if nested else 0
+            block = __block(tree, indent)
+        edits.append((close, close, block))
+    return sorted(edits, key=lambda edit: edit[:2])
+
+
+def set_many(
+    case: Path | str,
+    fname: Path | str,
+    entries: dict,
+    *,
+    encoding: str = "utf-8",
+) -> None:
+    """Set OpenFOAM dictionary entries in one pass, keeping comments and
+    formatting of the rest of the file, e.g.
+    `set_many(case, 'system/controlDict', {'endTime': 1, 'functions/probes/fields': ['p', 'U']})`.
+    The file is tokenised once and the edits of all entries are spliced in
+    together. Missing entries and dictionaries are appended. The file is
+    replaced atomically.
+
+    Args:
+        case (Path | str): FOAM_CASE path.
+        fname (Path | str): path to OpenFOAM dictionary relative to the case.
+        entries (dict): values by `a/b` keyword paths or nested dicts.
+        encoding (str, optional): encoding. Defaults to "utf-8".
+
+    Raises:
+        ValueError: raised when an enclosing entry is not a dictionary or
+        entries overlap, e.g. a dictionary and one of its entries.
+    """
+
+    fname = Path(case) / fname
+    with open(fname, encoding=encoding) as f:
+        text = f.read()
+
+    tokens = _tokenise(text)
+    if tokens and text.find("\n", tokens[-1].end) < 0:
+        text += "\n"
+
+    edits = __edits(text, tokens, __flatten(entries))
+    for (_, end, _), (start, _, _) in zip(edits, edits[1:]):
+        if end > start:
+            raise ValueError(f"entries of {fname} overlap")
+
+    pieces, pos = [], 0
+    for start, end, replacement in edits:
+        pieces += [text[pos:start], replacement]
+        pos = end
+    text = "".join(pieces) + text[pos:]
+
+    with tempfile.NamedTemporaryFile(
+        "w", encoding=encoding, dir=fname.parent, prefix=f".{fname.name}.", delete=False
+    ) as tmp:
+        tmp.write(text)
+    try:
+        shutil.copymode(fname, tmp.name)
+        os.replace(tmp.name, fname)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def set_many_cases(
+    cases: Iterable[Path | str],
+    fname: Path | str,
+    entries: dict | list[dict],
+    *,
+    encoding: str = "utf-8",
+    max_workers: int | None = None,
+) -> None:
+    """Set OpenFOAM dictionary entries of many cases in parallel processes.
+
+    Args:
+        cases (Iterable[Path | str]): FOAM_CASE paths.
+        fname (Path | str): path to OpenFOAM dictionary relative to the cases.
+        entries (dict | list[dict]): entries of all cases or of each case.
+        encoding (str, optional): encoding. Defaults to "utf-8".
+        max_workers (int, optional): number of processes.
+        Defaults to the number of CPUs.
+    """
+
+    cases = list(cases)
+    if isinstance(entries, dict):
+        entries = [entries] * len(cases)
+    if len(entries) != len(cases):
+        raise ValueError(f"{len(entries)} entries for {len(cases)} cases")
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(set_many, case, fname, case_entries, encoding=encoding)
+            for case, case_entries in zip(cases, entries)
+        ]
+        for future in futures:
+            future.result()
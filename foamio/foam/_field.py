@@ -0,0 +1,323 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from foamio.dat._writer import _open, _write_binary_list, _write_list
+from foamio.foam._decomposed import (
+    _addressing,
+    _case,
+    _is_processor,
+    _map,
+    _processors,
+)
+from foamio.foam._edit import KEYWORD_WIDTH, _format
+from foamio.foam._foamfile import NCOMPONENTS, _kind, _read_foam_file
+from foamio.foam._mesh import _mesh_dir
+
+
+@dataclass
+class Field:
+    """OpenFOAM field, e.g. `0/U`.
+
+    Attributes:
+        header (dict): FoamFile header entries.
+        dimensions (np.ndarray): dimension exponents.
+        internal (np.ndarray): internal field of shape (ncells,) or
+        (ncells, ncomponents), a single value of uniform fields.
+        boundary (dict[str, dict]): patch entries, `value`s are arrays.
+        entries (dict): other entries.
+    """
+
+    header: dict
+    dimensions: np.ndarray | None
+    internal: np.ndarray
+    boundary: dict[str, dict] = field(default_factory=dict)
+    entries: dict = field(default_factory=dict)
+
+
+def read_field(
+    path: Path | str,
+    *,
+    decomposed: bool = False,
+    reconstruct: bool = True,
+    max_workers: int | None = None,
+) -> Field | list[Field]:
+    """Read OpenFOAM field of a time directory as NumPy arrays. Binary lists
+    are memory-mapped without copying (the arrays are read-only), ASCII lists
+    are converted at once and gzipped (`writeCompression on;`) files are
+    decompressed in-process, `<path>.gz` is read if the path does not exist.
+    Fields of decomposed cases (`processorN/<time>/<field>`) are read in
+    parallel processes and reconstructed by `cellProcAddressing` and
+    `faceProcAddressing`.
+
+    Args:
+        path (Path | str): path to the field, e.g. `case/0/U`.
+        decomposed (bool, optional): read the field of processors of the case.
+        Defaults to False.
+        reconstruct (bool, optional): reconstruct the global field of a
+        decomposed case, otherwise return fields of processors.
+        Defaults to True.
+        max_workers (int, optional): number of processes reading a
+        decomposed case, it is read in-process (keeping binary lists
+        memory-mapped) if 1. Defaults to the number of CPUs.
+
+    Raises:
+        NotImplementedError: raised on binary lists of unsupported types or
+        collated decomposed cases.
+        FileNotFoundError: raised when the case is not decomposed.
+
+    Returns:
+        Field | list[Field]: header, dimensions, internal and boundary
+        fields, or fields of processors.
+    """
+
+    if decomposed:
+        case = _case(Path(path).parent)
+        name = Path(path).resolve().relative_to(case)
+        region = "/".join(name.parts[1:-1]) or None
+        calls = [
+            (processor / name, _mesh_dir(processor, region) if reconstruct else None)
+            for processor in _processors(case)
+        ]
+        parts = _map(__load, calls, max_workers)
+        return __reconstruct(parts) if reconstruct else parts
+
+    header, entries = _read_foam_file(path)
+    return Field(
+        header=header,
+        dimensions=entries.pop("dimensions", None),
+        internal=entries.pop("internalField", None),
+        boundary=entries.pop("boundaryField", {}),
+        entries=entries,
+    )
+
+
+def __load(path: Path, mesh_dir: Path | None) -> Field | tuple:
+    """Processor field with its cell and face addressing and patches."""
+
+    field = read_field(path)
+    if mesh_dir is None:
+        return field
+
+    _, entries = _read_foam_file(mesh_dir / "boundary")
+    boundary = entries.get(None, [{}])[0]
+    return (
+        field,
+        _addressing(mesh_dir, "cellProcAddressing"),
+        _addressing(mesh_dir, "faceProcAddressing"),
+        boundary,
+    )
+
+
+def __assemble(
+    values: list, addressing: list[np.ndarray], size: int, shape: tuple
+) -> np.ndarray:
+    """Global values of processors by their addressing, uniform values are
+    broadcast and kept uniform if all of them are equal.
+    """
+
+    arrays = [np.asarray(value) for value in values]
+    if all(array.shape == shape for array in arrays) and all(
+        np.array_equal(arrays[0], array) for array in arrays[1:]
+    ):
+        return values[0]
+
+    result = np.empty((size, *shape), dtype=np.result_type(*arrays))
+    for array, index in zip(arrays, addressing):
+        result[index] = array
+    return result
+
+
+def __reconstruct(parts: list[tuple]) -> Field:
+    """Global field of processor fields, patches between processors are
+    removed.
+    """
+
+    first = parts[0][0]
+    ncomp = NCOMPONENTS.get(_kind(str(first.header.get("class", ""))), 1)
+    shape = (ncomp,) if ncomp > 1 else ()
+
+    cells = [cpa for _, cpa, _, _ in parts]
+    internal = __assemble(
+        [field.internal for field, *_ in parts], cells, sum(map(len, cells)), shape
+    )
+
+    boundary = {}
+    for name, entries in first.boundary.items():
+        patches = [mesh_boundary.get(name) for *_, mesh_boundary in parts]
+        if any(patch is not None and _is_processor(patch) for patch in patches):
+            continue
+        if any(patch is None for patch in patches):  # e.g. ".*" entries
+            boundary[name] = entries
+            continue
+
+        # Faces of the global patch by faces of processors' patches
+        faces = []
+        for (_, _, fpa, _), patch in zip(parts, patches):
+            start = int(patch["startFace"])
+            faces.append(np.abs(fpa[start : start + int(patch["nFaces"])]) - 1)
+        start = min((int(f.min()) for f in faces if len(f)), default=0)
+        faces = [f - start for f in faces]
+
+        boundary[name] = dict(entries)
+        for key in entries:
+            values = [field.boundary[name].get(key) for field, *_ in parts]
+            if any(
+                isinstance(value, np.ndarray)
+                and value.shape == (len(index), *shape)
+                and value.ndim > len(shape)
+                for value, index in zip(values, faces)
+            ):
+                boundary[name][key] = __assemble(
+                    values, faces, sum(map(len, faces)), shape
+                )
+
+    return Field(
+        header=first.header,
+        dimensions=first.dimensions,
+        internal=internal,
+        boundary=boundary,
+        entries=first.entries,
+    )
+
+
+#: OpenFOAM primitive types by number of components
+KINDS = {1: "scalar", 3: "vector", 6: "symmTensor", 9: "tensor"}
+
+
+def __kind(values: np.ndarray, label: bool = False) -> str:
+    """Primitive type of the list items by their shape, e.g. `vector` of
+    shape (N, 3), integers are scalars unless `label`.
+    """
+
+    if label:
+        return "label"
+    ncomp = values.shape[1] if values.ndim > 1 else 1
+    if ncomp not in KINDS:
+        raise ValueError(f"{ncomp} components are not supported")
+    return KINDS[ncomp]
+
+
+def write_field(
+    path: Path | str,
+    internal,
+    boundary: dict[str, dict] | None = None,
+    *,
+    dimensions=(0, 0, 0, 0, 0, 0, 0),
+    field_class: str | None = None,
+    format: str = "binary",
+    compression: bool = False,
+    compresslevel: int = 6,
+    threads: int | None = 1,
+    fmt: str = "%.9g",
+) -> Path:
+    """Write OpenFOAM field with NumPy arrays as lists, binary lists are
+    written straight from the array buffers, e.g.
+    ```
+    write_field(
+        'case/0/U',
+        U,  # of shape (ncells, 3)
+        {'inlet': {'type': 'fixedValue', 'value': U_inlet}, 'outlet': {'type': 'zeroGradient'}},
+        dimensions=(0, 1, -1, 0, 0, 0, 0),
+    )
+    ```
+
+    Args:
+        path (Path | str): path to the field, e.g. `case/0/U`.
+        internal: internal field values of shape (ncells,) or
+        (ncells, ncomponents), a number or a tuple (e.g. `(1, 0, 0)`) is
+        written as uniform.
+        boundary (dict[str, dict], optional): entries of patches, arrays are
+        written as nonuniform lists, other values as they are, e.g.
+        `'uniform 0'`. Defaults to None.
+        dimensions (Sequence, optional): dimension exponents.
+        Defaults to dimensionless.
+        field_class (str, optional): class of the field, values are written
+        as labels if it is a label field (e.g. `volLabelField`) only.
+        Defaults to `vol<Type>Field` by the shape of the internal field.
+        format (str, optional): "binary" or "ascii". Defaults to "binary".
+        compression (bool, optional): gzip the field to `<path>.gz`.
+        Defaults to False.
+        compresslevel (int, optional): gzip compression level. Defaults to 6.
+        threads (int, optional): gzip compression threads, all CPUs if None.
+        Defaults to 1.
+        fmt (str, optional): value format of "ascii" format.
+        Defaults to "%.9g".
+
+    Raises:
+        ValueError: raised when the format or number of components is not
+        supported.
+
+    Returns:
+        Path: path to the written field.
+    """
+
+    if format not in ("ascii", "binary"):
+        raise ValueError(f"{format=} is not supported, use 'ascii' or 'binary'")
+
+    path = Path(path)
+    if compression and path.suffix != ".gz":
+        path = path.with_name(path.name + ".gz")
+    binary = format == "binary"
+    is_uniform = isinstance(internal, tuple) or np.ndim(internal) == 0
+    label = field_class is not None and _kind(field_class) == "label"
+    internal = np.asarray(internal, dtype=None if label else float)
+    if field_class is None:
+        kind = __kind(internal.reshape(1, -1) if is_uniform else internal)
+        field_class = f"vol{kind[0].upper()}{kind[1:]}Field"
+
+    name = path.name.removesuffix(".gz")
+    header = (
+        "FoamFile\n{\n"
+        "    version     2.0;\n"
+        f"    format      {format};\n"
+        '    arch        "LSB;label=32;scalar=64";\n'
+        f"    class       {field_class};\n"
+        f'    location    "{path.parent.name}";\n'
+        f"    object      {name};\n"
+        "}\n\n"
+        f"dimensions      [{' '.join(_format(d) for d in dimensions)}];\n\n"
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open(path, "wb" if binary else "w", compression, compresslevel, threads) as f:
+        text = (lambda s: f.write(s.encode())) if binary else f.write
+
+        def _value(values) -> None:
+            if not isinstance(values, np.ndarray):
+                text(f" {_format(values)};\n")
+                return
+            if not label:
+                values = values.astype(float, copy=False)
+            if values.ndim == 0:
+                text(f" {_format(values.item())};\n")
+                return
+
+            kind = __kind(values, label)
+            text(f" nonuniform List<{kind}>")
+            if binary:
+                dtype = "<i4" if kind == "label" else "<f8"
+                _write_binary_list(f, values, dtype, values.ndim)
+            else:
+                text(f"\n{len(values)}\n")
+                _write_list(f, values, "%d" if kind == "label" else fmt, sep="\n")
+            text(";\n")
+
+        text(header)
+        text("internalField  ")
+        if is_uniform:
+            value = tuple(internal.ravel()) if internal.ndim else internal.item()
+            text(f" uniform {_format(value)};\n")
+        else:
+            _value(internal)
+
+        text("\nboundaryField\n{\n")
+        for patch, entries in (boundary or {}).items():
+            text(f"    {patch}\n    {{\n")
+            for key, value in entries.items():
+                text(f"        {key.ljust(KEYWORD_WIDTH - 1)}")
+                _value(value)
+            text("    }\n")
+        text("}\n")
+    return path
@@ -1,7 +1,10 @@
+import logging
 import subprocess
 from pathlib import Path
 
 from foamio.foam import Caller
+from foamio.foam._cache import _CACHE
+from foamio.foam._parser import _dependencies, _Parser, _render
 
 
 def _convert(value: str) -> str | list:
@@ -24,21 +27,19 @@ def _convert(value: str) -> str | list:
         return value
 
 
-def read(root: Path | str, fname: Path | str, *, encoding: str = "utf-8") -> dict:
-    """Read OpenFOAM dictionary file as Python dictionary using
-    `foamDictionary`.
+def __values(entries: dict) -> dict:
+    """Convert parsed value tokens as `foamDictionary -value` prints them."""
 
-    Args:
-        root (Path | str): FOAM_CASE path
-        fname (Path | str): Path to OpenFOAM dictionary
-        encoding (str, optional): encoding. Defaults to 'utf-8'.
+    return {
+        key: __values(value) if isinstance(value, dict) else _convert(_render(value))
+        for key, value in entries.items()
+    }
 
-    Returns:
-        dict: OpenFOAM dictionary converted to Python `dict`
-    """
 
-    root = Path(root).resolve()
-    fname = Path(fname).resolve().relative_to(root)
+def _read_keywords(root: Path, fname: Path, encoding: str = "utf-8") -> dict:
+    """Read OpenFOAM dictionary calling `foamDictionary -keywords` and
+    `foamDictionary -value` for each entry.
+    """
 
     def _read(entry: str) -> str | dict | list:
         """Read key's value.
@@ -74,3 +75,73 @@ def read(root: Path | str, fname: Path | str, *, encoding: str = "utf-8") -> dic
         .Dictionary(fname, case=root, keywords=True)
         .stdout.splitlines()
     }
+
+
+def _read_expanded(root: Path, fname: Path, encoding: str = "utf-8") -> dict:
+    """Read OpenFOAM dictionary expanded by a single `foamDictionary -expand`
+    call, its output is parsed in memory.
+    """
+
+    text = (
+        Caller(encoding=encoding, check=True, stdout=subprocess.PIPE)
+        .Dictionary(fname, case=root, expand=True)
+        .stdout
+    )
+    return __values(_Parser(root, encoding).parse(root / fname, text=text))
+
+
+def read(
+    root: Path | str,
+    fname: Path | str,
+    *,
+    encoding: str = "utf-8",
+    mode: str = "parse",
+    cache: bool | Path | str = False,
+) -> dict:
+    """Read OpenFOAM dictionary file as Python dictionary.
+
+    Args:
+        root (Path | str): FOAM_CASE path
+        fname (Path | str): Path to OpenFOAM dictionary
+        encoding (str, optional): encoding. Defaults to 'utf-8'.
+        mode (str, optional): "parse" to parse the dictionary in-process
+        expanding `#include`, `#remove` and `$var` entries, dictionaries with
+        code (`#calc`, `#codeStream`) are read by "expand" mode; "expand" to
+        parse output of a single `foamDictionary -expand` call; "keywords" to
+        call `foamDictionary` for each entry. Defaults to "parse".
+        cache (bool | Path | str, optional): keep read dictionaries in an LRU
+        cache validated by modification times of the file and its `#include`d
+        files, and as JSON files in the given directory shared between
+        processes. Defaults to False.
+
+    Raises:
+        ValueError: raised when the mode is not supported.
+
+    Returns:
+        dict: OpenFOAM dictionary converted to Python `dict`
+    """
+
+    root = Path(root).resolve()
+    fname = Path(fname).resolve().relative_to(root)
+
+    if cache:
+        return _CACHE(
+            (str(root / fname), mode, encoding),
+            lambda: read(root, root / fname, encoding=encoding, mode=mode),
+            lambda: _dependencies(root / fname, root, encoding),
+            cache,
+        )
+
+    if mode == "parse":
+        try:
+            return __values(_Parser(root, encoding).parse(root / fname))
+        except NotImplementedError as exception:
+            logging.debug("%s is read by foamDictionary: %s", fname, exception)
+            mode = "expand"
+
+    if mode == "expand":
+        return _read_expanded(root, fname, encoding)
+    if mode == "keywords":
+        return _read_keywords(root, fname, encoding)
+
+    raise ValueError(f"{mode=} is not supported, use 'parse', 'expand' or 'keywords'")
@@ -0,0 +1,432 @@
+import gzip
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from foamio.foam._foam import _convert
+
+SKIP_PATTERN = re.compile(rb"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.DOTALL)
+TOKEN_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}()\[\];]|[^\s;{}()\[\]"]+')
+LABEL_PATTERN = re.compile(rb"\d+")
+LIST_END_PATTERN = re.compile(rb"\)\s*\)")
+UNNEST_TABLE = bytes.maketrans(b"()", b"  ")
+
+#: Number of bytes of ASCII faces converted at once
+FACES_CHUNK_SIZE = 1 << 26
+
+#: Number of decompressed bytes of gzipped files to look for the header in
+HEADER_SIZE = 1 << 16
+
+#: Number of components of OpenFOAM primitive types
+NCOMPONENTS = {
+    "label": 1,
+    "scalar": 1,
+    "bool": 1,
+    "vector": 3,
+    "sphericalTensor": 1,
+    "symmTensor": 6,
+    "tensor": 9,
+}
+
+
+@dataclass(frozen=True)
+class _Format:
+    """Binary format of lists set by `format` and `arch` of the FoamFile
+    header, e.g. `arch "LSB;label=32;scalar=64";`.
+    """
+
+    binary: bool = False
+    label: np.dtype = np.dtype("<i4")
+    scalar: np.dtype = np.dtype("<f8")
+
+    @classmethod
+    def from_header(cls, header: dict) -> "_Format":
+        arch = str(header.get("arch", "")).strip('"')
+        order = ">" if "MSB" in arch else "<"
+        label = re.search(r"label=(\d+)", arch)
+        scalar = re.search(r"scalar=(\d+)", arch)
+        return cls(
+            binary=header.get("format") == "binary",
+            label=np.dtype(f"{order}i{int(label[1]) // 8 if label else 4}"),
+            scalar=np.dtype(f"{order}f{int(scalar[1]) // 8 if scalar else 8}"),
+        )
+
+    def dtype(self, kind: str | None) -> np.dtype:
+        if kind == "label":
+            return self.label
+        if kind == "bool":
+            return np.dtype("u1")
+        return self.scalar
+
+
+def _kind(name: str) -> str | None:
+    """Primitive type of a list (`List<vector>`) or a field class
+    (`volVectorField`, `labelList`, `vectorField`).
+    """
+
+    if name.startswith("List<") and name.endswith(">"):
+        kind = name[5:-1]
+        return kind if kind in NCOMPONENTS or kind == "word" else None
+    if name == "faceList":
+        return "face"
+    if name == "faceCompactList":
+        return "label"
+
+    for kind in sorted(NCOMPONENTS, key=len, reverse=True):
+        if kind in name or kind.capitalize() in name:
+            return kind
+    return None
+
+
+def _values(text: bytes, dtype: np.dtype) -> np.ndarray:
+    """Convert ASCII numbers separated by whitespace or parentheses, the tokens
+    are split first as `np.fromstring` is deprecated and, before numpy 2.3,
+    stops at unmatched data with a warning only.
+    """
+
+    return np.array(text.translate(UNNEST_TABLE).split(), dtype=dtype)
+
+
+def _is_number(token: bytes) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _open(path: Path, size: int = -1) -> bytes | mmap.mmap:
+    """Memory-map the file or decompress a gzipped one (`writeCompression on`),
+    its first `size` bytes only if set. `<path>.gz` is read if the path does
+    not exist.
+    """
+
+    path = Path(path)
+    if not path.exists() and path.with_name(path.name + ".gz").exists():
+        path = path.with_name(path.name + ".gz")
+
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return f.read(size)
+
+    with open(path, "rb") as f:
+        if not path.stat().st_size:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _Scanner:
+    """Scanner of OpenFOAM files with large lists, e.g. fields or polyMesh.
+    Sized lists are read as NumPy arrays: binary ones without copying the
+    buffer, ASCII ones by a single vectorised conversion.
+    """
+
+    def __init__(self, buf: bytes | mmap.mmap, kind: str | None = None) -> None:
+        self.buf = buf
+        self.kind = kind
+        self.format = _Format()
+        self.cls = None
+
+    def __index(self, sub: bytes, pos: int) -> int:
+        """Position of the subsequence, `mmap` has no `index`."""
+
+        found = self.buf.find(sub, pos)
+        if found < 0:
+            raise ValueError(f"{sub.decode()!r} expected after {pos}")
+        return found
+
+    def __skip(self, pos: int) -> int:
+        return SKIP_PATTERN.match(self.buf, pos).end()
+
+    def __token(self, pos: int) -> tuple[bytes, int]:
+        pos = self.__skip(pos)
+        match = TOKEN_PATTERN.match(self.buf, pos)
+        if match is None:
+            return b"", pos
+        return match[0], match.end()
+
+    def header(self) -> dict:
+        """Parse the leading FoamFile dictionary only, the lists following it
+        are not scanned.
+        """
+
+        token, end = self.__token(0)
+        following, after = self.__token(end)
+        if token != b"FoamFile" or following != b"{":
+            return {}
+        header, pos = self.entries(after)
+        if self.__token(pos)[0] != b"}":
+            raise ValueError("'}' expected to close FoamFile")
+        return header
+
+    def entries(
+        self, pos: int = 0, scope: list[dict] | None = None
+    ) -> tuple[dict, int]:
+        """Parse dictionary entries until the closing brace or parenthesis or
+        the end of the buffer. Top-level lists without keyword (e.g. polyMesh
+        files) are stored as a list under None.
+
+        Raises:
+            NotImplementedError: raised on unsupported binary lists.
+
+        Returns:
+            tuple[dict, int]: entries and position following them.
+        """
+
+        entries = {}
+        scope = (scope or []) + [entries]
+        while True:
+            token, end = self.__token(pos)
+            if token in (b"", b"}", b")"):
+                return entries, pos
+
+            key = token.decode()
+            following, after = self.__token(end)
+            if key.startswith("#"):  # e.g. #includeEtc, its entries are unknown
+                pos = after
+            elif key.startswith("$") and following == b";":
+                variable = self.__lookup(key, scope)
+                if isinstance(variable, dict):
+                    entries |= variable
+                pos = after
+            elif following == b"{":
+                entries[key], pos = self.entries(after, scope)
+                if self.__token(pos)[0] != b"}":
+                    raise ValueError(f"'}}' expected to close {key}")
+                pos = self.__token(pos)[1]
+                if key == "FoamFile":
+                    self.format = _Format.from_header(entries[key])
+                    self.cls = str(entries[key].get("class", ""))
+                    if self.kind is None:
+                        self.kind = _kind(self.cls)
+            elif LABEL_PATTERN.fullmatch(token) and following in (b"(", b"{"):
+                if self.cls == "polyBoundaryMesh":  # list of named dictionaries
+                    value, pos = self.entries(after, scope)
+                    pos = self.__index(b")", pos) + 1
+                else:
+                    value, pos = self.__list(int(token), self.__skip(end))
+                entries.setdefault(None, []).append(value)
+            else:
+                entries[key], pos = self.__value(end, scope)
+
+    def __value(self, pos: int, scope: list[dict]) -> tuple[object, int]:
+        """Parse value until the semicolon, e.g. `uniform (0 0 0)`,
+        `nonuniform List<scalar> 3(0 1 2)` or `fixedValue`.
+        """
+
+        items, kind = [], self.kind
+        while True:
+            token, end = self.__token(pos)
+            if token == b";":
+                pos = end
+                break
+            if token == b"":
+                raise ValueError("';' expected")
+
+            if token.startswith(b"List<"):
+                kind = _kind(token.decode())
+                items.append(token.decode())
+                pos = end
+            elif LABEL_PATTERN.fullmatch(token) and self.__token(end)[0] in (
+                b"(",
+                b"{",
+            ):
+                value, pos = self.__list(int(token), self.__skip(end), kind)
+                items.append(value)
+            elif token == b"(":
+                value, pos = self.__list(None, self.__skip(pos), kind)
+                items.append(value)
+            elif token == b"[":  # dimensions
+                close = self.__index(b"]", end)
+                items.append(np.array(bytes(self.buf[end:close]).split(), dtype=float))
+                pos = close + 1
+            elif token.startswith(b"$") and len(scope):
+                items.append(self.__lookup(token.decode(), scope))
+                pos = end
+            else:
+                items.append(_convert(token.decode()))
+                pos = end
+
+        first = items[0] if items and isinstance(items[0], str) else None
+        if len(items) == 2 and first == "uniform":
+            return np.asarray(items[1], dtype=float), pos
+        if len(items) == 3 and first == "nonuniform":
+            return items[2], pos
+        if len(items) == 2 and first is not None and first.startswith("List<"):
+            return items[1], pos
+        if len(items) == 1:
+            return items[0], pos
+        return " ".join(str(item) for item in items), pos
+
+    def __list(
+        self, size: int | None, pos: int, kind: str | None = None
+    ) -> tuple[np.ndarray, int]:
+        """Read list starting at the parenthesis, `N{value}` lists are
+        expanded.
+        """
+
+        buf, kind = self.buf, kind or self.kind
+        dtype = self.format.dtype(kind)
+        ncomp = NCOMPONENTS.get(kind, 1)
+
+        if buf[pos : pos + 1] == b"{":
+            end = self.__index(b"}", pos)
+            value = _values(bytes(buf[pos + 1 : end]), dtype)
+            values = np.tile(value, size).reshape(size, -1)
+            return values[:, 0] if values.shape[1] == 1 else values, end + 1
+
+        if kind == "face" and not self.format.binary:
+            return self.__faces(size, pos)
+
+        if size == 0:
+            end = self.__index(b")", pos)
+            return np.empty((0, ncomp) if ncomp > 1 else 0, dtype=dtype), end + 1
+
+        if self.format.binary and size is not None:
+            if kind not in NCOMPONENTS:
+                raise NotImplementedError(f"binary list of {kind} is not supported")
+            count = size * ncomp
+            start = pos + 1
+            end = start + count * dtype.itemsize
+            if buf[end : end + 1] != b")":
+                raise ValueError(f"')' expected at {end} after {size} {kind}s")
+            values = np.frombuffer(buf, dtype=dtype, count=count, offset=start)
+            return values.reshape(size, ncomp) if ncomp > 1 else values, end + 1
+
+        # Unsized lists are short, e.g. `uniform (0 0 0)` or `(p U)`
+        if size is None:
+            start = self.__skip(pos + 1)
+            is_nested = buf[start : start + 1] == b"("
+            end = (
+                LIST_END_PATTERN.search(buf, pos).end() - 1
+                if is_nested
+                else self.__index(b")", pos)
+            )
+            text = bytes(buf[pos : end + 1])
+            try:
+                values = np.array(text.translate(UNNEST_TABLE).split(), dtype=dtype)
+                if is_nested:
+                    values = values.reshape(
+                        -1, len(buf[start + 1 : self.__index(b")", start)].split())
+                    )
+            except ValueError:
+                return text.decode(), end + 1
+            return values, end + 1
+
+        # ASCII list of primitives or of nested lists, e.g. vectors
+        start = self.__skip(pos + 1)
+        if buf[start : start + 1] != b"(":
+            end, ncomp = self.__index(b")", pos), 1
+        else:
+            end = LIST_END_PATTERN.search(buf, pos).end() - 1
+            if kind not in NCOMPONENTS:
+                ncomp = len(buf[start + 1 : self.__index(b")", start)].split())
+        text = bytes(buf[pos + 1 : end])
+        first = text.translate(UNNEST_TABLE).split(None, 1)[:1]
+        if kind == "word" or (first and not _is_number(first[0])):
+            # List of words, e.g. `inGroups List<word> 1(wall);`
+            values = np.array(text.decode().split())
+        else:
+            values = _values(text, dtype)
+        if ncomp > 1:
+            values = values.reshape(-1, ncomp)
+        if len(values) != size:
+            raise ValueError(f"{size} items expected, got {len(values)}")
+        return values, end + 1
+
+    def __faces(self, size: int, pos: int) -> tuple[tuple[np.ndarray, np.ndarray], int]:
+        """Read ASCII list of faces, e.g. `2(4(0 1 2 3) 3(1 2 4))`, as CSR
+        offsets and labels. The list is converted by chunks: labels preceding
+        each parenthesis are the face sizes.
+        """
+
+        buf = self.buf
+        end = (
+            LIST_END_PATTERN.search(buf, pos).end() - 1
+            if size
+            else self.__index(b")", pos)
+        )
+        sizes, labels = [], []
+        start = pos + 1
+        while start < end:
+            stop = end
+            if start + FACES_CHUNK_SIZE < end:
+                stop = self.__index(b")", start + FACES_CHUNK_SIZE) + 1
+
+            chunk = bytes(buf[start:stop])
+            chars = np.frombuffer(chunk, dtype=np.uint8)
+            is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+            is_first = is_digit.copy()
+            is_first[1:] &= ~is_digit[:-1]
+            values = _values(chunk, self.format.label)
+            is_size = np.zeros(len(values), dtype=bool)
+            is_size[
+                np.searchsorted(
+                    np.flatnonzero(is_first), np.flatnonzero(chars == ord("("))
+                )
+                - 1
+            ] = True
+            sizes.append(values[is_size])
+            labels.append(values[~is_size])
+            start = stop
+
+        sizes = np.concatenate(sizes) if sizes else np.empty(0, dtype=self.format.label)
+        if len(sizes) != size:
+            raise ValueError(f"{size} faces expected, got {len(sizes)}")
+        offsets = np.zeros(len(sizes) + 1, dtype=self.format.label)
+        np.cumsum(sizes, out=offsets[1:])
+        labels = (
+            np.concatenate(labels) if labels else np.empty(0, dtype=self.format.label)
+        )
+        return (offsets, labels), end + 1
+
+    @staticmethod
+    def __lookup(variable: str, scope: list[dict]) -> object:
+        """Look up `$var` in the enclosing dictionaries, `$:a/b` from the top."""
+
+        name = variable.lstrip("$").strip("{}")
+        chain = scope[:1] if name[:1] in (":", "/") else scope
+        keys = re.split(r"[./]", name.lstrip(":/"))
+        for entries in reversed(chain):
+            value = entries
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                return value
+        return variable
+
+
+def _read_foam_file(path: Path | str, kind: str | None = None) -> tuple[dict, dict]:
+    """Read OpenFOAM file with large lists (fields, polyMesh).
+
+    Args:
+        path (Path | str): path to the file, gzipped if ends with `.gz`.
+        kind (str, optional): primitive type of unsized lists, e.g. "label".
+        Defaults to the type of the header class.
+
+    Returns:
+        tuple[dict, dict]: FoamFile header and the other entries.
+    """
+
+    entries, _ = _Scanner(_open(path), kind).entries()
+    header = entries.pop("FoamFile", {})
+    return header, entries
+
+
+def _read_foam_header(path: Path | str) -> dict:
+    """Read the FoamFile header of OpenFOAM file without its lists, e.g. the
+    `note` of polyMesh/owner with the numbers of points, cells and faces.
+
+    Args:
+        path (Path | str): path to the file, gzipped if ends with `.gz`.
+
+    Returns:
+        dict: FoamFile header, empty if there is none.
+    """
+
+    return _Scanner(_open(path, HEADER_SIZE)).header()
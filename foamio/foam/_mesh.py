@@ -0,0 +1,268 @@
+import re
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+
+from foamio.foam._decomposed import (
+    _addressing,
+    _case,
+    _is_processor,
+    _map,
+    _processors,
+)
+from foamio.foam._foamfile import _read_foam_file, _read_foam_header
+
+
+class Mesh:
+    """OpenFOAM polyMesh of `constant/polyMesh`. Arrays are read on first
+    access: binary files are memory-mapped without copying (the arrays are
+    read-only), ASCII ones are converted at once. Faces are stored in the
+    compressed sparse row format, i.e. labels of the face `i` are
+    `face_labels[face_offsets[i]:face_offsets[i + 1]]`.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Args:
+            path (Path | str): path to the polyMesh directory.
+        """
+
+        self.path = Path(path)
+        self.headers = {}
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        path: Path | str,
+        points: np.ndarray,
+        face_offsets: np.ndarray,
+        face_labels: np.ndarray,
+        owner: np.ndarray,
+        neighbour: np.ndarray,
+        boundary: dict[str, dict],
+        n_cells: int,
+    ) -> "Mesh":
+        """Mesh of arrays in memory, e.g. reconstructed from processors."""
+
+        mesh = cls(path)
+        mesh.points, mesh.owner, mesh.neighbour = points, owner, neighbour
+        mesh.__faces = face_offsets, face_labels
+        mesh.boundary, mesh.n_cells = boundary, n_cells
+        return mesh
+
+    def __read(self, name: str) -> dict:
+        self.headers[name], entries = _read_foam_file(self.path / name)
+        return entries
+
+    def __list(self, name: str) -> np.ndarray:
+        return self.__read(name)[None][0]
+
+    @cached_property
+    def points(self) -> np.ndarray:
+        """Point coordinates of shape (npoints, 3)."""
+
+        return self.__list("points")
+
+    @cached_property
+    def __faces(self) -> tuple[np.ndarray, np.ndarray]:
+        lists = self.__read("faces")[None]
+        if self.headers["faces"].get("class") == "faceCompactList":
+            return lists[0], lists[1]
+        return lists[0]
+
+    @property
+    def face_offsets(self) -> np.ndarray:
+        """Offsets of face labels of shape (nfaces + 1,)."""
+
+        return self.__faces[0]
+
+    @property
+    def face_labels(self) -> np.ndarray:
+        """Point labels of all faces."""
+
+        return self.__faces[1]
+
+    @cached_property
+    def owner(self) -> np.ndarray:
+        """Owner cell of each face of shape (nfaces,)."""
+
+        return self.__list("owner")
+
+    @cached_property
+    def neighbour(self) -> np.ndarray:
+        """Neighbour cell of each internal face of shape (ninternalfaces,)."""
+
+        return self.__list("neighbour")
+
+    @cached_property
+    def boundary(self) -> dict[str, dict]:
+        """Patch entries, e.g. `type`, `nFaces` and `startFace`."""
+
+        return self.__read("boundary").get(None, [{}])[0]
+
+    @cached_property
+    def n_cells(self) -> int:
+        """Number of cells from the `note` of the owner header if present,
+        the owner list is not read then.
+        """
+
+        header = self.headers.get("owner")
+        if header is None:
+            header = _read_foam_header(self.path / "owner")
+        if match := re.search(r"nCells:\s*(\d+)", str(header.get("note", ""))):
+            return int(match[1])
+        return (
+            int(max(self.owner.max(initial=-1), self.neighbour.max(initial=-1))) + 1
+        )
+
+    def load(self) -> "Mesh":
+        """Read all arrays."""
+
+        for name in ("points", "face_offsets", "owner", "neighbour", "boundary"):
+            getattr(self, name)
+        return self
+
+
+def _mesh_dir(case: Path | str, region: str | None = None) -> Path:
+    """polyMesh directory of the case, the path itself if it is one."""
+
+    path = Path(case)
+    if (path / "owner").exists() or (path / "owner.gz").exists():
+        return path
+    path = path / "constant"
+    if region is not None:
+        path /= region
+    return path / "polyMesh"
+
+
+def __load(path: Path, addressing: bool) -> tuple:
+    """Processor mesh with its point, face and cell addressing."""
+
+    mesh = Mesh(path).load()
+    if not addressing:
+        return mesh
+    return mesh, *(
+        _addressing(path, f"{name}ProcAddressing") for name in ("point", "face", "cell")
+    )
+
+
+def __reconstruct(path: Path, parts: list[tuple]) -> Mesh:
+    """Global mesh of processor meshes by the addressing written by
+    `decomposePar`: negative face addressing marks flipped faces, whose
+    owners are the global neighbours.
+    """
+
+    dtype = parts[0][0].face_offsets.dtype
+    npoints = max(int(ppa.max(initial=-1)) for _, ppa, _, _ in parts) + 1
+    nfaces = max(int(np.abs(fpa).max(initial=0)) for _, _, fpa, _ in parts)
+    ncells = max(int(cpa.max(initial=-1)) for _, _, _, cpa in parts) + 1
+
+    points = np.empty((npoints, 3), dtype=parts[0][0].points.dtype)
+    sizes = np.zeros(nfaces, dtype=dtype)
+    owner = np.full(nfaces, -1, dtype=dtype)
+    neighbour = np.full(nfaces, -1, dtype=dtype)
+    for mesh, ppa, fpa, cpa in parts:
+        points[ppa] = mesh.points
+        faces, flipped, n = np.abs(fpa) - 1, fpa < 0, len(mesh.neighbour)
+        sizes[faces] = np.diff(mesh.face_offsets)
+
+        cells = cpa[mesh.owner]
+        owner[faces[~flipped]] = cells[~flipped]
+        neighbour[faces[flipped]] = cells[flipped]
+        cells = cpa[mesh.neighbour]
+        neighbour[faces[:n][~flipped[:n]]] = cells[~flipped[:n]]
+        owner[faces[:n][flipped[:n]]] = cells[flipped[:n]]
+
+    offsets = np.zeros(nfaces + 1, dtype=dtype)
+    np.cumsum(sizes, out=offsets[1:])
+    labels = np.empty(offsets[-1], dtype=dtype)
+    for mesh, ppa, fpa, cpa in parts:
+        faces, flipped, n = np.abs(fpa) - 1, fpa < 0, len(mesh.neighbour)
+        # Faces between processors are taken from their owner side
+        taken = ~flipped
+        taken[:n] = True
+
+        local_sizes = np.diff(mesh.face_offsets)
+        face = np.repeat(np.arange(len(local_sizes)), local_sizes)
+        index = np.arange(len(mesh.face_labels)) - mesh.face_offsets[face]
+        # Flipped faces keep the first point, the others are reversed
+        index = np.where(
+            flipped[face], (local_sizes[face] - index) % local_sizes[face], index
+        )
+        taken = taken[face]
+        labels[offsets[faces[face[taken]]] + index[taken]] = ppa[
+            mesh.face_labels[taken]
+        ]
+
+    ninternal = int(np.count_nonzero(neighbour >= 0))
+    boundary, start = {}, ninternal
+    for name, patch in parts[0][0].boundary.items():
+        if _is_processor(patch):
+            continue
+        size = sum(int(mesh.boundary[name]["nFaces"]) for mesh, *_ in parts)
+        boundary[name] = patch | dict(nFaces=size, startFace=start)
+        start += size
+
+    return Mesh._from_arrays(
+        path,
+        points,
+        offsets,
+        labels,
+        owner,
+        neighbour[:ninternal],
+        boundary,
+        ncells,
+    )
+
+
+def read_mesh(
+    case: Path | str,
+    *,
+    region: str | None = None,
+    lazy: bool = False,
+    decomposed: bool = False,
+    reconstruct: bool = True,
+    max_workers: int | None = None,
+) -> Mesh | list[Mesh]:
+    """Read OpenFOAM polyMesh as NumPy arrays: points, faces as CSR offsets and
+    labels, owner and neighbour cells of faces, and boundary patches.
+    Meshes of decomposed cases (`processorN/constant/polyMesh`) are read in
+    parallel processes and reconstructed by `pointProcAddressing`,
+    `faceProcAddressing` and `cellProcAddressing`.
+
+    Args:
+        case (Path | str): FOAM_CASE path or polyMesh directory.
+        region (str, optional): mesh region. Defaults to None.
+        lazy (bool, optional): read arrays on first access only, meshes of
+        processors are not reconstructed. Defaults to False.
+        decomposed (bool, optional): read meshes of processors.
+        Defaults to False.
+        reconstruct (bool, optional): reconstruct the global mesh of a
+        decomposed case, otherwise return meshes of processors.
+        Defaults to True.
+        max_workers (int, optional): number of processes reading a
+        decomposed case, it is read in-process if 1.
+        Defaults to the number of CPUs.
+
+    Raises:
+        FileNotFoundError: raised when the case is not decomposed.
+        NotImplementedError: raised on collated decomposed cases.
+
+    Returns:
+        Mesh | list[Mesh]: polyMesh or polyMeshes of processors.
+    """
+
+    if not decomposed:
+        mesh = Mesh(_mesh_dir(case, region))
+        return mesh if lazy else mesh.load()
+
+    case = _case(case)
+    paths = [_mesh_dir(processor, region) for processor in _processors(case)]
+    if lazy:
+        return [Mesh(path) for path in paths]
+
+    parts = _map(__load, ((path, reconstruct) for path in paths), max_workers)
+    if not reconstruct:
+        return parts
+    return __reconstruct(_mesh_dir(case, region), parts)
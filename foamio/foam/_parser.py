@@ -0,0 +1,396 @@
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from foamio._common import NUMBER_PATTERN
+
+TOKEN_PATTERN = re.compile(
+    rf"""
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<verbatim>\#\{{.*?\#\}})
+    |(?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<punct>[{{}}()\[\];])
+    |(?P<number>(?:{NUMBER_PATTERN})(?![\w.]))
+    |(?P<variable>\$\{{[^}}]*\}}|\$[^\s;{{}}()\[\]"]+)
+    |(?P<directive>\#[A-Za-z]\w*)
+    |(?P<word>[^\s;{{}}()\[\]"]+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+INCLUDE_DIRECTIVES = ("#include", "#includeIfPresent", "#includeEtc")
+
+
+class Token(NamedTuple):
+    """Token of OpenFOAM dictionary and its span in the source text."""
+
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+def _tokenise(text: str) -> list[Token]:
+    """Split OpenFOAM dictionary text to tokens, comments are dropped. Words
+    may contain balanced parentheses, e.g. `div(phi,U)`.
+
+    Args:
+        text (str): OpenFOAM dictionary text.
+
+    Raises:
+        ValueError: raised on unbalanced parentheses of a word.
+
+    Returns:
+        list[Token]: tokens.
+    """
+
+    tokens = []
+    pos = 0
+    while (match := TOKEN_PATTERN.match(text, pos)) is not None:
+        kind, start, pos = match.lastgroup, match.start(), match.end()
+        if kind == "skip":
+            continue
+
+        # OpenFOAM words keep parentheses as long as they are balanced
+        if kind in ("word", "variable", "directive") and text[pos : pos + 1] == "(":
+            depth = 0
+            while (
+                pos < len(text) and not text[pos].isspace() and text[pos] not in ';{}"'
+            ):
+                if text[pos] == "(":
+                    depth += 1
+                elif text[pos] == ")":
+                    if not depth:
+                        break
+                    depth -= 1
+                pos += 1
+            if depth:
+                raise ValueError(f"unbalanced parentheses in {text[start:pos]!r}")
+
+        tokens.append(Token(kind, text[start:pos], start, pos))
+
+    if pos != len(text):
+        raise ValueError(f"unexpected character {text[pos]!r} at {pos}")
+    return tokens
+
+
+def _render(tokens: list[Token]) -> str:
+    """Join tokens as `foamDictionary -value` prints them, e.g.
+    `uniform (0 0 0)` or `3(1 2 3)`.
+    """
+
+    text = ""
+    previous = None
+    for token in tokens:
+        if isinstance(token, dict):  # substituted dictionary variable
+            token = Token("word", "{ " + _render_dict(token) + " }", -1, -1)
+        if previous is not None and not (
+            previous.text in ("(", "[")
+            or token.text in (")", "]", ";")
+            or (token.text == "(" and previous.kind == "number")
+        ):
+            text += " "
+        text += token.text
+        previous = token
+    return text
+
+
+def _render_dict(entries: dict) -> str:
+    """Join dictionary entries to a single line, e.g. `a 1; b { c 2; }`."""
+
+    return " ".join(
+        (
+            f"{key} {{ {_render_dict(value)} }}"
+            if isinstance(value, dict)
+            else f"{key} {_render(value)};"
+        )
+        for key, value in entries.items()
+    )
+
+
+def _expand(path: str, fname: Path, case: Path | None) -> Path:
+    """Expand path of an included file, i.e. `<case>`, `<system>`,
+    `<constant>` tags and environment variables, relative paths are relative to
+    the including file.
+    """
+
+    path = path.strip('"')
+    if case is not None:
+        for tag, value in (
+            ("<case>", case),
+            ("<system>", case / "system"),
+            ("<constant>", case / "constant"),
+            ("$FOAM_CASE", case),
+            ("${FOAM_CASE}", case),
+        ):
+            path = path.replace(tag, str(value))
+    path = os.path.expanduser(os.path.expandvars(path))
+    if "$" in path:
+        raise NotImplementedError(f"{path} cannot be expanded")
+    return fname.parent / path
+
+
+def _etc(path: str) -> Path:
+    """Find a file of `#includeEtc` in OpenFOAM `etc` directories."""
+
+    for variable in ("WM_PROJECT_USER_DIR", "WM_PROJECT_SITE", "WM_PROJECT_DIR"):
+        if variable in os.environ:
+            candidate = Path(os.environ[variable]) / "etc" / path
+            if candidate.is_file():
+                return candidate
+    raise NotImplementedError(f"{path} is not found in OpenFOAM etc")
+
+
+def _dependencies(
+    fname: Path, case: Path | None = None, encoding: str = "utf-8"
+) -> list[Path]:
+    """Dictionary file and the files it `#include`s recursively, including
+    files of `#includeIfPresent` which are not present (yet). Directives are
+    not evaluated, so included files of code entries are unknown.
+
+    Args:
+        fname (Path): path to OpenFOAM dictionary.
+        case (Path, optional): case path to expand `<case>` tags.
+        Defaults to None.
+        encoding (str, optional): encoding. Defaults to "utf-8".
+
+    Returns:
+        list[Path]: dictionary file and its dependencies.
+    """
+
+    dependencies = [Path(fname)]
+    for path in dependencies:
+        if not path.is_file():
+            continue
+
+        with open(path, encoding=encoding) as f:
+            tokens = _tokenise(f.read())
+        for directive, argument in zip(tokens, tokens[1:]):
+            if directive.text not in INCLUDE_DIRECTIVES:
+                continue
+            try:
+                dependency = (
+                    _etc(argument.text.strip('"'))
+                    if directive.text == "#includeEtc"
+                    else _expand(argument.text, path, case)
+                )
+            except NotImplementedError:
+                continue
+            if dependency not in dependencies:
+                dependencies.append(dependency)
+    return dependencies
+
+
+class _Parser:
+    """Recursive descent parser of OpenFOAM dictionaries with `#include`,
+    `#remove` and `$var` expansion. Entries are nested dicts and lists of the
+    value tokens.
+    """
+
+    def __init__(self, case: Path | None = None, encoding: str = "utf-8") -> None:
+        self.case = case
+        self.encoding = encoding
+
+        #: files read including the `#include`d ones
+        self.includes: list[Path] = []
+
+    def parse(
+        self, fname: Path, scope: list[dict] | None = None, text: str | None = None
+    ) -> dict:
+        """Parse dictionary file.
+
+        Args:
+            fname (Path): path to OpenFOAM dictionary.
+            scope (list[dict], optional): enclosing dictionaries of an
+            included file. Defaults to None.
+            text (str, optional): dictionary text, e.g. `foamDictionary`
+            output, the file is read if None. Defaults to None.
+
+        Raises:
+            NotImplementedError: raised on entries which need OpenFOAM to be
+            evaluated, e.g. `#calc` or `#codeStream`.
+
+        Returns:
+            dict: nested dicts of value tokens.
+        """
+
+        fname = Path(fname)
+        if text is None:
+            self.includes.append(fname)
+            with open(fname, encoding=self.encoding) as f:
+                text = f.read()
+        tokens = _tokenise(text)
+
+        if scope is None:
+            scope = [{}]
+        pos = self.__entries(tokens, 0, fname, scope)
+        if pos != len(tokens):
+            raise ValueError(f"{fname}: unexpected {tokens[pos].text!r}")
+        return scope[-1]
+
+    def __entries(
+        self, tokens: list[Token], pos: int, fname: Path, scope: list[dict]
+    ) -> int:
+        """Parse entries into the innermost dictionary of the scope until the
+        closing brace or the end of tokens.
+        """
+
+        entries = scope[-1]
+        while pos < len(tokens) and tokens[pos].text != "}":
+            token = tokens[pos]
+            if token.kind == "directive":
+                pos = self.__directive(tokens, pos, fname, scope)
+                continue
+
+            if (
+                token.kind == "variable"
+                and tokens[pos + 1 : pos + 2]
+                and (tokens[pos + 1].text == ";")
+            ):
+                value = self.__lookup(token.text, scope, fname)
+                if not isinstance(value, dict):
+                    raise ValueError(f"{fname}: {token.text} is not a dictionary")
+                self.__merge(entries, value)
+                pos += 2
+                continue
+
+            if token.kind == "punct":
+                raise ValueError(f"{fname}: keyword expected, got {token.text!r}")
+
+            key = token.text
+            if tokens[pos + 1 : pos + 2] and tokens[pos + 1].text == "{":
+                value = entries[key] if isinstance(entries.get(key), dict) else {}
+                pos = self.__entries(tokens, pos + 2, fname, scope + [value])
+                if pos == len(tokens):
+                    raise ValueError(f"{fname}: '}}' expected to close {key}")
+                entries[key] = value
+                pos += 1
+                continue
+
+            value, pos = self.__value(tokens, pos + 1, fname, scope)
+            if isinstance(value, dict) and isinstance(entries.get(key), dict):
+                self.__merge(entries[key], value)
+            else:
+                entries[key] = value
+        return pos
+
+    def __value(
+        self, tokens: list[Token], pos: int, fname: Path, scope: list[dict]
+    ) -> tuple[list[Token] | dict, int]:
+        """Parse value tokens until the terminating semicolon, variables are
+        substituted.
+        """
+
+        value = []
+        depth = 0
+        while pos < len(tokens):
+            token = tokens[pos]
+            pos += 1
+            if token.text == ";" and not depth:
+                if len(value) == 1 and isinstance(value[0], dict):
+                    return value[0], pos
+                return value, pos
+
+            if token.kind == "punct":
+                depth += token.text in "([{"
+                depth -= token.text in ")]}"
+            elif token.kind in ("verbatim", "directive"):
+                # e.g. `#calc`, `#codeStream` or `#{ ... #}` need OpenFOAM
+                raise NotImplementedError(f"{fname}: {token.text[:16]} is code")
+            elif token.kind == "variable":
+                substitute = self.__lookup(token.text, scope, fname)
+                value.extend(
+                    [substitute] if isinstance(substitute, dict) else substitute
+                )
+                continue
+            value.append(token)
+        raise ValueError(f"{fname}: ';' expected")
+
+    def __directive(
+        self, tokens: list[Token], pos: int, fname: Path, scope: list[dict]
+    ) -> int:
+        """Evaluate directive at keyword position."""
+
+        directive = tokens[pos].text
+        argument = tokens[pos + 1] if pos + 1 < len(tokens) else None
+        if directive in INCLUDE_DIRECTIVES:
+            if argument is None:
+                raise ValueError(f"{fname}: {directive} has no file")
+
+            if directive == "#includeEtc":
+                path = _etc(argument.text.strip('"'))
+            else:
+                path = _expand(argument.text, fname, self.case)
+            if directive != "#includeIfPresent" or path.is_file():
+                self.parse(path, scope)
+            return pos + 2
+
+        if directive == "#inputMode":
+            return pos + 2
+
+        if directive == "#remove":
+            if argument is None:
+                raise ValueError(f"{fname}: #remove has no keyword")
+            if argument.text != "(":
+                scope[-1].pop(argument.text.strip('"'), None)
+                return pos + 2
+
+            end = pos + 2
+            while end < len(tokens) and tokens[end].text != ")":
+                scope[-1].pop(tokens[end].text.strip('"'), None)
+                end += 1
+            return end + 1
+
+        raise NotImplementedError(f"{fname}: {directive} is not supported")
+
+    @staticmethod
+    def __merge(entries: dict, other: dict) -> None:
+        """Merge dictionary entries recursively, other entries win."""
+
+        for key, value in other.items():
+            if isinstance(value, dict) and isinstance(entries.get(key), dict):
+                _Parser.__merge(entries[key], value)
+            else:
+                entries[key] = _Parser.__copy(value)
+
+    @staticmethod
+    def __copy(value: list | dict) -> list | dict:
+        if isinstance(value, dict):
+            return {key: _Parser.__copy(item) for key, item in value.items()}
+        return list(value)
+
+    @staticmethod
+    def __lookup(variable: str, scope: list[dict], fname: Path) -> list | dict:
+        """Look up `$var`, `${var}`, scoped `$a.b`/`$a/b`, parent `$..var` and
+        top-level `$:a.b`/`$/a/b` variables, environment variables otherwise.
+        """
+
+        name = variable[1:]
+        if name.startswith("{") and name.endswith("}"):
+            name = name[1:-1]
+
+        if name[:1] in (":", "/"):
+            chain, name = scope[:1], name[1:]
+        elif name.startswith("."):
+            ndots = len(name) - len(name.lstrip("."))
+            chain, name = scope[: max(len(scope) - ndots + 1, 1)][-1:], name[ndots:]
+        else:
+            chain = scope
+
+        for entries in reversed(chain):
+            if name in entries:
+                return _Parser.__copy(entries[name])
+
+            keys = re.split(r"[./]", name)
+            value = entries
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                return _Parser.__copy(value)
+
+        if name in os.environ:
+            return [Token("word", os.environ[name], -1, -1)]
+        raise KeyError(f"{fname}: {variable} is undefined")
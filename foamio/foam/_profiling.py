@@ -0,0 +1,225 @@
+import dataclasses
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+import pandas as pd
+
+
+@dataclass
+class CallProfile:
+    """Resources used by an OpenFOAM application call.
+
+    Attributes:
+        cmd (str): application name.
+        args (list[str]): command line.
+        returncode (int): exit code.
+        start (float): start time since the epoch in seconds.
+        wall (float): wall time in seconds.
+        user (float, optional): CPU time in user mode in seconds.
+        sys (float, optional): CPU time in system mode in seconds.
+        peak_rss (int, optional): peak resident set size in bytes, i.e.
+        `ru_maxrss` of the child. The high-water mark is kept over fork and
+        exec, so it is never below the RSS of the calling Python process.
+    """
+
+    cmd: str
+    args: list[str]
+    returncode: int
+    start: float
+    wall: float
+    user: float | None = None
+    sys: float | None = None
+    peak_rss: int | None = None
+
+
+#: Sink of call profiles
+Sink = Callable[[CallProfile], None]
+
+
+class ProfileStats:
+    """In-memory sink of call profiles with a summary grouped by command, e.g.
+    ```
+    stats = ProfileStats()
+    foam = Caller(profile=stats)
+    ...
+    print(stats)
+    ```
+    """
+
+    def __init__(self, profiles: Iterable[CallProfile] = ()) -> None:
+        self.profiles = list(profiles)
+        self.__lock = threading.Lock()
+
+    def __call__(self, profile: CallProfile) -> None:
+        with self.__lock:
+            self.profiles.append(profile)
+
+    @classmethod
+    def read(cls, fname: Path | str) -> "ProfileStats":
+        """Read call profiles written by `JSONLinesSink`."""
+
+        with open(fname, encoding="utf-8") as f:
+            return cls(CallProfile(**json.loads(line)) for line in f if line.strip())
+
+    def summary(self) -> pd.DataFrame:
+        """Number of calls, failures and used resources grouped by command.
+
+        Returns:
+            pd.DataFrame: summary sorted by the total wall time.
+        """
+
+        with self.__lock:
+            dat = pd.DataFrame(
+                [dataclasses.asdict(profile) for profile in self.profiles],
+                columns=[field.name for field in dataclasses.fields(CallProfile)],
+            )
+        dat["failed"] = dat["returncode"] != 0
+        return (
+            dat.groupby("cmd")
+            .agg(
+                calls=("wall", "size"),
+                failed=("failed", "sum"),
+                wall=("wall", "sum"),
+                wall_mean=("wall", "mean"),
+                wall_max=("wall", "max"),
+                user=("user", "sum"),
+                sys=("sys", "sum"),
+                peak_rss=("peak_rss", "max"),
+            )
+            .sort_values("wall", ascending=False)
+        )
+
+    def __str__(self) -> str:
+        return self.summary().to_string(float_format="%.3f")
+
+
+class JSONLinesSink:
+    """Sink appending call profiles to a JSON lines file."""
+
+    def __init__(self, fname: Path | str) -> None:
+        self.fname = Path(fname)
+        self.__lock = threading.Lock()
+
+    def __call__(self, profile: CallProfile) -> None:
+        line = json.dumps(dataclasses.asdict(profile)) + "\n"
+        with self.__lock, open(self.fname, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class LoggingSink:
+    """Sink logging call profiles."""
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.INFO
+    ) -> None:
+        self.logger = logging.getLogger() if logger is None else logger
+        self.level = level
+
+    def __call__(self, profile: CallProfile) -> None:
+        self.logger.log(
+            self.level,
+            "%s exited with %d in %.3f s (user %s s, sys %s s, peak RSS %s B)",
+            profile.cmd,
+            profile.returncode,
+            profile.wall,
+            profile.user,
+            profile.sys,
+            profile.peak_rss,
+        )
+
+
+class _Popen(subprocess.Popen):
+    """`subprocess.Popen` reaping the child with `os.wait4` in the public
+    `wait` to keep its resource usage. A child reaped otherwise, e.g. by
+    `poll` of `kill`, has no resource usage.
+    """
+
+    rusage = None
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self.returncode is not None or not hasattr(os, "wait4"):
+            return super().wait(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 5e-4
+        while True:
+            try:
+                pid, status, rusage = os.wait4(
+                    self.pid, 0 if deadline is None else os.WNOHANG
+                )
+            except ChildProcessError:  # reaped elsewhere
+                return super().wait(timeout)
+            if pid:
+                self.rusage = rusage
+                self.returncode = os.waitstatus_to_exitcode(status)
+                return self.returncode
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(2 * delay, 0.05)
+
+
+def _run(
+    args: list[str], cmd: str, sinks: Iterable[Sink], **kwargs
+) -> subprocess.CompletedProcess:
+    """`subprocess.run` which passes the call profile to the sinks.
+
+    Args:
+        args (list[str]): command line.
+        cmd (str): application name.
+        sinks (Iterable[Sink]): call profile sinks.
+
+    Returns:
+        subprocess.CompletedProcess: completed process.
+    """
+
+    data = kwargs.pop("input", None)
+    timeout = kwargs.pop("timeout", None)
+    check = kwargs.pop("check", False)
+    if data is not None:
+        kwargs["stdin"] = subprocess.PIPE
+    if kwargs.pop("capture_output", False):
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+
+    start, counter = time.time(), time.perf_counter()
+    with _Popen(args, **kwargs) as process:
+        try:
+            stdout, stderr = process.communicate(data, timeout=timeout)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            rusage = process.rusage
+            profile = CallProfile(
+                cmd=cmd,
+                args=[str(arg) for arg in args],
+                returncode=process.returncode,
+                start=start,
+                wall=time.perf_counter() - counter,
+                user=None if rusage is None else rusage.ru_utime,
+                sys=None if rusage is None else rusage.ru_stime,
+                peak_rss=(
+                    None
+                    if rusage is None
+                    # kilobytes on Linux, bytes on macOS
+                    else rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+                ),
+            )
+            for sink in sinks:
+                sink(profile)
+
+    completed = subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+    if check:
+        completed.check_returncode()
+    return completed
@@ -0,0 +1,303 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from foamio.foam._mesh import Mesh, read_mesh
+
+#: Number of faces processed at once
+CHUNK_SIZE = 1 << 18
+
+#: Guard against division by zero as OpenFOAM's `rootVSmall`
+ROOT_VSMALL = 1e-150
+
+#: Metrics of `MeshQuality` by cells
+METRICS = ("non_orthogonality", "skewness", "aspect_ratio", "volume")
+
+
+@dataclass
+class MeshQuality:
+    """Geometry and quality metrics of a polyMesh as `checkMesh` computes them.
+
+    Attributes:
+        face_centres (np.ndarray): face centres of shape (nfaces, 3).
+        face_areas (np.ndarray): face area vectors of shape (nfaces, 3).
+        cell_centres (np.ndarray): cell centres of shape (ncells, 3).
+        cell_volumes (np.ndarray): cell volumes of shape (ncells,).
+        face_non_orthogonality (np.ndarray): angle between the face normal
+        and the line connecting cell centres in degrees of internal faces.
+        face_skewness (np.ndarray): skewness of faces.
+        non_orthogonality (np.ndarray): maximum non-orthogonality of cell faces.
+        skewness (np.ndarray): maximum skewness of cell faces.
+        aspect_ratio (np.ndarray): aspect ratio of cells.
+    """
+
+    face_centres: np.ndarray
+    face_areas: np.ndarray
+    cell_centres: np.ndarray
+    cell_volumes: np.ndarray
+    face_non_orthogonality: np.ndarray
+    face_skewness: np.ndarray
+    non_orthogonality: np.ndarray
+    skewness: np.ndarray
+    aspect_ratio: np.ndarray
+
+    @property
+    def volume(self) -> np.ndarray:
+        """Cell volumes, an alias of `cell_volumes` for `METRICS`."""
+
+        return self.cell_volumes
+
+    def histogram(
+        self, metric: str, bins: int | np.ndarray = 10
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Histogram of a cell metric.
+
+        Args:
+            metric (str): one of `METRICS`.
+            bins (int | np.ndarray, optional): number of bins or bin edges.
+            Defaults to 10.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: counts and bin edges.
+        """
+
+        return np.histogram(getattr(self, metric), bins=bins)
+
+    def worst(self, metric: str, n: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Cells with the largest metric (the smallest volume).
+
+        Args:
+            metric (str): one of `METRICS`.
+            n (int, optional): number of cells. Defaults to 10.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: cell labels and their metric values
+            from the worst.
+        """
+
+        values = getattr(self, metric)
+        key = values if metric == "volume" else -values
+        n = min(n, len(values))
+        if not n:
+            return np.empty(0, dtype=int), values[:0]
+        cells = np.argpartition(key, n - 1)[:n]
+        cells = cells[np.argsort(key[cells], kind="stable")]
+        return cells, values[cells]
+
+    def summary(self) -> dict[str, float]:
+        """Extrema of metrics as `checkMesh` reports them."""
+
+        def extremum(function, values: np.ndarray) -> float:
+            return float(function(values)) if len(values) else float("nan")
+
+        return dict(
+            cells=len(self.cell_volumes),
+            faces=len(self.face_areas),
+            min_volume=extremum(np.min, self.cell_volumes),
+            max_volume=extremum(np.max, self.cell_volumes),
+            negative_volumes=int(np.count_nonzero(self.cell_volumes <= 0)),
+            max_non_orthogonality=extremum(np.max, self.face_non_orthogonality),
+            mean_non_orthogonality=extremum(np.mean, self.face_non_orthogonality),
+            max_skewness=extremum(np.max, self.face_skewness),
+            max_aspect_ratio=extremum(np.max, self.aspect_ratio),
+        )
+
+
+def __chunks(offsets: np.ndarray, chunk_size: int):
+    """Face ranges of CSR offsets with about `chunk_size` labels each."""
+
+    nfaces = len(offsets) - 1
+    step = max(chunk_size * (nfaces or 1) // max(int(offsets[-1]), 1), 1)
+    for start in range(0, nfaces, step):
+        yield start, min(start + step, nfaces)
+
+
+def __face_geometry(
+    points: np.ndarray, offsets: np.ndarray, labels: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Centres and area vectors of faces by triangles from the average point
+    as `primitiveMesh::makeFaceCentresAndAreas`.
+    """
+
+    offsets = offsets - offsets[0]
+    sizes = np.diff(offsets)
+    face = np.repeat(np.arange(len(sizes)), sizes)
+    following = np.arange(1, len(labels) + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+
+    this = points[labels].astype(float, copy=False)
+    estimate = np.add.reduceat(this, offsets[:-1], axis=0) / sizes[:, None]
+    centre = estimate[face]
+    normals = np.cross(this[following] - this, centre - this)
+    magnitudes = np.linalg.norm(normals, axis=1)
+
+    areas = 0.5 * np.add.reduceat(normals, offsets[:-1], axis=0)
+    weights = np.add.reduceat(magnitudes, offsets[:-1])
+    centres = np.add.reduceat(
+        magnitudes[:, None] * (this + this[following] + centre), offsets[:-1], axis=0
+    ) / (3 * weights[:, None] + ROOT_VSMALL)
+    degenerate = weights < ROOT_VSMALL
+    centres[degenerate] = estimate[degenerate]
+    return centres, areas
+
+
+def __scatter(cells: np.ndarray, weights: np.ndarray, out: np.ndarray) -> None:
+    """Add weights of faces to their cells, `np.bincount` is the fastest
+    scatter-add.
+    """
+
+    if weights.ndim == 1:
+        out += np.bincount(cells, weights, minlength=len(out))
+        return
+    for i in range(weights.shape[1]):
+        out[:, i] += np.bincount(cells, weights[:, i], minlength=len(out))
+
+
+def check_mesh(
+    mesh: Mesh | Path | str,
+    *,
+    region: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> MeshQuality:
+    """Compute face and cell geometry and quality metrics (non-orthogonality,
+    skewness, aspect ratio) of a polyMesh with scatter-adds over owner and
+    neighbour cells, as `checkMesh` does, without running OpenFOAM. Faces are
+    processed by chunks to bound the memory of temporaries.
+
+    Args:
+        mesh (Mesh | Path | str): polyMesh or FOAM_CASE path.
+        region (str, optional): mesh region of the case. Defaults to None.
+        chunk_size (int, optional): number of face labels processed at once.
+        Defaults to CHUNK_SIZE.
+
+    Returns:
+        MeshQuality: geometry and metrics.
+    """
+
+    if not isinstance(mesh, Mesh):
+        mesh = read_mesh(mesh, region=region, lazy=True)
+
+    points, offsets, labels = mesh.points, mesh.face_offsets, mesh.face_labels
+    owner, neighbour = mesh.owner, mesh.neighbour
+    nfaces, ninternal, ncells = len(owner), len(neighbour), mesh.n_cells
+    face_centres = np.empty((nfaces, 3))
+    face_areas = np.empty((nfaces, 3))
+    for start, stop in __chunks(offsets, chunk_size):
+        face_centres[start:stop], face_areas[start:stop] = __face_geometry(
+            points, offsets[start : stop + 1], labels[offsets[start] : offsets[stop]]
+        )
+
+    # Estimated cell centres are averages of face centres
+    estimate = np.zeros((ncells, 3))
+    nfaces_cell = np.bincount(owner, minlength=ncells) + np.bincount(
+        neighbour, minlength=ncells
+    )
+    sum_mag_closed = np.zeros((ncells, 3))
+    for start, stop in __chunks(offsets, chunk_size):
+        n = max(min(stop, ninternal) - start, 0)
+        centres, magnitudes = face_centres[start:stop], np.abs(face_areas[start:stop])
+        __scatter(owner[start:stop], centres, estimate)
+        __scatter(neighbour[start : start + n], centres[:n], estimate)
+        __scatter(owner[start:stop], magnitudes, sum_mag_closed)
+        __scatter(neighbour[start : start + n], magnitudes[:n], sum_mag_closed)
+    estimate /= np.maximum(nfaces_cell, 1)[:, None]
+
+    # Pyramids from the estimated centres to faces
+    cell_centres = np.zeros((ncells, 3))
+    cell_volumes = np.zeros(ncells)
+    for start, stop in __chunks(offsets, chunk_size):
+        n = max(min(stop, ninternal) - start, 0)
+        centres, areas = face_centres[start:stop], face_areas[start:stop]
+        for cells, sign in ((owner[start:stop], 1), (neighbour[start : start + n], -1)):
+            m = len(cells)
+            volumes = sign * np.einsum(
+                "ij,ij->i", areas[:m], centres[:m] - estimate[cells]
+            )
+            pyramid_centres = 0.75 * centres[:m] + 0.25 * estimate[cells]
+            __scatter(cells, volumes[:, None] * pyramid_centres, cell_centres)
+            __scatter(cells, volumes, cell_volumes)
+    valid = np.abs(cell_volumes) > ROOT_VSMALL
+    cell_centres[valid] /= cell_volumes[valid, None]
+    cell_centres[~valid] = estimate[~valid]
+    cell_volumes /= 3
+
+    # Non-orthogonality and skewness of faces, maxima of cells
+    face_non_orthogonality = np.empty(ninternal)
+    face_skewness = np.empty(nfaces)
+    for start, stop in __chunks(offsets, chunk_size):
+        centres, areas = face_centres[start:stop], face_areas[start:stop]
+        magnitude = np.linalg.norm(areas, axis=1)
+        normals = areas / (magnitude[:, None] + ROOT_VSMALL)
+        cpf = centres - cell_centres[owner[start:stop]]
+
+        # Owner-to-neighbour vectors, projections on normals for boundary ones
+        d = normals * np.einsum("ij,ij->i", normals, cpf)[:, None]
+        n = max(min(stop, ninternal) - start, 0)
+        d[:n] = (
+            cell_centres[neighbour[start : start + n]]
+            - cell_centres[owner[start : start + n]]
+        )
+
+        cosine = np.einsum("ij,ij->i", d[:n], areas[:n]) / (
+            np.linalg.norm(d[:n], axis=1) * magnitude[:n] + ROOT_VSMALL
+        )
+        face_non_orthogonality[start : start + n] = np.degrees(
+            np.arccos(np.clip(cosine, -1, 1))
+        )
+
+        sv = (
+            cpf
+            - (
+                np.einsum("ij,ij->i", areas, cpf)
+                / (np.einsum("ij,ij->i", areas, d) + ROOT_VSMALL)
+            )[:, None]
+            * d
+        )
+        sv_magnitude = np.linalg.norm(sv, axis=1)
+        sv_hat = sv / (sv_magnitude[:, None] + ROOT_VSMALL)
+
+        # Normalised by the largest distance of face points along the vector,
+        # `mag(svHat & (p - fCtr))` of OpenFOAM's `faceSkewness`; `d` of
+        # boundary faces spans half of a mirrored cell, hence 0.4 of it
+        local = offsets[start : stop + 1] - offsets[start]
+        sizes = np.diff(local)
+        face = np.repeat(np.arange(stop - start), sizes)
+        along = np.einsum(
+            "ij,ij->i",
+            sv_hat[face],
+            points[labels[offsets[start] : offsets[stop]]] - centres[face],
+        )
+        factor = np.full(stop - start, 0.4)
+        factor[:n] = 0.2
+        fd = np.maximum(
+            factor * np.linalg.norm(d, axis=1) + ROOT_VSMALL,
+            np.maximum.reduceat(np.abs(along), local[:-1]),
+        )
+        face_skewness[start:stop] = sv_magnitude / fd
+
+    non_orthogonality = np.zeros(ncells)
+    np.maximum.at(non_orthogonality, owner[:ninternal], face_non_orthogonality)
+    np.maximum.at(non_orthogonality, neighbour, face_non_orthogonality)
+    skewness = np.zeros(ncells)
+    np.maximum.at(skewness, owner, face_skewness)
+    np.maximum.at(skewness, neighbour, face_skewness[:ninternal])
+
+    aspect_ratio = np.maximum(
+        sum_mag_closed.max(axis=1) / (sum_mag_closed.min(axis=1) + ROOT_VSMALL),
+        sum_mag_closed.sum(axis=1)
+        / 6
+        / np.maximum(np.abs(cell_volumes), ROOT_VSMALL) ** (2 / 3),
+    )
+
+    return MeshQuality(
+        face_centres=face_centres,
+        face_areas=face_areas,
+        cell_centres=cell_centres,
+        cell_volumes=cell_volumes,
+        face_non_orthogonality=face_non_orthogonality,
+        face_skewness=face_skewness,
+        non_orthogonality=non_orthogonality,
+        skewness=skewness,
+        aspect_ratio=aspect_ratio,
+    )
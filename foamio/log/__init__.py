@@ -0,0 +1,3 @@
+from foamio.log._log import LogReader, read_log
+
+__all__ = ["LogReader", "read_log"]
@@ -0,0 +1,152 @@
+import logging
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+#: Lines of time steps, the last group names the kind of line
+LINE_PATTERN = re.compile(
+    rb"^(?:Time = (?P<time>\S+?)s?[ \t\r]*$"
+    rb"|deltaT = (?P<deltaT>\S+)"
+    rb"|(?:(?P<name>\w+) )?Courant Number mean: (?P<mean>\S+) max: (?P<max>\S+)"
+    rb"|ExecutionTime = (?P<execution>\S+) s\s+ClockTime = (?P<clock>\S+) s"
+    rb"|.*?Solving for (?P<field>\w+), Initial residual = (?P<initial>[^,]+), "
+    rb"Final residual = (?P<final>[^,]+), No Iterations (?P<iterations>\d+))",
+    re.MULTILINE,
+)
+
+#: Number of bytes scanned at once
+BLOCK_SIZE = 1 << 22
+
+
+def _float(value: bytes) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+class LogReader:
+    """Streaming reader of OpenFOAM solver logs (e.g. `log.foamRun`), parsing
+    each line once into columns of a time step, e.g.
+    ```
+    reader = LogReader('case/log.foamRun')
+    df = reader.read()  # all time steps completed so far
+    ...
+    df = pd.concat([df, reader.read()])  # time steps completed since
+    ```
+    A time step is complete when its `ExecutionTime` is written, the byte
+    offset following it is kept in `offset`, so a new reader started from a
+    saved offset continues the log. Columns are indexed by `Time`:
+    - `<field>:initial`, `<field>:final`, `<field>:iterations` and
+    `<field>:solves`: the first initial residual, the last final residual, the
+    total number of linear solver iterations and solves of each field
+    - `Co:mean`, `Co:max` (`InterfaceCo:mean`, etc.): Courant numbers
+    - `deltaT`, `ExecutionTime`, `ClockTime`: time step and cumulative times
+    - `StepTime`: execution time of the step
+    """
+
+    def __init__(self, filepath: Path | str, *, offset: int = 0) -> None:
+        """
+        Args:
+            filepath (Path | str): path to the log.
+            offset (int, optional): byte offset to start from, e.g. `offset`
+            of a previous reader. Defaults to 0.
+        """
+
+        self.filepath = Path(filepath)
+        self.offset = offset
+
+        #: were the log truncated or rotated during the last call
+        self.rewound = False
+        #: number of bytes scanned during the last call
+        self.nbytes = 0
+        self.__inode = None
+        self.__execution_time = np.nan
+
+    def read(self) -> pd.DataFrame:
+        """Read time steps completed since the last call.
+
+        Returns:
+            pd.DataFrame: time steps, empty if none have been completed.
+        """
+
+        self.rewound = False
+        stat = os.stat(self.filepath)
+        if stat.st_size < self.offset or self.__inode not in (None, stat.st_ino):
+            logging.info("%s is truncated or rotated, reading over", self.filepath)
+            self.offset, self.rewound, self.__execution_time = 0, True, np.nan
+        self.__inode = stat.st_ino
+
+        columns: dict[str, list[float]] = {}
+        times: list[float] = []
+        # Courant numbers and time step are written before the time
+        time, values, start = None, {}, self.offset
+        with open(self.filepath, "rb") as f:
+            f.seek(start)
+            position, tail = start, b""
+            while block := f.read(BLOCK_SIZE):
+                # Complete lines only, the rest is being written or is scanned
+                # with the next block
+                block = tail + block
+                end = block.rfind(b"\n") + 1
+                block, tail = block[:end], block[end:]
+
+                for match in LINE_PATTERN.finditer(block):
+                    kind = match.lastgroup
+                    if kind == "iterations":
+                        field = match["field"].decode()
+                        values.setdefault(f"{field}:initial", _float(match["initial"]))
+                        values[f"{field}:final"] = _float(match["final"])
+                        for key, value in (
+                            ("iterations", int(match["iterations"])),
+                            ("solves", 1),
+                        ):
+                            key = f"{field}:{key}"
+                            values[key] = values.get(key, 0) + value
+                    elif kind == "max":
+                        name = (match["name"] or b"").decode() + "Co"
+                        values[f"{name}:mean"] = _float(match["mean"])
+                        values[f"{name}:max"] = _float(match["max"])
+                    elif kind == "time":
+                        time = _float(match["time"])
+                    elif kind == "deltaT":
+                        values["deltaT"] = _float(match["deltaT"])
+                    elif kind == "clock" and time is not None:
+                        execution_time = _float(match["execution"])
+                        values["ExecutionTime"] = execution_time
+                        values["ClockTime"] = _float(match["clock"])
+                        values["StepTime"] = execution_time - self.__execution_time
+                        self.__execution_time = execution_time
+
+                        for key in values.keys() - columns.keys():
+                            columns[key] = [np.nan] * len(times)
+                        for key, column in columns.items():
+                            column.append(values.get(key, np.nan))
+                        times.append(time)
+                        time, values = None, {}
+                        self.offset = position + block.index(b"\n", match.end()) + 1
+                position += len(block)
+
+        self.nbytes = position - start
+        return pd.DataFrame(
+            {key: np.array(column) for key, column in sorted(columns.items())},
+            index=pd.Index(np.array(times, dtype=float), name="Time"),
+        )
+
+
+def read_log(filepath: Path | str) -> pd.DataFrame:
+    """Read OpenFOAM solver log (e.g. `log.foamRun`) in a single streaming
+    pass, see `LogReader` for the columns.
+
+    Args:
+        filepath (Path | str): path to the log.
+
+    Returns:
+        pd.DataFrame: residuals, iterations, Courant numbers and times of
+        time steps indexed by `Time`.
+    """
+
+    return LogReader(filepath).read()
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def write_dat(tmp_path: Path):
+    """Write a .dat-file of tab-separated rows under the header columns."""
+
+    def write(
+        name: str, columns: list[str], rows: list[list], mode: str = "w"
+    ) -> Path:
+        fname = tmp_path / name
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(fname, mode, encoding="utf-8") as f:
+            if mode == "w":
+                f.write("# Forces\n#\n# " + "\t".join(columns) + "\n")
+            f.writelines("\t".join(map(str, row)) + "\n" for row in rows)
+        return fname
+
+    return write
+
+
+@pytest.fixture
+def write_mesh():
+    """Write a polyMesh of one unit hex cell, all faces on the `walls` patch."""
+
+    def write(case: Path, note: str = "nPoints:8 nCells:1 nFaces:6") -> Path:
+        mesh = case / "constant" / "polyMesh"
+        mesh.mkdir(parents=True)
+
+        def header(cls: str, name: str, note: str = "") -> str:
+            note = f'    note "{note}";\n' if note else ""
+            return (
+                f"FoamFile\n{{\n    format ascii;\n    class {cls};\n"
+                f"{note}    object {name};\n}}\n"
+            )
+
+        points = [(i & 1, i >> 1 & 1, i >> 2) for i in range(8)]
+        faces = [(0, 4, 6, 2), (1, 3, 7, 5), (0, 1, 5, 4), (2, 6, 7, 3), (0, 2, 3, 1)]
+        faces.append((4, 5, 7, 6))
+        (mesh / "points").write_text(
+            header("vectorField", "points")
+            + "8\n(\n"
+            + "".join(f"({x} {y} {z})\n" for x, y, z in points)
+            + ")\n"
+        )
+        (mesh / "faces").write_text(
+            header("faceList", "faces")
+            + "6\n(\n"
+            + "".join(f"4({' '.join(map(str, face))})\n" for face in faces)
+            + ")\n"
+        )
+        (mesh / "owner").write_text(
+            header("labelList", "owner", note) + "6(0 0 0 0 0 0)\n"
+        )
+        (mesh / "neighbour").write_text(header("labelList", "neighbour") + "0()\n")
+        (mesh / "boundary").write_text(
+            header("polyBoundaryMesh", "boundary")
+            + "1\n(\n    walls\n    {\n        type wall;\n"
+            "        nFaces 6;\n        startFace 0;\n    }\n)\n"
+        )
+        return mesh
+
+    return write
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from foamio._helpers import Interval
+from foamio.dat import DatReader, iter_chunks, read
+from foamio.dat._dat import _merge
+from foamio.dat._parser import LAYOUT_NROWS
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_vector_column_after_na(write_dat, cache):
+    n = LAYOUT_NROWS + 20
+    fname = write_dat(
+        "probes.dat",
+        ["Time", "p", "U"],
+        [[i, 1.5 * i, "N/A"] for i in range(n)] + [[n, 0, "(1 2 3)"]],
+    )
+
+    dat = read(fname, cache=cache)
+
+    assert list(dat.columns) == ["p", "U.0", "U.1", "U.2"]
+    assert dat.iloc[:n, 1:].isna().all(axis=None)
+    assert dat.iloc[-1, 1:].tolist() == [1, 2, 3]
+
+
+def test_reader_vector_column_after_na(write_dat):
+    n = LAYOUT_NROWS + 20
+    fname = write_dat("probes.dat", ["Time", "U"], [[i, "N/A"] for i in range(n)])
+    reader = DatReader(fname)
+    assert list(reader.read().columns) == ["U"]
+
+    write_dat("probes.dat", ["Time", "U"], [[n, "(1 2 3)"]], mode="a")
+    dat = reader.read()
+
+    assert reader.rewound
+    assert len(dat) == n + 1
+    assert list(dat.columns) == ["U.0", "U.1", "U.2"]
+    assert np.array_equal(dat.iloc[-1].to_numpy(), [1, 2, 3])
+
+
+@pytest.fixture
+def forces(write_dat):
+    """Restarted forces: times 0-9 written from 0, times 5-14 from 5."""
+
+    columns = ["Time", "total", "n"]
+    return [
+        write_dat(
+            f"forces/{start}/force.dat",
+            columns,
+            [[t, f"({t} {-t} 0.5)", t % 2] for t in range(start, start + 10)],
+        )
+        for start in (0, 5)
+    ]
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_unnests_vector_columns(forces, cache):
+    dat = read(forces[0], cache=cache)
+
+    assert list(dat.columns) == ["total.0", "total.1", "total.2", "n"]
+    assert dat.index.tolist() == list(range(10))
+    assert dat["total.1"].tolist() == [-t for t in range(10)]
+    assert (dat["total.2"] == 0.5).all()
+
+
+@pytest.mark.parametrize(
+    "kwargs, columns",
+    [
+        (dict(usecols=["total"]), ["total.0", "total.1", "total.2"]),
+        (dict(usecols=["total.1", 2]), ["total.1", "n"]),
+        (dict(regex=r"\.[02]$"), ["total.0", "total.2"]),
+    ],
+)
+def test_read_selects_columns(forces, kwargs, columns):
+    assert list(read(forces[0], **kwargs).columns) == columns
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_scalar_na(write_dat, cache):
+    fname = write_dat("p.dat", ["Time", "p"], [[0, 1], [1, "N/A"], [2, 3]])
+
+    p = read(fname, cache=cache)["p"].to_numpy()
+
+    assert np.array_equal(p, [1, np.nan, 3], equal_nan=True)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_restarts(forces, cache):
+    dat = read(forces[0].parent.parent, cache=cache)
+
+    assert dat.index.tolist() == list(range(15))
+    assert dat["total.0"].tolist() == list(range(15))
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_read_restarts_within_time(forces, cache):
+    dat = read(forces[0].parent.parent, cache=cache, time=Interval(3, 7))
+
+    assert dat.index.tolist() == [3, 4, 5, 6]
+
+
+def test_iter_chunks_match_read(forces):
+    chunks = list(iter_chunks(forces[0].parent.parent, chunksize=4))
+
+    assert max(len(chunk) for chunk in chunks) <= 4
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), read(forces[0].parent.parent), check_dtype=False
+    )
+
+
+def test_reader_appended_rows(write_dat):
+    columns = ["Time", "U"]
+    fname = write_dat("U.dat", columns, [[t, f"({t} 0 0)"] for t in range(3)])
+    reader = DatReader(fname)
+    assert reader.read().index.tolist() == [0, 1, 2]
+    assert reader.read().empty
+
+    # A partially written row is left for the next call
+    with open(fname, "a", encoding="utf-8") as f:
+        f.write("3\t(3 0 0)\n4\t(4 0")
+    assert reader.read().index.tolist() == [3]
+    with open(fname, "a", encoding="utf-8") as f:
+        f.write(" 0)\n")
+    dat = reader.read()
+
+    assert not reader.rewound
+    assert dat.index.tolist() == [4]
+    assert dat.iloc[0].tolist() == [4, 0, 0]
+
+
+def test_reader_restarts(forces):
+    root = forces[0].parent.parent
+    forces[1].unlink()
+    reader = DatReader(root)
+    dat = reader.read()
+    assert dat.index.tolist() == list(range(10))
+
+    # The restart overrides former rows from its first time on
+    columns = ["Time", "total", "n"]
+    forces[1].write_text(
+        "# Forces\n#\n# "
+        + "\t".join(columns)
+        + "\n"
+        + "".join(f"{t}\t({t} {-t} 0.5)\t{t % 2}\n" for t in range(5, 15))
+    )
+    new = reader.read()
+    dat = new if reader.rewound else _merge([dat, new])
+
+    pd.testing.assert_frame_equal(dat, read(root))
+
+
+def test_reader_truncated(write_dat):
+    columns = ["Time", "p"]
+    fname = write_dat("p.dat", columns, [[t, t] for t in range(10)])
+    reader = DatReader(fname)
+    assert len(reader.read()) == 10
+
+    write_dat("p.dat", columns, [[t, -t] for t in range(3)])
+    dat = reader.read()
+
+    assert reader.rewound
+    assert dat["p"].tolist() == [0, -1, -2]
@@ -0,0 +1,90 @@
+import pytest
+
+from foamio.foam import set_many
+
+CONTROL_DICT = """\
+FoamFile
+{
+    format      ascii;
+    object      controlDict;
+}
+// * * * //
+
+application     simpleFoam;
+endTime         100; // end
+
+functions
+{
+    probes
+    {
+        type            probes;
+        fields          (p);
+    }
+    inline { a 1; }
+}
+"""
+
+
+@pytest.fixture
+def control_dict(tmp_path):
+    (tmp_path / "system").mkdir()
+    fname = tmp_path / "system" / "controlDict"
+    fname.write_text(CONTROL_DICT)
+    return fname
+
+
+def test_set_many_replaces_values(tmp_path, control_dict):
+    set_many(
+        tmp_path,
+        "system/controlDict",
+        {"endTime": 0.5, "functions": {"probes": {"fields": ["p", "U"]}}},
+    )
+
+    assert control_dict.read_text() == CONTROL_DICT.replace(
+        "100; // end", "0.5; // end"
+    ).replace("(p);", "(p U);")
+
+
+def test_set_many_appends_missing_entries(tmp_path, control_dict):
+    set_many(
+        tmp_path,
+        "system/controlDict",
+        {
+            "writeControl": "timeStep",
+            "functions/probes/writeControl": "timeStep",
+            "functions/forces/type": "forces",
+            "functions/forces/patches": ["wall"],
+            "functions/inline/b": True,
+        },
+    )
+
+    text = control_dict.read_text()
+    assert text.endswith("}\nwriteControl    timeStep;\n")
+    assert (
+        "        fields          (p);\n"
+        "        writeControl    timeStep;\n"
+        "    }\n"
+        "    inline { a 1; \n    b               true;\n    }\n"
+        "    forces\n"
+        "    {\n"
+        "        type            forces;\n"
+        "        patches         (wall);\n"
+        "    }\n"
+        "}\n"
+    ) in text
+
+
+def test_set_many_replaces_dictionary(tmp_path, control_dict):
+    set_many(tmp_path, "system/controlDict", {"functions/probes": "off"})
+
+    assert "    probes          off;\n    inline" in control_dict.read_text()
+
+
+@pytest.mark.parametrize(
+    "entries", [{"endTime/value": 1}, {"functions/probes": 1, "functions/probes/a": 2}]
+)
+def test_set_many_raises_and_keeps_file(tmp_path, control_dict, entries):
+    with pytest.raises(ValueError):
+        set_many(tmp_path, "system/controlDict", entries)
+
+    assert control_dict.read_text() == CONTROL_DICT
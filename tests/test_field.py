@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from foamio.foam import read_field, write_field
+
+
+@pytest.mark.parametrize("compression", [False, True])
+@pytest.mark.parametrize("format", ["ascii", "binary"])
+@pytest.mark.parametrize("shape", [(5,), (5, 3), (5, 6)])
+def test_field_round_trip(tmp_path, format, compression, shape):
+    rng = np.random.default_rng(0)
+    internal = rng.normal(size=shape)
+    inlet = rng.normal(size=(2, *shape[1:]))
+
+    path = write_field(
+        tmp_path / "0" / "U",
+        internal,
+        {
+            "inlet": {"type": "fixedValue", "value": inlet},
+            "outlet": {"type": "zeroGradient"},
+        },
+        dimensions=(0, 1, -1, 0, 0, 0, 0),
+        format=format,
+        compression=compression,
+        fmt="%.17g",
+    )
+    field = read_field(tmp_path / "0" / "U")
+
+    assert path.name == ("U.gz" if compression else "U")
+    assert field.header["format"] == format
+    assert np.array_equal(field.dimensions, [0, 1, -1, 0, 0, 0, 0])
+    assert np.array_equal(field.internal, internal)
+    assert np.array_equal(field.boundary["inlet"]["value"], inlet)
+    assert field.boundary["outlet"] == {"type": "zeroGradient"}
+
+
+@pytest.mark.parametrize("internal", [1.5, (1.0, 0.0, -2.0)])
+def test_field_uniform(tmp_path, internal):
+    write_field(tmp_path / "0" / "U", internal, {"walls": {"type": "zeroGradient"}})
+    field = read_field(tmp_path / "0" / "U")
+
+    assert np.array_equal(field.internal, internal)
+    assert field.header["class"] == (
+        "volScalarField" if np.ndim(internal) == 0 else "volVectorField"
+    )
+
+
+@pytest.mark.parametrize("format", ["ascii", "binary"])
+def test_label_field_round_trip(tmp_path, format):
+    labels = np.array([0, 3, 1, 2])
+    write_field(
+        tmp_path / "0" / "cellDist",
+        labels,
+        field_class="volLabelField",
+        format=format,
+    )
+    field = read_field(tmp_path / "0" / "cellDist")
+
+    assert np.issubdtype(field.internal.dtype, np.integer)
+    assert np.array_equal(field.internal, labels)
+
+
+def test_integer_values_of_scalar_field(tmp_path):
+    write_field(tmp_path / "0" / "T", np.arange(4), format="ascii")
+    field = read_field(tmp_path / "0" / "T")
+
+    assert field.header["class"] == "volScalarField"
+    assert field.internal.dtype == np.float64
+    assert np.array_equal(field.internal, np.arange(4))
@@ -0,0 +1,39 @@
+import numpy as np
+
+from foamio._helpers import Interval
+from foamio.dat import _index, read
+from foamio.dat._index import _time_index
+from foamio.dat._parser import _layout
+
+
+def test_time_index_persisted_on_opt_in(write_dat, monkeypatch):
+    monkeypatch.setattr(_index, "INDEX_STRIDE", 64)
+    fname = write_dat("forces.dat", ["Time", "Fx"], [[i, i] for i in range(100)])
+
+    dat = read(fname, time=Interval(10, 20))
+    assert not list(fname.parent.rglob("time.npz"))
+    assert dat.index.tolist() == list(range(10, 20))
+
+    dat = read(fname, time=Interval(10, 20), time_index=True)
+    (saved,) = fname.parent.rglob("time.npz")
+    assert dat.index.tolist() == list(range(10, 20))
+
+    # A following process extends the persisted index
+    _index._INDICES.clear()
+    write_dat("forces.dat", ["Time", "Fx"], [[i, i] for i in range(100, 200)], "a")
+    times, offsets = _time_index(fname, _layout(fname), saved.parent)
+    with np.load(saved) as index:
+        assert np.array_equal(index["times"], times)
+    assert times[-1] > 100
+    assert read(fname, time=Interval(150, 160), time_index=True).index[0] == 150
+
+
+def test_time_index_memo_is_bounded(write_dat, monkeypatch):
+    monkeypatch.setattr(_index, "INDICES_MAXSIZE", 2)
+    _index._INDICES.clear()
+    for i in range(3):
+        fname = write_dat(f"{i}/forces.dat", ["Time", "Fx"], [[0, 0], [1, 1]])
+        _time_index(fname, _layout(fname))
+
+    assert len(_index._INDICES) == 2
+    assert fname.resolve() in _index._INDICES
@@ -0,0 +1,32 @@
+import gzip
+
+import pytest
+
+from foamio.foam import read_mesh
+
+
+def test_n_cells_from_owner_note(tmp_path, write_mesh):
+    mesh_dir = write_mesh(tmp_path, note="nPoints:8 nCells:42 nFaces:6")
+
+    mesh = read_mesh(tmp_path, lazy=True)
+    assert mesh.n_cells == 42
+    assert "owner" not in mesh.__dict__  # the list is not read
+
+    (mesh_dir / "owner").write_bytes(gzip.compress((mesh_dir / "owner").read_bytes()))
+    (mesh_dir / "owner").rename(mesh_dir / "owner.gz")
+    assert read_mesh(tmp_path, lazy=True).n_cells == 42
+
+
+def test_n_cells_without_note(tmp_path, write_mesh):
+    write_mesh(tmp_path, note="")
+
+    assert read_mesh(tmp_path, lazy=True).n_cells == 1
+
+
+@pytest.mark.parametrize("nprocessors", [1, 3])
+def test_n_cells_of_processors(tmp_path, write_mesh, nprocessors):
+    for i in range(nprocessors):
+        write_mesh(tmp_path / f"processor{i}")
+
+    meshes = read_mesh(tmp_path, decomposed=True, lazy=True)
+    assert sum(mesh.n_cells for mesh in meshes) == nprocessors